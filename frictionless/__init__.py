@@ -8,6 +8,7 @@ from .exception import FrictionlessException
 from .field import Field
 from .file import File
 from .header import Header
+from .index import KeyIndex, LookupCache, InferCache
 from .inquiry import Inquiry, InquiryTask
 from .layout import Layout
 from .loader import Loader
@@ -19,7 +20,7 @@ from .pipeline import Pipeline, PipelineTask
 from .program import program
 from .report import Report, ReportTask
 from .resource import Resource
-from .row import Row
+from .row import Row, CompactRow
 from .schema import Schema
 from .settings import VERSION as __version__
 from .server import Server
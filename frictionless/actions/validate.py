@@ -188,6 +188,8 @@ def validate_resource(
     skip_errors=None,
     limit_errors=settings.DEFAULT_LIMIT_ERRORS,
     limit_memory=settings.DEFAULT_LIMIT_MEMORY,
+    engine="row",
+    workers=None,
     deprecate=True,
     # We ignore this line because of a problem with `make docs`:
     # https://github.com/frictionlessdata/frictionless-py/issues/1031
@@ -209,6 +211,8 @@ def validate_resource(
         limit_errors? (int): limit errors
         limit_memory? (int): limit memory
         original? (bool): validate metadata as it is (without inferring)
+        engine? (row|columnar): validation engine (see `resource.validate`)
+        workers? (int): number of validation processes (see `resource.validate`)
         **options? (dict): Resource constructor options
 
     Returns:
@@ -233,6 +237,19 @@ def validate_resource(
     except FrictionlessException as exception:
         errors.append(exception.error)
 
+    # Validate using the resource engines
+    if not errors and (engine != "row" or workers):
+        return resource.validate(
+            checks=checks,
+            original=original,
+            pick_errors=pick_errors,
+            skip_errors=skip_errors,
+            limit_errors=limit_errors,
+            limit_memory=limit_memory,
+            engine=engine,
+            workers=workers,
+        )
+
     # Open resource
     if not errors:
         try:
@@ -1,6 +1,7 @@
 import hashlib
 from ... import errors
 from ...check import Check
+from ...index import BloomFilter, KeyIndex
 
 
 class duplicate_row(Check):
@@ -14,27 +15,80 @@ class duplicate_row(Check):
     This check can be enabled using the `checks` parameter
     for the `validate` function.
 
+    In the "bounded" memory mode, row digests are stored in a key index
+    spilling them into a temporary on-disk database (see `index_threshold`
+    of the resource). A Bloom filter is used to skip the on-disk lookups
+    for the rows that are definitely seen for the first time.
+
+    Parameters:
+       descriptor (dict): check's descriptor
+       memory? (str): one of "unbounded" or "bounded" (default: "unbounded")
+       capacity? (int): expected number of rows for the "bounded" mode
+       error_rate? (float): Bloom filter false positive rate (default: 0.01)
+
     """
 
     code = "duplicate-row"
     Errors = [errors.DuplicateRowError]
 
-    def __init__(self, descriptor=None):
+    def __init__(self, descriptor=None, *, memory=None, capacity=None, error_rate=None):
+        self.setinitial("memory", memory)
+        self.setinitial("capacity", capacity)
+        self.setinitial("errorRate", error_rate)
         super().__init__(descriptor)
         self.__memory = {}
+        self.__bounded = self.get("memory") == "bounded"
+        self.__capacity = self.get("capacity", DEFAULT_CAPACITY)
+        self.__error_rate = self.get("errorRate", DEFAULT_ERROR_RATE)
+        self.__filter = None
+
+    # Validate
+
+    def validate_start(self):
+        if self.__bounded:
+            capacity = self.resource.stats.get("rows") or self.__capacity
+            threshold = self.resource.index_threshold or DEFAULT_THRESHOLD
+            self.__filter = BloomFilter(capacity, error_rate=self.__error_rate)
+            self.__memory = KeyIndex(threshold=threshold)
+        yield from []
 
     def validate_row(self, row):
-        text = ",".join(map(str, row.values()))
-        hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        match = self.__memory.get(hash)
+        digest = create_digest(row)
+        if self.__bounded:
+            lookup = self.__filter.add(digest)
+            match = self.__memory.add_digest(digest, row.row_position, lookup=lookup)
+        else:
+            match = self.__memory.get(digest)
+            self.__memory[digest] = row.row_position
         if match:
             note = 'the same as row at position "%s"' % match
             yield errors.DuplicateRowError.from_row(row, note=note)
-        self.__memory[hash] = row.row_position
+
+    def validate_end(self):
+        if self.__bounded:
+            self.__memory.close()
+        yield from []
 
     # Metadata
 
     metadata_profile = {  # type: ignore
         "type": "object",
-        "properties": {},
+        "properties": {
+            "memory": {"type": "string", "enum": ["unbounded", "bounded"]},
+            "capacity": {"type": "integer", "minimum": 1},
+            "errorRate": {"type": "number", "exclusiveMinimum": 0, "exclusiveMaximum": 1},
+        },
     }
+
+
+# Internal
+
+
+DEFAULT_CAPACITY = 1000000
+DEFAULT_THRESHOLD = 100000
+DEFAULT_ERROR_RATE = 0.01
+
+
+def create_digest(row):
+    text = ",".join(map(str, row.values()))
+    return hashlib.sha256(text.encode("utf-8")).digest()
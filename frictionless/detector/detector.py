@@ -1,5 +1,7 @@
 import codecs
 import chardet
+import operator
+from itertools import accumulate, compress, count, repeat
 from copy import copy, deepcopy
 from typing import List, Dict
 from ..exception import FrictionlessException
@@ -448,11 +450,12 @@ class Detector:
 
         # Create schema
         if not schema or not schema.fields:
-            schema = Schema()
 
             # Missing values
+            missing_values = None
             if self.__field_missing_values != settings.DEFAULT_MISSING_VALUES:
-                schema.missing_values = self.__field_missing_values
+                missing_values = self.__field_missing_values
+            schema = Schema(missing_values=missing_values)
 
             # Prepare names
             names = copy(self.__field_names or labels or [])
@@ -482,8 +485,7 @@ class Detector:
                 return schema
 
             # Prepare runners
-            runners = []
-            runner_fields = []  # we use shared fields
+            runners = []  # we use shared fields
             for candidate in system.create_candidates():
                 field = Field(candidate)
                 if field.type == "number" and self.__field_float_numbers:
@@ -493,38 +495,50 @@ class Detector:
                         field.true_values = self.__field_true_values
                     if self.__field_false_values != settings.DEFAULT_FALSE_VALUES:
                         field.false_values = self.__field_false_values
-                runner_fields.append(field)
-            for index, name in enumerate(names):
-                runners.append([])
-                for field in runner_fields:
-                    runners[index].append({"field": field, "score": 0})
+                runners.append({"field": field, "results": {}})
 
             # Infer fields
+            # Every column is inferred candidate by candidate reading cells by batches.
+            # A candidate converts only distinct values it hasn't converted before,
+            # stops when its score drops below the threshold and is only checked
+            # for the rows before the position where a previous candidate is selected
             fields = [None] * len(names)
-            max_score = [len(fragment)] * len(names)
+            batch_size = settings.DEFAULT_BATCH_SIZE
             threshold = len(fragment) * (self.__field_confidence - 1)
-            for cells in fragment:
-                for index, name in enumerate(names):
-                    if fields[index] is not None:
-                        continue
-                    source = cells[index] if len(cells) > index else None
-                    is_field_missing_value = source in self.__field_missing_values
-                    if is_field_missing_value:
-                        max_score[index] -= 1
-                    for runner in runners[index]:
-                        if runner["score"] < threshold:
-                            continue
-                        if not is_field_missing_value:
-                            target, notes = runner["field"].read_cell(source)
-                            runner["score"] += 1 if not notes else -1
-                        if max_score[index] > 0 and runner["score"] >= (
-                            max_score[index] * self.__field_confidence
-                        ):
-                            field = runner["field"].to_copy()
-                            field.name = name
-                            field.schema = schema
-                            fields[index] = field
+            for index, name in enumerate(names):
+                column = [
+                    cells[index] if len(cells) > index else None for cells in fragment
+                ]
+                missing = [source in self.__field_missing_values for source in column]
+                max_scores = [len(fragment) - number for number in accumulate(missing)]
+                min_scores = [score * self.__field_confidence for score in max_scores]
+                stop = find_position(map(operator.le, max_scores, repeat(0)), len(column))
+                for runner in runners:
+                    score = 0
+                    for start in range(0, stop, batch_size):
+                        if score < threshold:
                             break
+                        end = min(start + batch_size, stop)
+                        deltas = read_deltas(
+                            runner, column[start:end], missing[start:end]
+                        )
+                        scores = list(accumulate([score] + deltas))[1:]
+                        drop = find_position(map(operator.lt, scores, repeat(threshold)))
+                        if drop is not None:
+                            del scores[drop + 1 :]
+                        position = find_position(
+                            map(operator.ge, scores, min_scores[start:end])
+                        )
+                        if position is not None:
+                            stop = start + position
+                            fields[index] = runner["field"]
+                            break
+                        score = scores[-1]
+                if fields[index] is not None:
+                    field = fields[index].to_copy()
+                    field.name = name
+                    field.schema = schema
+                    fields[index] = field
 
             # Fill/set fields
             # For not inferred fields we use the "any" type field as a default
@@ -533,22 +547,25 @@ class Detector:
                     fields[index] = Field(name=name, type="any", schema=schema)
             schema.fields = fields
 
-        # Sync schema
-        if self.__schema_sync:
-            if labels:
-                fields = []
-                mapping = {field.get("name"): field for field in schema.fields}
-                for name in labels:
-                    fields.append(mapping.get(name, {"name": name, "type": "any"}))
-                schema.fields = fields
-
-        # Patch schema
-        if self.__schema_patch:
-            schema_patch = deepcopy(self.__schema_patch)
-            fields = schema_patch.pop("fields", {})
-            schema.update(schema_patch)
-            for field in schema.fields:
-                field.update((fields.get(field.get("name"), {})))
+        # Process schema changes once
+        with schema.batch_update():
+
+            # Sync schema
+            if self.__schema_sync:
+                if labels:
+                    fields = []
+                    mapping = {field.get("name"): field for field in schema.fields}
+                    for name in labels:
+                        fields.append(mapping.get(name, {"name": name, "type": "any"}))
+                    schema.fields = fields
+
+            # Patch schema
+            if self.__schema_patch:
+                schema_patch = deepcopy(self.__schema_patch)
+                fields = schema_patch.pop("fields", {})
+                schema.update(schema_patch)
+                for field in schema.fields:
+                    field.update((fields.get(field.get("name"), {})))
 
         # Validate schema
         # NOTE: at some point we might need to remove it for transform needs
@@ -560,3 +577,50 @@ class Detector:
             raise FrictionlessException(errors.SchemaError(note=note))
 
         return schema
+
+
+# Internal
+
+
+def read_deltas(runner, cells, missing):
+    """Read score changes for the cells using the runner's field
+
+    Distinct strings are converted only once for all the batches.
+    """
+    field = runner["field"]
+    results = runner["results"]
+
+    # Not missing strings
+    if not any(missing) and set(map(type, cells)) <= {str}:
+        sources = [cell for cell in dict.fromkeys(cells) if cell not in results]
+        notes = field.read_cells(sources)[1]
+        for offset, cell in enumerate(sources):
+            results[cell] = -1 if offset in notes else 1
+        return list(map(results.__getitem__, cells))
+
+    # Any cells
+    strings = {}
+    others = []
+    for position, cell in enumerate(cells):
+        if missing[position]:
+            continue
+        if type(cell) is str:
+            if cell not in results:
+                strings[cell] = None
+        else:
+            others.append(position)
+    sources = list(strings) + [cells[position] for position in others]
+    notes = field.read_cells(sources)[1]
+    for offset, cell in enumerate(strings):
+        results[cell] = -1 if offset in notes else 1
+    deltas = [0] * len(cells)
+    for offset, position in enumerate(others, start=len(strings)):
+        deltas[position] = -1 if offset in notes else 1
+    for position, cell in enumerate(cells):
+        if not missing[position] and type(cell) is str:
+            deltas[position] = results[cell]
+    return deltas
+
+
+def find_position(flags, default=None):
+    return next(compress(count(), flags), default)
@@ -361,6 +361,102 @@ class Field(Metadata):
                 cell[index] = item
         return cell, notes
 
+    def create_cell_reader(self):
+        """Create cell reader
+
+        It returns a function with the same signature and results as `field.read_cell`
+        but with all the field properties resolved in advance. It's meant to be
+        created once and then called for every cell of a data stream.
+
+        Returns:
+            func: cell reader
+
+        """
+
+        # Array items are checked in-place so we use the generic reader
+        if self.array_item_field:
+            return self.read_cell
+
+        # Prepare context
+        missing_values = self.missing_values
+        if not all(isinstance(value, str) for value in missing_values):
+            return self.read_cell
+        missing_values_set = frozenset(missing_values)
+        read_value = self.__type.read_cell
+        type_note = f'type is "{self.type}/{self.format}"'
+        checks = []
+        for name, check in self.read_cell_checks.items():
+            note = f'constraint "{name}" is "{self.constraints[name]}"'
+            checks.append((name, check, note))
+
+        # Create reader
+        def read_cell(cell):
+            if type(cell) is str:
+                if cell in missing_values_set:
+                    cell = None
+            elif cell is not None and cell in missing_values:
+                cell = None
+            if cell is not None:
+                cell = read_value(cell)
+                if cell is None:
+                    return cell, OrderedDict(type=type_note)
+            notes = None
+            for name, check, note in checks:
+                if not check(cell):
+                    notes = notes or OrderedDict()
+                    notes[name] = note
+            return cell, notes
+
+        return read_cell
+
+    def read_cells(self, cells):
+        """Read a column of cells
+
+        It's a column-wise version of `field.read_cell` returning the same results.
+
+        Parameters:
+            cells (any[]): cells
+
+        Returns:
+            (any[], dict): processed cells and dict of notes by cell index
+
+        """
+        notes = {}
+
+        # Array items are checked in-place so we read cell by cell
+        if self.array_item_field:
+            result = []
+            for index, cell in enumerate(cells):
+                cell, cell_notes = self.read_cell(cell)
+                if cell_notes:
+                    notes[index] = cell_notes
+                result.append(cell)
+            return result, notes
+
+        # Convert
+        missing_values = self.missing_values
+        sources = []
+        for cell in cells:
+            if cell in missing_values:
+                cell = None
+            sources.append(cell)
+        result = self.__type.read_cells(sources)
+        for index, cell in enumerate(result):
+            if cell is None and sources[index] is not None:
+                notes[index] = OrderedDict(type=f'type is "{self.type}/{self.format}"')
+
+        # Check
+        type_errors = set(notes)
+        for name, check in self.read_cell_checks.items():
+            for index, cell in enumerate(result):
+                if index not in type_errors:
+                    if not check(cell):
+                        constraint = self.constraints[name]
+                        notes.setdefault(index, OrderedDict())
+                        notes[index][name] = f'constraint "{name}" is "{constraint}"'
+
+        return result, notes
+
     def read_cell_convert(self, cell):
         """Read cell (convert only)
 
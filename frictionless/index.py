@@ -0,0 +1,477 @@
+import os
+import json
+import math
+import pickle
+import sqlite3
+import hashlib
+import weakref
+import datetime
+import tempfile
+from decimal import Decimal
+from contextlib import closing
+from .system import system
+from . import settings
+
+
+class KeyIndex:
+    """Key index representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import KeyIndex`
+
+    The index is used for unique and primary key checks. It doesn't store
+    the keys themselves but their fixed-width digests mapped to the row positions.
+    If a threshold is set, the in-memory part of the index is spilled into
+    a temporary on-disk database every time it reaches the threshold
+    so a validation can finish for any size of input. It's disabled by default
+    as every miss of the in-memory part becomes an on-disk lookup.
+
+    Parameters:
+        threshold? (int): number of keys kept in memory before spilling to disk
+
+    """
+
+    def __init__(self, *, threshold=None):
+        self.__threshold = threshold
+        self.__memory = {}
+        self.__database = None
+        self.__finalizer = None
+
+    def __len__(self):
+        length = len(self.__memory)
+        if self.__database:
+            query = "SELECT COUNT(*) FROM keys"
+            length += self.__database.execute(query).fetchone()[0]
+        return length
+
+    @property
+    def threshold(self):
+        """
+        Returns:
+            int?: number of keys kept in memory before spilling to disk
+        """
+        return self.__threshold
+
+    @property
+    def spilled(self):
+        """
+        Returns:
+            bool: whether the index uses an on-disk database
+        """
+        return self.__database is not None
+
+    # Add
+
+    def add(self, key, position):
+        """Add a key to the index
+
+        Parameters:
+            key (any|any[]): a cell value or a tuple of cell values
+            position (int): a row position
+
+        Returns:
+            int?: position of the previous row with the same key
+        """
+        return self.add_digest(create_digest(key), position)
+
+    def add_digest(self, digest, position, *, lookup=True):
+        """Add a key digest to the index
+
+        Parameters:
+            digest (bytes): a key digest created by `create_digest`
+            position (int): a row position
+            lookup? (bool): whether to look up the on-disk database
+                (it can be skipped if the digest is known to be new)
+
+        Returns:
+            int?: position of the previous row with the same key digest
+        """
+        match = self.__memory.get(digest)
+        if match is None and self.__database and lookup:
+            query = "SELECT position FROM keys WHERE digest = ?"
+            item = self.__database.execute(query, (digest,)).fetchone()
+            match = item[0] if item else None
+        self.__memory[digest] = position
+        if self.__threshold and len(self.__memory) >= self.__threshold:
+            self.__spill()
+        return match
+
+    # Close
+
+    def close(self):
+        """Close the index removing the on-disk database if any"""
+        self.__memory = {}
+        self.__database = None
+        if self.__finalizer:
+            self.__finalizer()
+            self.__finalizer = None
+
+    # Helpers
+
+    def __spill(self):
+        if not self.__database:
+            descriptor, path = tempfile.mkstemp(suffix=".sqlite")
+            os.close(descriptor)
+            database = sqlite3.connect(path)
+            database.execute("PRAGMA journal_mode = OFF")
+            database.execute("PRAGMA synchronous = OFF")
+            database.execute(
+                "CREATE TABLE keys (digest BLOB PRIMARY KEY, position INTEGER) "
+                "WITHOUT ROWID"
+            )
+            self.__database = database
+            self.__finalizer = weakref.finalize(self, remove_database, database, path)
+        query = "INSERT OR REPLACE INTO keys (digest, position) VALUES (?, ?)"
+        self.__database.executemany(query, self.__memory.items())
+        self.__database.commit()
+        self.__memory = {}
+
+
+class BloomFilter:
+    """Bloom filter representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless.index import BloomFilter`
+
+    A probabilistic set of digests having a fixed memory footprint.
+    It never gives false negatives while false positives happen
+    with the given rate until the filter's capacity is exceeded.
+
+    Parameters:
+        capacity (int): expected number of items
+        error_rate? (float): target false positive rate
+
+    """
+
+    def __init__(self, capacity, *, error_rate=0.01):
+        capacity = max(capacity, 1)
+        size = -capacity * math.log(error_rate) / math.log(2) ** 2
+        self.__size = max(int(math.ceil(size)), 8)
+        self.__count = max(int(round(self.__size / capacity * math.log(2))), 1)
+        self.__bits = bytearray(-(-self.__size // 8))
+
+    @property
+    def size(self):
+        """
+        Returns:
+            int: number of bits
+        """
+        return self.__size
+
+    # Add
+
+    def add(self, digest):
+        """Add a digest to the filter
+
+        Parameters:
+            digest (bytes): a digest having at least 16 bytes
+
+        Returns:
+            bool: whether the digest was probably added before
+        """
+        found = True
+        bits = self.__bits
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:16], "little") | 1
+        for number in range(self.__count):
+            position = (first + number * second) % self.__size
+            index, mask = position >> 3, 1 << (position & 7)
+            if not bits[index] & mask:
+                bits[index] |= mask
+                found = False
+        return found
+
+
+class LookupCache:
+    """Foreign key lookup cache representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import LookupCache`
+
+    The cache stores sets of key values of the resources referenced by foreign
+    keys so every referenced resource is read only once for a set of key fields.
+    Lookups are keyed by a resource name, key fields and a source fingerprint
+    (local file modification time and size, inline data or declared hash).
+    If a path is provided, the lookups are persisted to this file
+    to be reused by next validations. Only use trusted cache files.
+
+    Parameters:
+        path? (str): path to a file persisting the cache between runs
+
+    """
+
+    def __init__(self, *, path=None):
+        self.__path = path
+        self.__memory = {}
+        self.__lookups = {}
+        self.__changed = False
+        if path and os.path.isfile(path):
+            with open(path, "rb") as file:
+                self.__lookups = pickle.load(file)
+
+    @property
+    def path(self):
+        """
+        Returns:
+            str?: path to a file persisting the cache
+        """
+        return self.__path
+
+    # Read
+
+    def read(self, resource, key):
+        """Read lookup values of the resource
+
+        Parameters:
+            resource (Resource): referenced resource
+            key (str[]): referenced key fields
+
+        Returns:
+            set: a set of key cell tuples
+        """
+        key = tuple(key)
+
+        # Memory
+        # Resources are not hashable so they are keyed by id but an id can be
+        # reused after a resource is collected hence checking a weak reference
+        item = self.__memory.get((id(resource), key))
+        if item is not None and item[0]() is resource:
+            return item[1]
+
+        # Lookups
+        fingerprint = create_fingerprint(resource)
+        name = (resource.name, key, fingerprint)
+        lookup = self.__lookups.get(name)
+        if lookup is None:
+            lookup = read_lookup(resource, key)
+            if fingerprint is not None:
+                for item in list(self.__lookups):
+                    if item[:2] == name[:2]:
+                        del self.__lookups[item]
+                self.__lookups[name] = lookup
+                self.__changed = True
+        self.__memory[(id(resource), key)] = (weakref.ref(resource), lookup)
+        return lookup
+
+    # Save
+
+    def save(self):
+        """Save the cache to its path if there are changes"""
+        if self.__path and self.__changed:
+            with tempfile.NamedTemporaryFile(
+                "wb", delete=False, dir=os.path.dirname(os.path.abspath(self.__path))
+            ) as file:
+                pickle.dump(self.__lookups, file)
+            os.replace(file.name, self.__path)
+            self.__changed = False
+
+
+class InferCache:
+    """Inference cache representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import InferCache`
+
+    The cache stores metadata inferred by `resource.infer` (e.g. dialect,
+    encoding, layout, and schema) so describing an unchanged source doesn't
+    read its data again. Entries are keyed by the resource descriptor,
+    detector options, and a source fingerprint provided by the loader
+    (local file size, modification time, and first buffer hash or remote ETag).
+    If a path is provided, the entries are persisted to this sqlite file
+    to be reused by next runs.
+
+    Parameters:
+        path? (str): path to a sqlite file persisting the cache between runs
+
+    """
+
+    def __init__(self, *, path=None):
+        self.__path = path
+        self.__memory = {}
+        if path:
+            with closing(sqlite3.connect(path)) as database:
+                database.execute(
+                    "CREATE TABLE IF NOT EXISTS entries "
+                    "(key TEXT PRIMARY KEY, source TEXT, descriptor TEXT)"
+                )
+                database.commit()
+
+    @property
+    def path(self):
+        """
+        Returns:
+            str?: path to a sqlite file persisting the cache
+        """
+        return self.__path
+
+    # Read
+
+    def create_key(self, resource):
+        """Create a cache key for the resource
+
+        Parameters:
+            resource (Resource): resource to infer
+
+        Returns:
+            str[]?: cache key or None if the resource can't be cached
+        """
+        if resource.memory or resource.multipart:
+            return None
+        if resource.detector.encoding_function:
+            return None
+        fingerprint = system.create_loader(resource).read_fingerprint()
+        if fingerprint is None:
+            return None
+        detector = {name: getattr(resource.detector, name) for name in DETECTOR_OPTIONS}
+        descriptor = {
+            "version": settings.VERSION,
+            "fingerprint": fingerprint,
+            "resource": resource.to_dict(),
+            "detector": detector,
+        }
+        try:
+            text = json.dumps(descriptor, sort_keys=True)
+        except TypeError:
+            return None
+        return [resource.fullpath, hashlib.md5(text.encode("utf-8")).hexdigest()]
+
+    def read(self, key):
+        """Read inferred metadata
+
+        Parameters:
+            key (str[]): cache key created by `create_key`
+
+        Returns:
+            dict?: inferred resource descriptor
+        """
+        source, digest = key
+        text = None
+        if self.__memory.get(source, [None])[0] == digest:
+            text = self.__memory[source][1]
+        elif self.__path:
+            with closing(sqlite3.connect(self.__path)) as database:
+                query = "SELECT descriptor FROM entries WHERE key = ?"
+                item = database.execute(query, (digest,)).fetchone()
+                text = item[0] if item else None
+        return json.loads(text) if text is not None else None
+
+    # Write
+
+    def write(self, key, descriptor):
+        """Write inferred metadata
+
+        A previous entry of the same source is replaced.
+
+        Parameters:
+            key (str[]): cache key created by `create_key`
+            descriptor (dict): inferred resource descriptor
+        """
+        source, digest = key
+        try:
+            text = json.dumps(descriptor)
+        except TypeError:
+            return
+        self.__memory[source] = [digest, text]
+        if self.__path:
+            with closing(sqlite3.connect(self.__path)) as database:
+                query = "DELETE FROM entries WHERE source = ? AND key != ?"
+                database.execute(query, (source, digest))
+                query = "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)"
+                database.execute(query, (digest, source, text))
+                database.commit()
+
+
+# Internal
+
+
+def create_digest(key):
+    if isinstance(key, tuple):
+        key = tuple(map(normalize_value, key))
+    else:
+        key = normalize_value(key)
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).digest()
+
+
+def normalize_value(value):
+    # Values equal in Python have to produce the same digest (e.g. 1, 1.0 and True)
+    # so finite numbers are converted to exact decimals and integral ones to ints
+    if isinstance(value, float) and math.isfinite(value):
+        value = Decimal(value)
+    if isinstance(value, (bool, int)):
+        return int(value)
+    elif isinstance(value, Decimal):
+        if value.is_finite():
+            if value == value.to_integral_value():
+                return int(value)
+            return value.normalize()
+    elif isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            return value.astimezone(datetime.timezone.utc)
+    return value
+
+
+def remove_database(database, path):
+    database.close()
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def create_lookup_cache(value):
+    if isinstance(value, str):
+        return LookupCache(path=value)
+    return value
+
+
+def read_lookup(resource, key):
+    lookup = set()
+    with resource:
+        for row in resource.row_stream:
+            cells = tuple(row.get(field_name) for field_name in key)
+            if set(cells) == {None}:
+                continue
+            lookup.add(cells)
+    return lookup
+
+
+def create_fingerprint(resource):
+    source = None
+    if resource.memory:
+        if isinstance(resource.data, list):
+            source = resource.data
+    elif resource.scheme == "file":
+        source = []
+        paths = resource.fullpath
+        for path in paths if isinstance(paths, list) else [paths]:
+            if not os.path.isfile(path):
+                return None
+            stat = os.stat(path)
+            source.append([path, stat.st_mtime_ns, stat.st_size])
+    elif resource.stats.get("hash"):
+        source = [resource.hashing, resource.stats["hash"]]
+    if source is None:
+        return None
+    descriptor = {"source": source}
+    for name in ["schema", "dialect", "layout", "encoding", "format"]:
+        descriptor[name] = resource.get(name)
+    text = json.dumps(descriptor, sort_keys=True, default=str)
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+DETECTOR_OPTIONS = [
+    "buffer_size",
+    "sample_size",
+    "encoding_confidence",
+    "field_type",
+    "field_names",
+    "field_confidence",
+    "field_float_numbers",
+    "field_missing_values",
+    "field_true_values",
+    "field_false_values",
+    "schema_sync",
+    "schema_patch",
+]
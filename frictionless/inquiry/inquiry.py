@@ -87,7 +87,7 @@ class Inquiry(Metadata):
                     list.__setitem__(tasks, index, task)
             if not isinstance(tasks, helpers.ControlledList):
                 tasks = helpers.ControlledList(tasks)
-                tasks.__onchange__(self.metadata_process)
+                tasks.__onchange__(self.metadata_process_nested)
                 dict.__setitem__(self, "tasks", tasks)
 
     def metadata_validate(self):
@@ -169,6 +169,14 @@ class Layout(Metadata):
             or self.offset_fields is not None
         )
 
+    @Metadata.property(write=False)
+    def is_row_filtering(self):
+        """
+        Returns:
+            bool: whether there is a row filtering
+        """
+        return self.pick_rows is not None or self.skip_rows is not None
+
     @Metadata.property(write=False)
     def pick_fields_compiled(self):
         """
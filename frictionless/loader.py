@@ -1,20 +1,24 @@
 import io
 import os
+import bz2
 import gzip
+import lzma
+import zlib
 import shutil
+import struct
 import atexit
 import hashlib
 import zipfile
 import tempfile
 from .exception import FrictionlessException
 from . import settings
+from . import helpers
 from . import errors
 
 
 # NOTE:
-# Probably we need to rework the way we calculate stats
-# First of all, it's not really reliable as read/read1(size) can be called many times
-# Secondly, for now, we stream compressed files twice (see loader.read_byte_stream_decompress)
+# Stats are calculated for the contiguous prefix of the byte stream being read
+# so re-reading (e.g. after buffering) or random access don't break them
 # Although, we need to reviw how we collect buffer - cab it be less IO operations?
 
 
@@ -170,6 +174,17 @@ class Loader:
 
         # ZIP compression
         if self.resource.compression == "zip":
+            # Stream
+            try:
+                byte_stream = ZipByteStream(
+                    byte_stream,
+                    innerpath=self.resource.innerpath,
+                    replay_size=self.resource.detector.buffer_size,
+                )
+                self.resource.innerpath = byte_stream.innerpath
+                return byte_stream
+            except ZipStreamingError:
+                byte_stream.seek(0)
             # Remote
             if self.remote:
                 self.remote = False
@@ -184,27 +199,45 @@ class Loader:
                     bytes = byte_stream.read1(io.DEFAULT_BUFFER_SIZE)
                 byte_stream.seek(0)
             # Unzip
-            with zipfile.ZipFile(byte_stream) as archive:
-                name = self.resource.innerpath or archive.namelist()[0]
-                with archive.open(name) as file:
-                    target = tempfile.NamedTemporaryFile()
-                    shutil.copyfileobj(file, target)
-                    target.seek(0)
-                byte_stream = target
-                self.resource.innerpath = name
+            archive = zipfile.ZipFile(byte_stream)
+            name = self.resource.innerpath or archive.namelist()[0]
+            byte_stream = archive.open(name)
+            self.resource.innerpath = name
             return byte_stream
 
         # GZip compression
         if self.resource.compression == "gz":
-            # Stats
-            if not self.remote:
-                bytes = True
-                while bytes:
-                    bytes = byte_stream.read1(io.DEFAULT_BUFFER_SIZE)
-                byte_stream.seek(0)
             byte_stream = gzip.open(byte_stream)
             return byte_stream
 
+        # BZip2 compression
+        if self.resource.compression == "bz2":
+            create = bz2.BZ2Decompressor
+            return DecompressedByteStream(
+                byte_stream,
+                create=create,
+                replay_size=self.resource.detector.buffer_size,
+            )
+
+        # XZ compression
+        if self.resource.compression == "xz":
+            create = lzma.LZMADecompressor
+            return DecompressedByteStream(
+                byte_stream,
+                create=create,
+                replay_size=self.resource.detector.buffer_size,
+            )
+
+        # Zstandard compression
+        if self.resource.compression == "zst":
+            zstandard = helpers.import_from_plugin("zstandard", plugin="zstd")
+            create = zstandard.ZstdDecompressor().decompressobj
+            return DecompressedByteStream(
+                byte_stream,
+                create=create,
+                replay_size=self.resource.detector.buffer_size,
+            )
+
         # No compression
         if not self.resource.compression:
             return byte_stream
@@ -248,6 +281,18 @@ class Loader:
         newline = "" if self.resource.format == "csv" else None
         return io.TextIOWrapper(self.byte_stream, self.resource.encoding, newline=newline)
 
+    def read_fingerprint(self):
+        """Read source fingerprint
+
+        It identifies a version of the source without reading it completely
+        and it's used to cache inferred metadata. It's not required to be
+        implemented: in this case the inferred metadata is not cached.
+
+        Returns:
+            any?: JSON-serializable source fingerprint
+        """
+        return None
+
     # Write
 
     def write_byte_stream(self, path):
@@ -294,6 +339,7 @@ class ByteStreamWithStatsHandling:
     def __init__(self, byte_stream, *, resource):
         self.__byte_stream = byte_stream
         self.__resource = resource
+        self.__position = 0
         self.__counter = 0
         try:
             self.__hasher = hashlib.new(resource.hashing) if resource.hashing else None
@@ -315,14 +361,276 @@ class ByteStreamWithStatsHandling:
     def closed(self):
         return self.__byte_stream.closed
 
+    def read(self, size=-1):
+        size = -1 if size is None else size
+        chunk = self.__byte_stream.read(size)
+        self.__process(chunk, size=size)
+        return chunk
+
     def read1(self, size=-1):
         size = -1 if size is None else size
         chunk = self.__byte_stream.read1(size)
-        self.__counter += len(chunk)
-        if self.__hasher:
-            self.__hasher.update(chunk)
+        self.__process(chunk, size=size)
+        return chunk
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self.__byte_stream.seek(offset)
+            self.__position = offset
+        else:
+            self.__byte_stream.seek(offset, whence)
+            self.__position = self.__byte_stream.tell()
+        return self.__position
+
+    def tell(self):
+        return self.__position
+
+    def __process(self, chunk, *, size):
+        start = self.__position
+        self.__position += len(chunk)
+        # Only new bytes contiguous to the counted ones are counted
+        if start <= self.__counter < self.__position:
+            chunk = chunk[self.__counter - start :]
+            self.__counter = self.__position
+            if self.__hasher:
+                self.__hasher.update(chunk)
         # End of file
-        if size == -1 or not chunk:
+        if (size == -1 or not chunk) and self.__position == self.__counter:
             self.__resource.stats["bytes"] = self.__counter
             self.__resource.stats["hash"] = self.__hasher.hexdigest()
+
+
+class StreamingByteStream(io.RawIOBase):
+    """Base class for the byte streams decompressing a source on the fly
+
+    The decompressed bytes are produced by blocks without temporary files.
+    Output up to the replay size is kept until the first rewind
+    so the buffer sampling doesn't restart the source (e.g. a remote one).
+    """
+
+    def __init__(self, byte_stream, *, replay_size=settings.DEFAULT_BUFFER_SIZE):
+        self.byte_stream = byte_stream
+        self.replay_size = replay_size
+        self.replay = bytearray()
+        self.buffer = bytearray()
+        self.position = 0
+        self.opened = False
+        self.reset()
+        self.opened = True
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        size = -1 if size is None else size
+        while size < 0 or len(self.buffer) < size:
+            block = self.read_block()
+            if block is None:
+                break
+            self.buffer += block
+        size = len(self.buffer) if size < 0 else size
+        chunk = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        if self.replay is not None:
+            if self.position + len(chunk) <= self.replay_size:
+                self.replay += chunk
+            else:
+                self.replay = None
+        self.position += len(chunk)
         return chunk
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+    def readinto(self, buffer):
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("only rewinding is supported")
+        if self.replay is not None:
+            self.buffer[:0] = self.replay
+        else:
+            self.byte_stream.seek(0)
+            self.buffer = bytearray()
+            self.reset()
+        self.replay = None
+        self.position = 0
+        return 0
+
+    def tell(self):
+        return self.position
+
+    def close(self):
+        # The source is not owned if the stream failed to open
+        if self.opened:
+            self.byte_stream.close()
+        super().close()
+
+    # Decompress
+
+    def reset(self):
+        """Prepare decompression of the source from the beginning"""
+        raise NotImplementedError()
+
+    def read_block(self):
+        """Read a next block of decompressed bytes
+
+        Returns:
+            bytes?: decompressed bytes or None on the end of the stream
+        """
+        raise NotImplementedError()
+
+
+class DecompressedByteStream(StreamingByteStream):
+    """Byte stream decompressing bz2/xz/zst (possibly concatenated) streams"""
+
+    def __init__(self, byte_stream, *, create, **options):
+        self.create = create
+        super().__init__(byte_stream, **options)
+
+    def reset(self):
+        self.decompressor = self.create()
+        self.started = False
+
+    def read_block(self):
+        while True:
+            data = self.read_data()
+            if data is None:
+                return None
+            try:
+                block = self.decompressor.decompress(data)
+            except Exception as exception:
+                error = errors.CompressionError(note=str(exception))
+                raise FrictionlessException(error) from exception
+            if block:
+                return block
+
+    def read_data(self):
+        # Concatenated streams are decompressed one after another
+        if self.decompressor.eof:
+            data = self.decompressor.unused_data
+            data = data or self.byte_stream.read(DECOMPRESSION_BLOCK_SIZE)
+            if not data:
+                return None
+            self.decompressor = self.create()
+            return data
+        data = self.byte_stream.read(DECOMPRESSION_BLOCK_SIZE)
+        if not data:
+            if self.started:
+                note = "compressed file ended before the end-of-stream marker"
+                raise FrictionlessException(errors.CompressionError(note=note))
+            return None
+        self.started = True
+        return data
+
+
+class ZipByteStream(StreamingByteStream):
+    """Byte stream decompressing a zip member reading local file headers sequentially
+
+    Raises `ZipStreamingError` on archives requiring the central directory.
+    """
+
+    def __init__(self, byte_stream, *, innerpath=None, **options):
+        self.innerpath = innerpath
+        super().__init__(byte_stream, **options)
+
+    def reset(self):
+        self.pending = b""
+        self.unused = b""
+        self.done = False
+
+        # Find member
+        while True:
+            header = self.read_exact(30)
+            if header[:4] != b"PK\x03\x04":
+                raise ZipStreamingError()
+            flags, method, csize, usize = struct.unpack("<2xHH8xII", header[4:26])
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            name = self.read_exact(name_length)
+            name = name.decode("utf-8" if flags & 0x800 else "cp437")
+            self.read_exact(extra_length)
+            if flags & 0x1 or method not in [0, 8] or 0xFFFFFFFF in [csize, usize]:
+                raise ZipStreamingError()
+            if flags & 0x8 and method != 8:
+                raise ZipStreamingError()
+            self.remaining = None if flags & 0x8 else csize
+            self.decompressor = zlib.decompressobj(-15) if method == 8 else None
+            if not name.endswith("/") and self.innerpath in [None, "", name]:
+                self.innerpath = name
+                break
+            while not self.done:
+                self.read_member()
+            if flags & 0x8:
+                self.read_data_descriptor()
+            self.done = False
+
+    def read_block(self):
+        if self.done:
+            return None
+        block = self.read_member()
+        if self.done:
+            # The rest of the archive is read for the stats to be complete
+            while self.byte_stream.read(DECOMPRESSION_BLOCK_SIZE):
+                pass
+        return block
+
+    # Helpers
+
+    def read_member(self):
+        size = DECOMPRESSION_BLOCK_SIZE
+        if self.remaining is not None:
+            size = min(size, self.remaining)
+        data = self.read_some(size) if size else b""
+        if not data and not (self.remaining == 0 and not self.decompressor):
+            raise FrictionlessException(errors.CompressionError(note="truncated zip"))
+        if self.remaining is not None:
+            self.remaining -= len(data)
+        if self.decompressor:
+            try:
+                data = self.decompressor.decompress(data)
+            except zlib.error as exception:
+                error = errors.CompressionError(note=str(exception))
+                raise FrictionlessException(error) from exception
+            if self.decompressor.eof:
+                self.done = True
+                self.unused = self.decompressor.unused_data
+        elif not self.remaining:
+            self.done = True
+            self.unused = b""
+        return data
+
+    def read_data_descriptor(self):
+        descriptor = self.unused + self.read_exact(max(16 - len(self.unused), 0))
+        size = 16 if descriptor[:4] == b"PK\x07\x08" else 12
+        if len(descriptor) < size:
+            raise ZipStreamingError()
+        # The descriptor is followed by the next member header
+        self.pending = descriptor[size:]
+
+    def read_exact(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self.read_some(size - len(data))
+            if not chunk:
+                raise ZipStreamingError()
+            data += chunk
+        return data
+
+    def read_some(self, size):
+        if self.pending:
+            data, self.pending = self.pending[:size], self.pending[size:]
+            return data
+        return self.byte_stream.read(size)
+
+
+class ZipStreamingError(Exception):
+    pass
+
+
+DECOMPRESSION_BLOCK_SIZE = io.DEFAULT_BUFFER_SIZE * 8
@@ -1,16 +1,22 @@
 import io
+import os
 import re
 import json
 import yaml
+import hashlib
+import threading
 import jsonschema
 import stringcase
+from collections import OrderedDict
 from collections.abc import Mapping
 from pathlib import Path
 from operator import setitem
 from functools import partial
+from contextlib import contextmanager
 from importlib import import_module
 from .exception import FrictionlessException
 from .helpers import cached_property, render_markdown
+from . import settings
 from . import helpers
 import pprint as pp
 
@@ -19,8 +25,7 @@ import pprint as pp
 # In general, it will be better to simplify magic used in Metadata
 # For exmple, we can make default values (like empty list) immutable
 # to get rid of metadata_attach and related complexity
-# Also, take a look at `resource.open` all these seitems trigger onchage (innefective)
-# We might consider having something like `with metadata.disable_onchange`
+# Several changes can be coalesced into one onchange using `with metadata.batch_update()`
 
 
 class Metadata(helpers.ControlledDict):
@@ -44,6 +49,7 @@ class Metadata(helpers.ControlledDict):
 
     def __init__(self, descriptor=None):
         self.__Error = self.metadata_Error or import_module("frictionless.errors").Error
+        self.__batch = None
         metadata = self.metadata_extract(descriptor)
         for key, value in metadata.items():
             dict.setdefault(self, key, value)
@@ -67,12 +73,17 @@ class Metadata(helpers.ControlledDict):
         return super().__setattr__(name, value)
 
     def __onchange__(self, onchange=None):
-        super().__onchange__(onchange)
+        batch = getattr(self, "_Metadata__batch", None) if onchange is None else None
+        if batch is None:
+            super().__onchange__(onchange)
         if hasattr(self, "_Metadata__Error"):
             for key, attr in type(self).__dict__.items():
                 reset = getattr(attr, "metadata_reset", None)
                 if reset and key in self.__dict__:
                     self.__dict__.pop(key)
+            if batch is not None:
+                batch["onchange"] = True
+                return
             self.metadata_process()
 
     def setinitial(self, key, value):
@@ -99,6 +110,35 @@ class Metadata(helpers.ControlledDict):
     def infer(self):
         pass
 
+    # Batch
+
+    @contextmanager
+    def batch_update(self):
+        """Defer processing of the metadata changes until the end of the block
+
+        Changes made inside the block are coalesced into a single change
+        notification on exit. Cached properties are still reset on every change
+        while the metadata processing and the notification of a parent are deferred.
+
+        ```python
+        with schema.batch_update():
+            for name in names:
+                schema.add_field(Field(name=name, type="string"))
+        ```
+        """
+        if self.__batch is not None:
+            yield self
+            return
+        self.__batch = {}
+        try:
+            yield self
+        finally:
+            batch, self.__batch = self.__batch, None
+            if batch.get("onchange"):
+                self.__onchange__()
+            elif batch.get("process"):
+                self.metadata_process()
+
     # Import/Export
 
     def to_copy(self):
@@ -261,6 +301,16 @@ class Metadata(helpers.ControlledDict):
         """Helper method called on any metadata change"""
         pass
 
+    def metadata_process_nested(self):
+        """Helper method called on a change of a nested list of metadata
+
+        It processes the metadata or defers it until the end of a batch update.
+        """
+        if self.__batch is not None:
+            self.__batch["process"] = True
+            return
+        self.metadata_process()
+
     def metadata_validate(self, profile=None):
         """Helper method called on any metadata change
 
@@ -269,8 +319,7 @@ class Metadata(helpers.ControlledDict):
         """
         profile = profile or self.metadata_profile
         if profile:
-            validator_class = jsonschema.validators.validator_for(profile)
-            validator = validator_class(profile)
+            validator = create_validator(profile)
             for error in validator.iter_errors(self):
                 # Withouth this resource with both path/data is invalid
                 if "is valid under each of" in error.message:
@@ -326,6 +375,62 @@ def metadata_to_dict(value):
     return value
 
 
+def create_validator(profile):
+    """Create a profile validator reusing validators created for the same profile"""
+    with PROFILE_LOCK:
+        item = VALIDATORS.get(id(profile))
+        if item and item[0] is profile:
+            VALIDATORS.move_to_end(id(profile))
+            return item[1]
+    validator_class = jsonschema.validators.validator_for(profile)
+    validator = validator_class(profile)
+    with PROFILE_LOCK:
+        VALIDATORS[id(profile)] = (profile, validator)
+        if len(VALIDATORS) > settings.PROFILE_CACHE_SIZE:
+            VALIDATORS.popitem(last=False)
+    return validator
+
+
+def read_profile(source):
+    """Read a profile by path or URL returning the same dict for the same source
+
+    Remote profiles are persisted to `settings.PROFILE_CACHE_PATH` if it's set.
+    """
+    key = source
+    remote = helpers.is_remote_path(source)
+    if not remote:
+        try:
+            key = (source, os.stat(source).st_mtime_ns)
+        except OSError:
+            return Metadata(source).to_dict()
+    with PROFILE_LOCK:
+        profile = PROFILES.get(key)
+        if profile is not None:
+            PROFILES.move_to_end(key)
+            return profile
+    path = None
+    if remote and settings.PROFILE_CACHE_PATH:
+        name = hashlib.md5(source.encode("utf-8")).hexdigest()
+        path = os.path.join(settings.PROFILE_CACHE_PATH, f"{name}.json")
+    if path and os.path.isfile(path):
+        with open(path, encoding="utf-8") as file:
+            profile = json.load(file)
+    else:
+        profile = Metadata(source).to_dict()
+        if path:
+            helpers.write_file(path, json.dumps(profile))
+    with PROFILE_LOCK:
+        PROFILES[key] = profile
+        if len(PROFILES) > settings.PROFILE_CACHE_SIZE:
+            PROFILES.popitem(last=False)
+    return profile
+
+
+PROFILE_LOCK = threading.Lock()
+PROFILES = OrderedDict()
+VALIDATORS = OrderedDict()
+
+
 def metadata_attach(self, name, value):
     # Using standalone `setitem` without a wrapper doesn't work for Python3.6
     return setitem(self, name, value)
@@ -6,10 +6,11 @@ import tempfile
 from pathlib import Path
 from copy import deepcopy
 from ..exception import FrictionlessException
-from ..metadata import Metadata
+from ..metadata import Metadata, read_profile
 from ..detector import Detector
 from ..resource import Resource
 from ..field import Field
+from ..index import create_lookup_cache
 from ..system import system
 from .analyze import analyze
 from .describe import describe
@@ -123,6 +124,11 @@ class Package(Metadata):
         dialect? (dict|Dialect): Table dialect.
             For more information, please check the Dialect documentation.
 
+        lookup_cache? (str|LookupCache): Foreign key lookup cache.
+            If provided, resources referenced by foreign keys are read
+            only once for all the referencing resources.
+            A string is a path to a file persisting the lookups.
+
     Raises:
         FrictionlessException: raise any error that occurs during the process
     """
@@ -161,6 +167,7 @@ class Package(Metadata):
         trusted=False,
         hashing=None,
         dialect=None,
+        lookup_cache=None,
     ):
 
         # Handle source
@@ -208,6 +215,7 @@ class Package(Metadata):
         self.__onerror = onerror
         self.__trusted = trusted
         self.__hashing = hashing
+        self.__lookup_cache = create_lookup_cache(lookup_cache)
         super().__init__(descriptor)
 
     def __setattr__(self, name, value):
@@ -219,6 +227,8 @@ class Package(Metadata):
             self.__onerror = value
         elif name == "trusted":
             self.__trusted = value
+        elif name == "lookup_cache":
+            self.__lookup_cache = create_lookup_cache(value)
         else:
             return super().__setattr__(name, value)
         self.metadata_process()
@@ -379,6 +389,14 @@ class Package(Metadata):
         """
         return self.__trusted
 
+    @Metadata.property(cache=False, write=False)
+    def lookup_cache(self):
+        """
+        Returns:
+            LookupCache?: foreign key lookup cache
+        """
+        return self.__lookup_cache
+
     # Resources
 
     @Metadata.property
@@ -483,19 +501,21 @@ class Package(Metadata):
             stats? (bool): stream files completely and infer stats
         """
 
-        # General
-        self.setdefault("profile", settings.DEFAULT_PACKAGE_PROFILE)
-        for resource in self.resources:
-            resource.infer(stats=stats)
+        with self.batch_update():
 
-        # Deduplicate names
-        if len(self.resource_names) != len(set(self.resource_names)):
-            seen_names = []
-            for index, name in enumerate(self.resource_names):
-                count = seen_names.count(name) + 1
-                if count > 1:
-                    self.resources[index].name = "%s%s" % (name, count)
-                seen_names.append(name)
+            # General
+            self.setdefault("profile", settings.DEFAULT_PACKAGE_PROFILE)
+            for resource in self.resources:
+                resource.infer(stats=stats)
+
+            # Deduplicate names
+            if len(self.resource_names) != len(set(self.resource_names)):
+                seen_names = []
+                for index, name in enumerate(self.resource_names):
+                    count = seen_names.count(name) + 1
+                    if count > 1:
+                        self.resources[index].name = "%s%s" % (name, count)
+                    seen_names.append(name)
 
     # Export/Import
 
@@ -514,6 +534,7 @@ class Package(Metadata):
             detector=self.__detector,
             onerror=self.__onerror,
             trusted=self.__trusted,
+            lookup_cache=self.__lookup_cache,
         )
 
     def to_er_diagram(self, path=None) -> str:
@@ -731,7 +752,7 @@ class Package(Metadata):
                 resource.package = self
             if not isinstance(resources, helpers.ControlledList):
                 resources = helpers.ControlledList(resources)
-                resources.__onchange__(self.metadata_process)
+                resources.__onchange__(self.metadata_process_nested)
                 dict.__setitem__(self, "resources", resources)
 
     def metadata_validate(self):
@@ -758,7 +779,7 @@ class Package(Metadata):
                     note = f'path "{self.profile}" is not safe'
                     error = errors.PackageError(note=note)
                     raise FrictionlessException(error)
-            profile = Metadata(self.profile).to_dict()
+            profile = read_profile(self.profile)
             yield from super().metadata_validate(profile)
 
         # Resources
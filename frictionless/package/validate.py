@@ -2,6 +2,7 @@ import warnings
 from typing import TYPE_CHECKING
 from ..report import Report
 from ..inquiry import Inquiry, InquiryTask
+from ..index import LookupCache, create_lookup_cache
 from ..exception import FrictionlessException
 from .. import helpers
 
@@ -16,6 +17,7 @@ def validate(
     resource_name=None,
     original=False,
     parallel=False,
+    lookup_cache=None,
     **options,
 ):
     """Validate package
@@ -25,6 +27,9 @@ def validate(
         resource_name (str): validate only selected resource
         original? (bool): validate metadata as it is (without inferring)
         parallel? (bool): enable multiprocessing
+        lookup_cache? (str|LookupCache): a lookup cache or a path to a file
+            persisting foreign key lookups between validations; it overrides
+            the package's cache; lookups are shared between resources anyway
         **options (dict): resource validateion options
 
     Returns:
@@ -60,11 +65,17 @@ def validate(
     if not parallel:
         tasks = []
         errors = []
-        for resource, stats in zip(package.resources, package_stats):
-            resource.stats = stats
-            report = resource.validate(original=original, **options)
-            tasks.extend(report.tasks)
-            errors.extend(report.errors)
+        cache = package.lookup_cache
+        package.lookup_cache = create_lookup_cache(lookup_cache) or cache or LookupCache()
+        try:
+            for resource, stats in zip(package.resources, package_stats):
+                resource.stats = stats
+                report = resource.validate(original=original, **options)
+                tasks.extend(report.tasks)
+                errors.extend(report.errors)
+            package.lookup_cache.save()
+        finally:
+            package.lookup_cache = cache
         return Report(time=timer.time, errors=errors, tasks=tasks)
 
     # Validate in-parallel
@@ -1,4 +1,5 @@
 from itertools import chain
+from operator import itemgetter
 from .exception import FrictionlessException
 from .system import system
 from . import settings
@@ -19,12 +20,14 @@ class Parser:
 
     requires_loader = False
     supported_types = []
+    supports_projection = False
 
     def __init__(self, resource):
         self.__resource = resource
         self.__loader = None
         self.__sample = None
         self.__list_stream = None
+        self.__projection = None
 
     def __enter__(self):
         if self.closed:
@@ -66,6 +69,14 @@ class Parser:
         """
         return self.__list_stream
 
+    @property
+    def projection(self):
+        """
+        Returns:
+            func?: function projecting cells to the field positions set by `project`
+        """
+        return self.__projection
+
     # Open/Close
 
     def open(self):
@@ -143,6 +154,20 @@ class Parser:
         """
         return ListStreamWithErrorHandling(list_stream)
 
+    # Project
+
+    def project(self, field_positions):
+        """Project the rest of the list stream to the given field positions
+
+        It's used by a resource if the parser supports projection.
+        Such a parser has to apply `parser.projection` to every row
+        it yields after this call instead of yielding the full rows.
+
+        Parameters:
+            field_positions (int[]): field positions starting from 1
+        """
+        self.__projection = create_projection(field_positions)
+
     # Write
 
     def write_row_stream(self, resource):
@@ -157,6 +182,23 @@ class Parser:
 # Internal
 
 
+def create_projection(field_positions):
+    indexes = [position - 1 for position in field_positions]
+    getter = itemgetter(*indexes) if len(indexes) > 1 else None
+
+    # The result is the same as of `layout.read_filter_cells`
+    # so the cells missing in a short row are not added
+    def projection(cells):
+        try:
+            if getter:
+                return list(getter(cells))
+            return [cells[indexes[0]]] if indexes else []
+        except IndexError:
+            return [cells[index] for index in indexes if index < len(cells)]
+
+    return projection
+
+
 # NOTE:
 # Here we catch some Loader related errors
 # We can consider moving it to Loader if it's possible
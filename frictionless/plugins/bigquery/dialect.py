@@ -1,5 +1,6 @@
 from ...metadata import Metadata
 from ...dialect import Dialect
+from . import settings
 
 
 class BigqueryDialect(Dialect):
@@ -14,6 +15,11 @@ class BigqueryDialect(Dialect):
         project (str): project
         dataset? (str): dataset
         table? (str): table
+        order_by? (str): order_by statement passed to the query (rows are
+            read without a query in the table storage order if not set)
+        page_size? (int): number of rows fetched from BigQuery at once
+        batch_size? (int): number of rows written by a load job
+        max_jobs? (int): number of load jobs running at once
 
     Raises:
         FrictionlessException: raise any error that occurs during the process
@@ -27,11 +33,19 @@ class BigqueryDialect(Dialect):
         dataset=None,
         prefix=None,
         table=None,
+        order_by=None,
+        page_size=None,
+        batch_size=None,
+        max_jobs=None,
     ):
         self.setinitial("project", project)
         self.setinitial("dataset", dataset)
         self.setinitial("prefix", prefix)
         self.setinitial("table", table)
+        self.setinitial("order_by", order_by)
+        self.setinitial("page_size", page_size)
+        self.setinitial("batch_size", batch_size)
+        self.setinitial("max_jobs", max_jobs)
         super().__init__(descriptor)
 
     @Metadata.property
@@ -50,6 +64,22 @@ class BigqueryDialect(Dialect):
     def table(self):
         return self.get("table")
 
+    @Metadata.property
+    def order_by(self):
+        return self.get("order_by")
+
+    @Metadata.property
+    def page_size(self):
+        return self.get("page_size", settings.DEFAULT_PAGE_SIZE)
+
+    @Metadata.property
+    def batch_size(self):
+        return self.get("batch_size", settings.BUFFER_SIZE)
+
+    @Metadata.property
+    def max_jobs(self):
+        return self.get("max_jobs", settings.DEFAULT_MAX_JOBS)
+
     # Metadata
 
     metadata_profile = {  # type: ignore
@@ -61,5 +91,9 @@ class BigqueryDialect(Dialect):
             "dataset": {"type": "string"},
             "prefix": {"type": "string"},
             "table": {"type": "string"},
+            "order_by": {"type": "string"},
+            "page_size": {"type": "integer", "minimum": 1},
+            "batch_size": {"type": "integer", "minimum": 1},
+            "max_jobs": {"type": "integer", "minimum": 1},
         },
     }
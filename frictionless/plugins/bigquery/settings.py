@@ -1,3 +1,7 @@
 # General
 
 BUFFER_SIZE = 1000
+DEFAULT_MAX_JOBS = 4
+RESUMABLE_SIZE = 10 * 1024 * 1024
+JOB_POLL_INTERVAL = 1
+DEFAULT_PAGE_SIZE = 10000
@@ -1,10 +1,14 @@
 import io
 import re
 import csv
+import gzip
 import json
 import time
 from slugify import slugify
 from functools import partial
+from itertools import islice
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from ...exception import FrictionlessException
 from ...resource import Resource
 from ...package import Package
@@ -38,6 +42,10 @@ class BigqueryStorage(Storage):
         self.__project = dialect.project
         self.__dataset = dialect.dataset
         self.__prefix = dialect.prefix
+        self.__order_by = dialect.order_by
+        self.__page_size = dialect.page_size
+        self.__batch_size = dialect.batch_size
+        self.__max_jobs = dialect.max_jobs
 
     def __iter__(self):
         names = []
@@ -115,28 +123,66 @@ class BigqueryStorage(Storage):
 
     def __read_convert_data(self, name, schema):
         bq_name = self.__write_convert_name(name)
+        yield schema.field_names
 
-        # Get response
-        response = (
-            self.__service.tabledata()
-            .list(projectId=self.__project, datasetId=self.__dataset, tableId=bq_name)
-            .execute()
-        )
-
-        # Collect rows
-        data = []
-        for fields in response["rows"]:
-            cells = [field["v"] for field in fields["f"]]
-            data.append(cells)
+        # Emit data
+        # The next page is fetched in a thread while the current one is emitted.
+        # Requests are still sent one at a time as the client is not thread-safe
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.__read_convert_data_page, bq_name)
+            while future is not None:
+                response = future.result()
+                future = None
+                if response.get("pageToken"):
+                    future = executor.submit(
+                        self.__read_convert_data_page, bq_name, response
+                    )
+                for fields in response.get("rows", []):
+                    yield [field["v"] for field in fields["f"]]
+
+    def __read_convert_data_page(self, bq_name, previous=None):
+        page = {"maxResults": self.__page_size}
+        if previous:
+            page["pageToken"] = previous["pageToken"]
+
+        # Table
+        if not self.__order_by:
+            return (
+                self.__service.tabledata()
+                .list(
+                    projectId=self.__project,
+                    datasetId=self.__dataset,
+                    tableId=bq_name,
+                    **page,
+                )
+                .execute()
+            )
 
-        # Sort data
-        data = sorted(
-            data, key=lambda cells: cells[0] if cells[0] is not None else "null"
-        )
+        # Query
+        response = None
+        if not previous:
+            table = f"`{self.__project}.{self.__dataset}.{bq_name}`"
+            query = f"SELECT * FROM {table} ORDER BY {self.__order_by}"
+            body = {"query": query, "useLegacySql": False, **page}
+            response = (
+                self.__service.jobs().query(projectId=self.__project, body=body).execute()
+            )
 
-        # Emit data
-        yield schema.field_names
-        yield from data
+        # Query results (the request waits for the job to complete)
+        reference = (response or previous)["jobReference"]
+        while not response or not response.get("jobComplete"):
+            if reference.get("location"):
+                page["location"] = reference["location"]
+            response = (
+                self.__service.jobs()
+                .getQueryResults(
+                    projectId=reference["projectId"],
+                    jobId=reference["jobId"],
+                    **page,
+                )
+                .execute()
+            )
+        return response
 
     def __read_convert_type(self, bq_type=None):
 
@@ -221,7 +267,6 @@ class BigqueryStorage(Storage):
         return bq_schema
 
     def __write_convert_data(self, resource):
-        mapping = self.__write_convert_type()
 
         # Fallback fields
         fallback_fields = []
@@ -237,31 +282,52 @@ class BigqueryStorage(Storage):
                 timezone_fields.append(field)
 
         # Write data
-        buffer = []
-        with resource:
-            for row in resource.row_stream:
-                for field in fallback_fields:
-                    row[field.name], notes = field.write_cell(row[field.name])
-                for field in timezone_fields:
-                    if row[field.name] is not None:
-                        row[field.name] = row[field.name].replace(tzinfo=None)
-                buffer.append(row.to_list())
-                if len(buffer) > settings.BUFFER_SIZE:
-                    self.__write_convert_data_start_job(resource.name, buffer)
-                    buffer = []
-            if len(buffer) > 0:
-                self.__write_convert_data_start_job(resource.name, buffer)
-
-    def __write_convert_data_start_job(self, name, buffer):
+        # Batches are converted to gzipped CSV while a thread uploads the previous
+        # ones and polls the load jobs (the client is not thread-safe so all the
+        # requests are sent from that thread). Up to "max_jobs" batches are
+        # waiting for the upload and up to "max_jobs" load jobs run at once
+        jobs = []
+        futures = deque()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with resource:
+                row_stream = iter(resource.row_stream)
+                while True:
+                    rows = list(islice(row_stream, self.__batch_size))
+                    if not rows:
+                        break
+                    for row in rows:
+                        for field in fallback_fields:
+                            row[field.name], notes = field.write_cell(row[field.name])
+                        for field in timezone_fields:
+                            if row[field.name] is not None:
+                                row[field.name] = row[field.name].replace(tzinfo=None)
+                    bytes = self.__write_convert_data_compress(rows)
+                    future = executor.submit(
+                        self.__write_convert_data_start_job, resource.name, bytes, jobs
+                    )
+                    futures.append(future)
+                    while len(futures) > self.__max_jobs:
+                        futures.popleft().result()
+            while futures:
+                futures.popleft().result()
+            executor.submit(self.__write_convert_data_finish_jobs, jobs).result()
+
+    def __write_convert_data_compress(self, rows):
+        buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode="wb") as file:
+            chars = io.TextIOWrapper(file, encoding="utf-8", newline="")
+            writer = csv.writer(chars)
+            writer.writerows(row.to_list() for row in rows)
+            chars.flush()
+            chars.detach()
+        return buffer.getvalue()
+
+    def __write_convert_data_start_job(self, name, bytes, jobs):
         http = helpers.import_from_plugin("apiclient.http", plugin="bigquery")
         bq_name = self.__write_convert_name(name)
 
-        # Process buffer to byte stream csv
-        chars = io.StringIO()
-        writer = csv.writer(chars)
-        for cells in buffer:
-            writer.writerow(cells)
-        bytes = io.BufferedRandom(io.BytesIO(chars.getvalue().encode("utf-8")))
+        # Wait a free job slot
+        self.__write_convert_data_finish_jobs(jobs, limit=self.__max_jobs - 1)
 
         # Prepare job body
         body = {
@@ -278,42 +344,52 @@ class BigqueryStorage(Storage):
         }
 
         # Prepare job media body
+        # Big batches are uploaded by chunks so a failed chunk can be retried
         mimetype = "application/octet-stream"
-        media_body = http.MediaIoBaseUpload(bytes, mimetype=mimetype)
+        resumable = len(bytes) > settings.RESUMABLE_SIZE
+        media_body = http.MediaIoBaseUpload(
+            io.BytesIO(bytes),
+            mimetype=mimetype,
+            resumable=resumable,
+            chunksize=settings.RESUMABLE_SIZE,
+        )
 
         # Make request to Big Query
         response = (
             self.__service.jobs()
             .insert(projectId=self.__project, body=body, media_body=media_body)
-            .execute()
+            .execute(num_retries=1 if resumable else 0)
         )
-
-        # Wait the job
-        try:
-            self.__write_convert_data_finish_job(response)
-        except Exception as exception:
-            if "not found: job" in str(exception).lower():
-                note = "BigQuery plugin supports only the US location of datasets"
-                raise FrictionlessException(errors.StorageError(note=note))
-            raise
-
-    def __write_convert_data_finish_job(self, response):
-
-        # Get job instance
-        job = self.__service.jobs().get(
-            projectId=response["jobReference"]["projectId"],
-            jobId=response["jobReference"]["jobId"],
-        )
-
-        # Wait done
-        while True:
-            result = job.execute(num_retries=1)
-            if result["status"]["state"] == "DONE":
-                if result["status"].get("errors"):
-                    note = "\n".join(er["message"] for er in result["status"]["errors"])
-                    raise FrictionlessException(errors.StorageError(note=note))
-                break
-            time.sleep(1)
+        jobs.append(response["jobReference"])
+
+    def __write_convert_data_finish_jobs(self, jobs, *, limit=0):
+        while len(jobs) > limit:
+            for reference in list(jobs):
+
+                # Get job status
+                try:
+                    result = (
+                        self.__service.jobs()
+                        .get(projectId=reference["projectId"], jobId=reference["jobId"])
+                        .execute(num_retries=1)
+                    )
+                except Exception as exception:
+                    if "not found: job" in str(exception).lower():
+                        note = "BigQuery plugin supports only the US location of datasets"
+                        raise FrictionlessException(errors.StorageError(note=note))
+                    raise
+
+                # Check job status
+                if result["status"]["state"] == "DONE":
+                    if result["status"].get("errors"):
+                        note = "\n".join(
+                            er["message"] for er in result["status"]["errors"]
+                        )
+                        raise FrictionlessException(errors.StorageError(note=note))
+                    jobs.remove(reference)
+
+            if len(jobs) > limit:
+                time.sleep(settings.JOB_POLL_INTERVAL)
 
     def __write_convert_type(self, type=None):
 
@@ -1,5 +1,7 @@
 from ...metadata import Metadata
 from ...dialect import Dialect
+from ... import settings as global_settings
+from . import settings
 
 
 class CkanDialect(Dialect):
@@ -18,6 +20,9 @@ class CkanDialect(Dialect):
         limit? (int): limit number of returned entries
         sort? (str): sort returned entries, e.g. by date descending: `date desc`
         filters? (dict): filter data, e.g. field with value: `{ "key": "value" }`
+        batch_size? (int): number of records written to CKAN at once
+        workers? (int): number of requests writing records concurrently
+            (the records can be stored in a different order if more than one)
 
     Raises:
         FrictionlessException: raise any error that occurs during the process
@@ -34,6 +39,8 @@ class CkanDialect(Dialect):
         limit=None,
         sort=None,
         filters=None,
+        batch_size=None,
+        workers=None,
     ):
         self.setinitial("resource", resource)
         self.setinitial("dataset", dataset)
@@ -42,6 +49,8 @@ class CkanDialect(Dialect):
         self.setinitial("limit", limit)
         self.setinitial("sort", sort)
         self.setinitial("filters", filters)
+        self.setinitial("batch_size", batch_size)
+        self.setinitial("workers", workers)
         super().__init__(descriptor)
 
     @Metadata.property
@@ -72,6 +81,14 @@ class CkanDialect(Dialect):
     def filters(self):
         return self.get("filters")
 
+    @Metadata.property
+    def batch_size(self):
+        return self.get("batch_size", global_settings.DEFAULT_BATCH_SIZE)
+
+    @Metadata.property
+    def workers(self):
+        return self.get("workers", settings.DEFAULT_WORKERS)
+
     # Metadata
 
     metadata_profile = {  # type: ignore
@@ -86,5 +103,7 @@ class CkanDialect(Dialect):
             "limit": {"type": "integer"},
             "sort": {"type": "string"},
             "filters": {"type": "object"},
+            "batch_size": {"type": "integer", "minimum": 1},
+            "workers": {"type": "integer", "minimum": 1},
         },
     }
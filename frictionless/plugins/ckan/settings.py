@@ -0,0 +1,6 @@
+# General
+
+
+DEFAULT_WORKERS = 1
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_DELAY = 1
@@ -1,6 +1,12 @@
 import os
 import json
+import time
+import requests
 from functools import partial
+from itertools import islice
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.packages.urllib3.exceptions import ConnectTimeoutError
 from ...exception import FrictionlessException
 from ...resource import Resource
 from ...package import Package
@@ -10,6 +16,7 @@ from ...system import system
 from ...field import Field
 from ... import errors
 from .dialect import CkanDialect
+from . import settings
 
 
 # General
@@ -35,6 +42,8 @@ class CkanStorage(Storage):
         self.__endpoint = f"{self.__url}/api/3/action"
         self.__dataset = dialect.dataset
         self.__apikey = dialect.apikey
+        self.__batch_size = dialect.batch_size
+        self.__workers = dialect.workers
         self.__queryoptions = {
             "fields": dialect.fields,
             "limit": dialect.limit,
@@ -107,15 +116,21 @@ class CkanStorage(Storage):
             **self.__queryoptions,
         }
 
-        response = self.__make_ckan_request(endpoint, params=params)
-        while response["result"]["records"]:
-            for row in response["result"]["records"]:
-                yield row
-            if "limit" not in self.__queryoptions:
-                next_url = self.__url + response["result"]["_links"]["next"]
-                response = self.__make_ckan_request(next_url)
-            else:
-                response = dict(result=dict(records=[]))
+        # Emit data
+        # The next page is fetched in a thread while the current one is emitted.
+        # A page having less records than the limit is the last one
+        request = partial(self.__make_ckan_request, retries=settings.DEFAULT_RETRIES)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(request, endpoint, params=params)
+            while future is not None:
+                result = future.result()["result"]
+                records = result["records"]
+                future = None
+                if records and "limit" not in self.__queryoptions:
+                    if len(records) >= result.get("limit", len(records)):
+                        next_url = self.__url + result["_links"]["next"]
+                        future = executor.submit(request, next_url)
+                yield from records
 
     def __read_convert_type(self, ckan_type=None):
 
@@ -214,18 +229,36 @@ class CkanStorage(Storage):
     def __write_convert_data(self, resource):
         ckan_table = self.__read_ckan_table(resource.name)
         endpoint = f"{self.__endpoint}/datastore_upsert"
-        with resource:
-            records = [row.to_dict(json=True) for row in resource.row_stream]
-        self.__make_ckan_request(
-            endpoint,
-            method="POST",
-            json={
-                "resource_id": ckan_table["resource_id"],
-                "method": "insert",
-                "records": records,
-            },
+        # Inserting a batch twice duplicates the records so it's only retried
+        # if it hasn't been sent at all
+        request = partial(
+            self.__make_ckan_request, retries=settings.DEFAULT_RETRIES, idempotent=False
         )
 
+        # Write data
+        # Batches are sent by a thread pool and only two batches
+        # per worker are kept in memory (including the ones being sent)
+        futures = deque()
+        with ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            with resource:
+                row_stream = iter(resource.row_stream)
+                while True:
+                    rows = islice(row_stream, self.__batch_size)
+                    records = [row.to_dict(json=True) for row in rows]
+                    if not records:
+                        break
+                    body = {
+                        "resource_id": ckan_table["resource_id"],
+                        "method": "insert",
+                        "records": records,
+                    }
+                    future = executor.submit(request, endpoint, method="POST", json=body)
+                    futures.append(future)
+                    while len(futures) > self.__workers * 2:
+                        futures.popleft().result()
+            while futures:
+                futures.popleft().result()
+
     def __write_convert_type(self, type=None):
 
         # Create mapping
@@ -284,8 +317,21 @@ class CkanStorage(Storage):
         resource_ids = [resource["id"] for resource in resources]
         return resource_ids
 
-    def __make_ckan_request(self, endpoint, **options):
-        response = make_ckan_request(endpoint, apikey=self.__apikey, **options)
+    def __make_ckan_request(self, endpoint, *, retries=0, idempotent=True, **options):
+        # Idempotent requests are retried on any failure including non-JSON
+        # (e.g. gateway error) responses while others only if the request
+        # wasn't sent at all as otherwise it could have been handled by the server
+        # (ValueError is caught as older requests don't have JSONDecodeError)
+        for attempt in range(retries + 1):
+            try:
+                response = make_ckan_request(endpoint, apikey=self.__apikey, **options)
+                break
+            except (requests.RequestException, ValueError) as exception:
+                if attempt == retries:
+                    raise
+                if not idempotent and not is_request_not_sent(exception):
+                    raise
+                time.sleep(settings.DEFAULT_RETRY_DELAY * 2**attempt)
         ckan_error = get_ckan_error(response)
         if ckan_error:
             note = "CKAN returned an error: " + json.dumps(ckan_error)
@@ -315,6 +361,16 @@ def make_ckan_request(url, method="GET", headers=None, apikey=None, **options):
     ).json()
 
 
+def is_request_not_sent(exception):
+    # Requests wraps urllib3 errors and NewConnectionError is a ConnectTimeoutError
+    if isinstance(exception, requests.ConnectTimeout):
+        return True
+    if isinstance(exception, requests.ConnectionError) and exception.args:
+        reason = getattr(exception.args[0], "reason", None)
+        return isinstance(reason, ConnectTimeoutError)
+    return False
+
+
 def get_ckan_error(response):
 
     # Get an error
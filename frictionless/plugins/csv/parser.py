@@ -20,6 +20,7 @@ class CsvParser(Parser):
     supported_types = [
         "string",
     ]
+    supports_projection = True
 
     # Read
 
@@ -27,7 +28,12 @@ class CsvParser(Parser):
         sample = self.read_list_stream_infer_dialect()
         source = chain(sample, self.loader.text_stream)
         data = csv.reader(source, dialect=self.resource.dialect.to_python())
-        yield from data
+        for cells in data:
+            if self.projection:
+                yield self.projection(cells)
+                yield from map(self.projection, data)
+                break
+            yield cells
 
     def read_list_stream_infer_dialect(self):
         sample = extract_samle(self.loader.text_stream)
@@ -35,6 +35,7 @@ class XlsxParser(Parser):
         "time",
         "year",
     ]
+    supports_projection = True
 
     # Read
 
@@ -116,7 +117,10 @@ class XlsxParser(Parser):
                     cell.value = value
 
         # Stream data
+        # Projected rows only have the needed cells extracted
         for cells in sheet.iter_rows():
+            if self.projection:
+                cells = self.projection(cells)
             yield extract_row_values(
                 cells, dialect.preserve_formatting, dialect.adjust_floating_point_error
             )
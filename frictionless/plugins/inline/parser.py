@@ -1,5 +1,8 @@
+from operator import itemgetter
+from itertools import islice
 from ...exception import FrictionlessException
 from ...parser import Parser
+from ... import settings
 from ... import errors
 
 
@@ -61,11 +64,11 @@ class InlineParser(Parser):
             headers = dialect.data_keys or list(item.keys())
             yield headers
             yield [item.get(header) for header in headers]
-            for item in data:
-                if not isinstance(item, dict):
-                    error = errors.SourceError(note="unsupported inline data")
-                    raise FrictionlessException(error)
-                yield [item.get(header) for header in headers]
+            while True:
+                items = list(islice(data, settings.DEFAULT_BATCH_SIZE))
+                if not items:
+                    break
+                yield from read_keyed_cells(items, headers)
 
         # General
         elif isinstance(item, (list, tuple)):
@@ -94,3 +97,24 @@ class InlineParser(Parser):
                     data.append(row.field_names)
                 data.append(item)
         target.data = data
+
+
+# Internal
+
+
+def read_keyed_cells(items, headers):
+    # Cells of a batch having all the keys are extracted at once
+    if len(headers) > 1 and all(type(item) is dict for item in items):
+        try:
+            return list(map(list, map(itemgetter(*headers), items)))
+        except KeyError:
+            pass
+    return read_keyed_cells_slow(items, headers)
+
+
+def read_keyed_cells_slow(items, headers):
+    for item in items:
+        if not isinstance(item, dict):
+            error = errors.SourceError(note="unsupported inline data")
+            raise FrictionlessException(error)
+        yield [item.get(header) for header in headers]
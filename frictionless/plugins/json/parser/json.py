@@ -1,5 +1,9 @@
+import io
+import re
 import json
 import tempfile
+from decimal import Decimal
+from itertools import chain
 from ....exception import FrictionlessException
 from ....plugins.inline import InlineDialect
 from ....resource import Resource
@@ -35,7 +39,11 @@ class JsonParser(Parser):
         dialect = self.resource.dialect
         if dialect.property is not None:
             path = "%s.item" % self.resource.dialect.property
-        source = ijson.items(self.loader.byte_stream, path)
+        # The pure Python backend is slow so it's used only for nested arrays
+        if ijson.backend == "python" and path == "item":
+            source = chain.from_iterable(read_array_batches(self.loader.text_stream))
+        else:
+            source = ijson.items(self.loader.byte_stream, path)
         inline_dialect = InlineDialect(keys=dialect.keys)
         resource = Resource(data=source, dialect=inline_dialect)
         with system.create_parser(resource) as parser:
@@ -66,3 +74,72 @@ class JsonParser(Parser):
             json.dump(data, file, indent=2)
         loader = system.create_loader(target)
         loader.write_byte_stream(file.name)
+
+
+# Internal
+
+
+def read_array_batches(text_stream, *, chunk_size=io.DEFAULT_BUFFER_SIZE * 128):
+    # Items of a top-level array are parsed from large text chunks at once
+    decode = json.JSONDecoder(parse_float=Decimal).raw_decode
+    text = ""
+    position = 0
+    state = "start"
+    finished = False
+    while True:
+
+        # Read chunk
+        chunk = text_stream.read(chunk_size)
+        finished = not chunk
+        text = text[position:] + chunk
+        position = 0
+
+        # Parse items
+        items = []
+        while True:
+            position = WHITESPACE.match(text, position).end()
+            if position == len(text):
+                break
+            char = text[position]
+            if state == "start":
+                if char != "[":
+                    return
+                state = "first"
+                position += 1
+            elif state == "first" and char == "]":
+                state = "end"
+                break
+            elif state in ["first", "item"]:
+                try:
+                    item, end = decode(text, position)
+                except ValueError:
+                    if finished:
+                        raise
+                    break
+                # An item not followed by a delimiter (e.g. a number) might be incomplete
+                delimiter = WHITESPACE.match(text, end).end()
+                if text[delimiter : delimiter + 1] not in [",", "]"] and not finished:
+                    break
+                items.append(item)
+                position = end
+                state = "delimiter"
+            elif char in [",", "]"]:
+                state = "item" if char == "," else "end"
+                position += 1
+                if state == "end":
+                    break
+            else:
+                raise ValueError("Expecting ',' delimiter")
+
+        # Yield items
+        if items:
+            yield items
+        if state == "end":
+            return
+        if finished:
+            if state == "start":
+                return
+            raise ValueError("Incomplete JSON array")
+
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
@@ -1,8 +1,12 @@
+import json
 import tempfile
+from importlib import import_module
+from itertools import chain, islice, repeat
 from ....plugins.inline import InlineDialect
 from ....resource import Resource
 from ....parser import Parser
 from ....system import system
+from .... import settings
 from .... import helpers
 
 
@@ -30,9 +34,8 @@ class JsonlParser(Parser):
     # Read
 
     def read_list_stream_create(self):
-        jsonlines = helpers.import_from_plugin("jsonlines", plugin="json")
         dialect = self.resource.dialect
-        source = iter(jsonlines.Reader(self.loader.text_stream))
+        source = chain.from_iterable(read_line_batches(self.loader.text_stream))
         dialect = InlineDialect(keys=dialect.keys)
         resource = Resource(data=source, dialect=dialect)
         with system.create_parser(resource) as parser:
@@ -59,3 +62,32 @@ class JsonlParser(Parser):
                     writer.write(item)
         loader = system.create_loader(target)
         loader.write_byte_stream(file.name)
+
+
+# Internal
+
+
+def read_line_batches(text_stream):
+    # Lines are parsed in batches by orjson (as jsonlines does) if it's installed
+    # or by the C-accelerated json scanner falling back to jsonlines on errors
+    jsonlines = helpers.import_from_plugin("jsonlines", plugin="json")
+    scan = json.JSONDecoder().scan_once
+    try:
+        loads = import_module("orjson").loads
+    except ImportError:
+        loads = None
+    while True:
+        lines = list(islice(text_stream, settings.DEFAULT_BATCH_SIZE))
+        if not lines:
+            break
+        try:
+            if loads:
+                yield list(map(loads, lines))
+                continue
+            results = list(map(scan, lines, repeat(0)))
+            for line, (_, end) in zip(lines, results):
+                if end != len(line) and line[end:] != "\n":
+                    raise ValueError()
+            yield [item for item, _ in results]
+        except (ValueError, StopIteration):
+            yield jsonlines.Reader(lines)
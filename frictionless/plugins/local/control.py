@@ -1,3 +1,4 @@
+from ...metadata import Metadata
 from ...control import Control
 
 
@@ -10,15 +11,31 @@ class LocalControl(Control):
 
     Parameters:
         descriptor? (str|dict): descriptor
+        mmap? (bool): read uncompressed files using a memory mapping
 
     Raises:
         FrictionlessException: raise any error that occurs during the process
 
     """
 
+    def __init__(self, descriptor=None, *, mmap=None):
+        self.setinitial("mmap", mmap)
+        super().__init__(descriptor)
+
+    @Metadata.property
+    def mmap(self):
+        """
+        Returns:
+            bool: if reading using a memory mapping
+        """
+        return self.get("mmap", False)
+
     # Metadata
 
     metadata_profile = {  # type: ignore
         "type": "object",
         "additionalProperties": False,
+        "properties": {
+            "mmap": {"type": "boolean"},
+        },
     }
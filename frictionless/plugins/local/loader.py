@@ -1,6 +1,11 @@
 import io
+import os
+import mmap
+import hashlib
 from ...loader import Loader
+from ...exception import FrictionlessException
 from ... import helpers
+from ... import errors
 
 
 class LocalLoader(Loader):
@@ -15,14 +20,137 @@ class LocalLoader(Loader):
     # Read
 
     def read_byte_stream_create(self):
+        fullpath = self.read_fullpath()
+        byte_stream = io.open(fullpath, "rb")
+        if self.resource.control.mmap and not self.resource.compression:
+            try:
+                byte_stream = MappedByteStream(byte_stream)
+            except ValueError:
+                # Empty files can't be mapped
+                pass
+        return byte_stream
+
+    def read_byte_stream_process(self, byte_stream):
+        if not isinstance(byte_stream, MappedByteStream):
+            return super().read_byte_stream_process(byte_stream)
+
+        # The mapping is hashed in one pass instead of on every read
+        hasher = None
+        if self.resource.hashing:
+            try:
+                hasher = hashlib.new(self.resource.hashing)
+            except Exception as exception:
+                error = errors.HashingError(note=str(exception))
+                raise FrictionlessException(error)
+        self.resource.stats["bytes"] = byte_stream.size
+        self.resource.stats["hash"] = byte_stream.hash(hasher) if hasher else None
+        return byte_stream
+
+    def read_fingerprint(self):
+        fullpath = self.read_fullpath()
+        try:
+            stat = os.stat(fullpath)
+            with io.open(fullpath, "rb") as file:
+                head = file.read(self.resource.detector.buffer_size)
+        except OSError:
+            return None
+        digest = hashlib.md5(head).hexdigest()
+        return [os.path.abspath(fullpath), stat.st_size, stat.st_mtime_ns, digest]
+
+    def read_fullpath(self):
         scheme = "file://"
         fullpath = self.resource.fullpath
         if fullpath.startswith(scheme):
             fullpath = fullpath.replace(scheme, "", 1)
-        byte_stream = io.open(fullpath, "rb")
-        return byte_stream
+        return fullpath
 
     # Write
 
     def write_byte_stream(self, path):
         helpers.move_file(path, self.resource.fullpath)
+
+
+# Internal
+
+
+class MappedByteStream(io.RawIOBase):
+    def __init__(self, file):
+        self.__file = file
+        self.__mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__view = memoryview(self.__mapping)
+        self.__position = 0
+        self.__released = 0
+
+    @property
+    def name(self):
+        return self.__file.name
+
+    @property
+    def size(self):
+        return len(self.__view)
+
+    def hash(self, hasher):
+        for start in range(0, self.size, MAPPING_STEP):
+            hasher.update(self.__view[start : start + MAPPING_STEP])
+            self.__release(start, min(MAPPING_STEP, self.size - start))
+        return hasher.hexdigest()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        start = self.__position
+        end = self.size if size is None or size < 0 else min(start + size, self.size)
+        self.__position = end
+        chunk = self.__view[start:end].tobytes()
+        self.__advance()
+        return chunk
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+    def readinto(self, buffer):
+        start = self.__position
+        end = min(start + len(buffer), self.size)
+        buffer[: end - start] = self.__view[start:end]
+        self.__position = end
+        self.__advance()
+        return end - start
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self.__position = max(offset, 0)
+        self.__released = min(self.__released, self.__position)
+        self.__released -= self.__released % MAPPING_STEP
+        return self.__position
+
+    def tell(self):
+        return self.__position
+
+    def close(self):
+        if not self.closed:
+            self.__view.release()
+            self.__mapping.close()
+            self.__file.close()
+        super().close()
+
+    # Pages that were already read don't need to stay resident
+
+    def __advance(self):
+        end = self.__position - self.__position % MAPPING_STEP
+        if end > self.__released:
+            self.__release(self.__released, end - self.__released)
+            self.__released = end
+
+    def __release(self, start, length):
+        if hasattr(mmap, "MADV_DONTNEED"):
+            self.__mapping.madvise(mmap.MADV_DONTNEED, start, length)
+
+
+MAPPING_STEP = mmap.ALLOCATIONGRANULARITY * 256
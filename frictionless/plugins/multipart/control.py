@@ -11,25 +11,33 @@ class MultipartControl(Control):
 
     Parameters:
         descriptor? (str|dict): descriptor
+        chunk_size? (int): size of the parts written
+        prefetch? (int): how many parts to read ahead in threads (0 to disable)
 
     Raises:
         FrictionlessException: raise any error that occurs during the process
 
     """
 
-    def __init__(self, descriptor=None, chunk_size=None):
+    def __init__(self, descriptor=None, chunk_size=None, prefetch=None):
         self.setinitial("chunkSize", chunk_size)
+        self.setinitial("prefetch", prefetch)
         super().__init__(descriptor)
 
     @property
     def chunk_size(self):
         return self.get("chunkSize", settings.DEFAULT_CHUNK_SIZE)
 
+    @property
+    def prefetch(self):
+        return self.get("prefetch", settings.DEFAULT_PREFETCH)
+
     # Expand
 
     def expand(self):
         """Expand metadata"""
         self.setdefault("chunkSize", self.chunk_size)
+        self.setdefault("prefetch", self.prefetch)
 
     # Metadata
 
@@ -38,5 +46,6 @@ class MultipartControl(Control):
         "additionalProperties": False,
         "properties": {
             "chunkSize": {"type": "number"},
+            "prefetch": {"type": "integer", "minimum": 0},
         },
     }
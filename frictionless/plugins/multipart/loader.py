@@ -1,8 +1,14 @@
+import io
 import tempfile
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from ...resource import Resource
 from ...loader import Loader
 from ...system import system
+from ... import settings as global_settings
 from ... import helpers
+from . import settings
 
 
 # NOTE:
@@ -26,7 +32,13 @@ class MultipartLoader(Loader):
         remote = self.resource.remote
         headless = self.resource.get("layout", {}).get("header") is False
         headless = headless or self.resource.format != "csv"
-        byte_stream = MultipartByteStream(fullpath, remote=remote, headless=headless)
+        byte_stream = MultipartByteStream(
+            fullpath,
+            remote=remote,
+            headless=headless,
+            prefetch=self.resource.control.prefetch,
+            replay_size=self.resource.detector.buffer_size,
+        )
         return byte_stream
 
     # Write
@@ -48,17 +60,51 @@ class MultipartLoader(Loader):
 
 
 class MultipartByteStream:
-    def __init__(self, path, *, remote, headless):
+    """Byte stream concatenating the parts
+
+    The first line of every part except the first one is skipped for
+    sources having a header. If `prefetch` is set, the next parts are read
+    in threads while the current one is consumed (the order is preserved).
+    The bytes read from the beginning are kept up to the replay size
+    so rewinding within this prefix (e.g. after sampling the buffer) is free.
+    """
+
+    def __init__(
+        self,
+        path,
+        *,
+        remote,
+        headless,
+        prefetch=0,
+        replay_size=global_settings.DEFAULT_BUFFER_SIZE,
+    ):
         self.__path = path
         self.__remote = remote
         self.__headless = headless
-        self.__line_stream = self.read_line_stream()
+        self.__prefetch = prefetch
+        self.__replay_size = replay_size
+        self.__block_stream = None
+        self.__closed = False
+        self.__restart()
 
     def __enter__(self):
         return self
 
     def __exit__(self, *args, **kwargs):
-        pass
+        self.close()
+
+    def __iter__(self):
+        # A line can cross the blocks so its beginning is carried over
+        line = b""
+        while True:
+            bytes = self.read(settings.DEFAULT_BLOCK_SIZE)
+            if not bytes:
+                break
+            *lines, line = (line + bytes).split(b"\n")
+            for item in lines:
+                yield item + b"\n"
+        if line:
+            yield line
 
     @property
     def remote(self):
@@ -66,7 +112,7 @@ class MultipartByteStream:
 
     @property
     def closed(self):
-        return False
+        return self.__closed
 
     def readable(self):
         return True
@@ -78,33 +124,150 @@ class MultipartByteStream:
         return False
 
     def close(self):
-        pass
+        self.__block_stream.close()
+        self.__closed = True
 
     def flush(self):
         pass
 
-    def read1(self, size):
-        return self.read(size)
+    def tell(self):
+        return self.__position
 
-    def seek(self, offset):
-        assert offset == 0
-        self.__line_stream = self.read_line_stream()
+    def read(self, size=-1):
+        size = -1 if size is None else size
+        chunks = []
+        while size:
+            chunk = self.read1(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
 
-    def read(self, size):
-        res = b""
-        while True:
-            try:
-                res += next(self.__line_stream)
-            except StopIteration:
+    def read1(self, size=-1):
+        size = -1 if size is None else size
+        if not size:
+            return b""
+
+        # Replay
+        if self.__position < self.__offset:
+            end = (
+                self.__offset if size < 0 else min(self.__offset, self.__position + size)
+            )
+            chunk = bytes(self.__replay[self.__position : end])
+            self.__position = end
+            return chunk
+
+        # Blocks
+        while not self.__buffer:
+            block = next(self.__block_stream, None)
+            if block is None:
+                return b""
+            self.__buffer = memoryview(block)
+        chunk = bytes(self.__buffer[:size] if size > 0 else self.__buffer)
+        self.__buffer = self.__buffer[len(chunk) :]
+        self.__offset += len(chunk)
+        self.__position = self.__offset
+        if self.__replay is not None:
+            if self.__offset <= self.__replay_size:
+                self.__replay += chunk
+            else:
+                self.__replay = None
+        return chunk
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("only seeking from the start is supported")
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+
+        # Replay
+        if offset == self.__offset or (
+            offset < self.__offset and self.__replay is not None
+        ):
+            self.__position = offset
+            return offset
+
+        # Restart
+        if offset < self.__offset:
+            self.__restart()
+        while self.__position < offset:
+            if not self.read1(offset - self.__position):
                 break
-            if len(res) > size:
+        return self.__position
+
+    # Helpers
+
+    def __restart(self):
+        if self.__block_stream is not None:
+            self.__block_stream.close()
+        self.__block_stream = self.read_block_stream()
+        self.__buffer = memoryview(b"")
+        self.__replay = bytearray()
+        self.__position = 0
+        self.__offset = 0
+
+    def read_block_stream(self):
+        for number, block_stream in enumerate(self.read_part_stream(), start=1):
+            if not self.__headless and number > 1:
+                block_stream = skip_first_line(block_stream)
+            yield from block_stream
+
+    def read_part_stream(self):
+        """Yield the block streams of the parts in order"""
+        if not self.__prefetch:
+            for path in self.__path:
+                yield read_part_blocks(path)
+            return
+
+        # Prefetch
+        # Parts are read entirely in threads up to the prefetch size
+        # and the pending ones are cancelled if the stream is closed
+        futures = deque()
+        paths = iter(self.__path)
+        with ThreadPoolExecutor(max_workers=self.__prefetch) as executor:
+            try:
+                while True:
+                    for path in islice(paths, self.__prefetch + 1 - len(futures)):
+                        futures.append(executor.submit(read_part_bytes, path))
+                    if not futures:
+                        break
+                    yield [futures.popleft().result()]
+            finally:
+                for future in futures:
+                    future.cancel()
+
+
+def read_part_blocks(path):
+    with system.create_loader(Resource(path=path)) as loader:
+        while True:
+            block = loader.byte_stream.read1(settings.DEFAULT_BLOCK_SIZE)
+            if not block:
                 break
-        return res
-
-    def read_line_stream(self):
-        for number, path in enumerate(self.__path, start=1):
-            with system.create_loader(Resource(path=path)) as loader:
-                for line_number, line in enumerate(loader.byte_stream, start=1):
-                    if not self.__headless and number > 1 and line_number == 1:
-                        continue
-                    yield line
+            yield block
+
+
+def read_part_bytes(path):
+    with system.create_loader(Resource(path=path)) as loader:
+        return loader.byte_stream.read()
+
+
+def skip_first_line(block_stream):
+    """Skip bytes up to the first line break (CRLF can be split between blocks)"""
+    block_stream = iter(block_stream)
+    for block in block_stream:
+        indexes = [index for index in map(block.find, [b"\n", b"\r"]) if index != -1]
+        if not indexes:
+            continue
+        index = min(indexes)
+        if block[index : index + 2] == b"\r\n":
+            index += 1
+        elif block[index : index + 1] == b"\r" and index + 1 == len(block):
+            block = next(block_stream, b"")
+            index = 0 if block[:1] == b"\n" else -1
+        yield block[index + 1 :]
+        break
+    yield from block_stream
@@ -2,3 +2,5 @@
 
 
 DEFAULT_CHUNK_SIZE = 100000000
+DEFAULT_PREFETCH = 0
+DEFAULT_BLOCK_SIZE = 65536
@@ -1,9 +1,9 @@
 import isodate
 import datetime
-import decimal
 from ...parser import Parser
 from ...schema import Schema
 from ...field import Field
+from ... import settings
 from ... import helpers
 
 
@@ -23,7 +23,6 @@ class PandasParser(Parser):
     # Read
 
     def read_list_stream_create(self):
-        np = helpers.import_from_plugin("numpy", plugin="pandas")
         dataframe = self.resource.data
 
         # Schema
@@ -31,20 +30,25 @@ class PandasParser(Parser):
         if not self.resource.schema:
             self.resource.schema = schema
 
+        # Columns
+        columns = []
+        for field in schema.fields:
+            if field.name in schema.primary_key:
+                level = schema.primary_key.index(field.name)
+                column = dataframe.index.get_level_values(level).to_series()
+            else:
+                column = dataframe[field.name]
+            columns.append(column)
+
         # Lists
+        # Columns are converted to Python objects by batches
         yield schema.field_names
-        for pk, item in dataframe.iterrows():
-            cells = []
-            for field in schema.fields:
-                if field.name in schema.primary_key:
-                    pk = pk if isinstance(pk, tuple) else [pk]
-                    value = pk[schema.primary_key.index(field.name)]
-                else:
-                    value = item[field.name]
-                if field.type == "number" and np.isnan(value):
-                    value = None
-                cells.append(value)
-            yield cells
+        size = settings.DEFAULT_BATCH_SIZE
+        for start in range(0, len(dataframe), size):
+            batch = [
+                read_column_cells(column.iloc[start : start + size]) for column in columns
+            ]
+            yield from map(list, zip(*batch))
 
     def __read_convert_schema(self):
         dataframe = self.resource.data
@@ -106,82 +110,39 @@ class PandasParser(Parser):
     # Write
 
     def write_row_stream(self, resource):
-        np = helpers.import_from_plugin("numpy", plugin="pandas")
         pd = helpers.import_from_plugin("pandas", plugin="pandas")
         source = resource
         target = self.resource
 
-        # Get data/index
-        data_rows = []
-        index_rows = []
-        fixed_types = {}
+        # Get columns
         with source:
+            columns = {field.name: [] for field in source.schema.fields}
+            appends = [columns[name].append for name in source.schema.field_names]
             for row in source.row_stream:
-                data_values = []
-                index_values = []
-                for field in source.schema.fields:
-                    value = row[field.name]
-                    if isinstance(value, float) and np.isnan(value):
-                        value = None
-                    if isinstance(value, decimal.Decimal):
-                        value = float(value)
-                    # http://pandas.pydata.org/pandas-docs/stable/gotchas.html#support-for-integer-na
-                    if value is None and field.type in ("number", "integer"):
-                        fixed_types[field.name] = "number"
-                        value = np.NaN
-                    if field.name in source.schema.primary_key:
-                        index_values.append(value)
-                    else:
-                        data_values.append(value)
-
-                if len(source.schema.primary_key) == 1:
-                    index_rows.append(index_values[0])
-                elif len(source.schema.primary_key) > 1:
-                    index_rows.append(tuple(index_values))
-                data_rows.append(tuple(data_values))
+                for append, cell in zip(appends, row.to_list()):
+                    append(cell)
+        for field in source.schema.fields:
+            columns[field.name] = write_column_cells(field, columns[field.name])
 
         # Create index
-        pd = helpers.import_from_plugin("pandas", plugin="pandas")
-
         index = None
         if source.schema.primary_key:
             if len(source.schema.primary_key) == 1:
                 index_class = pd.Index
                 index_field = source.schema.get_field(source.schema.primary_key[0])
                 index_dtype = self.__write_convert_type(index_field.type)
+                index_rows = columns.pop(index_field.name)
                 if index_field.type in ["datetime", "date"]:
                     index_class = pd.DatetimeIndex
                     index_rows = pd.to_datetime(index_rows, utc=True)
                 index = index_class(index_rows, name=index_field.name, dtype=index_dtype)
 
             elif len(source.schema.primary_key) > 1:
-                index = pd.MultiIndex.from_tuples(
-                    index_rows, names=source.schema.primary_key
-                )
-
-        # Create dtypes/columns
-        columns = []
-        for field in source.schema.fields:
-            if field.name not in source.schema.primary_key:
-                columns.append(field.name)
+                arrays = [columns.pop(name) for name in source.schema.primary_key]
+                index = pd.MultiIndex.from_arrays(arrays, names=source.schema.primary_key)
 
         # Create/set dataframe
-        dataframe = pd.DataFrame(data_rows, index=index, columns=columns)
-
-        # This step will see if there is any column for which the schema is defined
-        # as 'integer' but Pandas inferred it as a float. This can happen if there
-        # is an empty value (represented as Not a Number) is the integer column.
-        # If the column is of type float instead of integer, convert it to the type
-        # Int64 from pandas that supports NaN.
-        # Bug: #1109
-        for field in source.schema.fields:
-            if (
-                field.type == "integer"
-                and field.name in dataframe.columns
-                and str(dataframe.dtypes[field.name]) != "int64"
-            ):
-                dataframe[field.name] = dataframe[field.name].astype("Int64")
-
+        dataframe = pd.DataFrame(columns, index=index)
         target.data = dataframe
 
     def __write_convert_type(self, type=None):
@@ -205,3 +166,41 @@ class PandasParser(Parser):
 
         # Return mapping
         return mapping
+
+
+# Internal
+
+
+def read_column_cells(column):
+    if column.hasnans:
+        column = column.astype(object).where(column.notna(), None)
+    return column.tolist()
+
+
+def write_column_cells(field, cells):
+    np = helpers.import_from_plugin("numpy", plugin="pandas")
+    pd = helpers.import_from_plugin("pandas", plugin="pandas")
+    missing = None in cells
+
+    # Integer
+    # http://pandas.pydata.org/pandas-docs/stable/gotchas.html#support-for-integer-na
+    if field.type in ["integer", "year"]:
+        try:
+            return (
+                pd.array(cells, dtype="Int64") if missing else np.array(cells, dtype=int)
+            )
+        except (OverflowError, TypeError):
+            return pd.array(cells, dtype=object)
+
+    # Number
+    elif field.type == "number":
+        return pd.array(cells, dtype=float)
+
+    # Boolean
+    elif field.type == "boolean":
+        return (
+            pd.array(cells, dtype="boolean") if missing else np.array(cells, dtype=bool)
+        )
+
+    # Other
+    return cells
@@ -0,0 +1,3 @@
+from .plugin import ParquetPlugin
+from .dialect import ParquetDialect
+from .parser import ParquetParser
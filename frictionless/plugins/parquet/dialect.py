@@ -0,0 +1,59 @@
+from ...metadata import Metadata
+from ...dialect import Dialect
+from . import settings
+
+
+class ParquetDialect(Dialect):
+    """Parquet dialect representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless.plugins.parquet import ParquetDialect`
+
+    Parameters:
+        descriptor? (str|dict): descriptor
+        row_group_size? (int): how many rows to write to a row group (record batch)
+        compression? (str): compression codec to write with e.g. "snappy" or "zstd"
+
+    Raises:
+        FrictionlessException: raise any error that occurs during the process
+
+    """
+
+    def __init__(self, descriptor=None, *, row_group_size=None, compression=None):
+        self.setinitial("rowGroupSize", row_group_size)
+        self.setinitial("compression", compression)
+        super().__init__(descriptor)
+
+    @Metadata.property
+    def row_group_size(self):
+        """
+        Returns:
+            int: row group size
+        """
+        return self.get("rowGroupSize", settings.DEFAULT_ROW_GROUP_SIZE)
+
+    @Metadata.property
+    def compression(self):
+        """
+        Returns:
+            str?: compression
+        """
+        return self.get("compression")
+
+    # Expand
+
+    def expand(self):
+        """Expand metadata"""
+        self.setdefault("rowGroupSize", self.row_group_size)
+
+    # Metadata
+
+    metadata_profile = {  # type: ignore
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "rowGroupSize": {"type": "integer", "minimum": 1},
+            "compression": {"type": "string"},
+        },
+    }
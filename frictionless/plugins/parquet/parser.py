@@ -0,0 +1,351 @@
+import json
+import shutil
+import tempfile
+from itertools import islice, repeat
+from ...exception import FrictionlessException
+from ...resource import Resource
+from ...parser import Parser
+from ...schema import Schema
+from ...field import Field
+from ...system import system
+from ... import settings as global_settings
+from ... import helpers
+from ... import errors
+from . import settings
+
+
+class ParquetParser(Parser):
+    """Parquet and Arrow IPC (Feather) parser implementation.
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless.plugins.parquet import ParquetParser`
+
+    """
+
+    requires_loader = True
+    supported_types = [
+        "boolean",
+        "date",
+        "datetime",
+        "integer",
+        "number",
+        "string",
+        "time",
+        "year",
+    ]
+
+    # Read
+
+    def read_loader(self):
+        loader = system.create_loader(self.resource)
+        if not loader.remote:
+            return loader.open()
+
+        # Remote
+        # Columnar files are read from the footer so we need a seekable local copy
+        # https://docs.python.org/3.5/library/tempfile.html#tempfile.TemporaryFile
+        with loader as loader:
+            target = tempfile.NamedTemporaryFile()
+            shutil.copyfileobj(loader.byte_stream, target)
+            target.seek(0)
+        resource = Resource(path=target, stats=self.resource.stats)
+        loader = system.create_loader(resource)
+        return loader.open()
+
+    def read_list_stream_create(self):
+        pa = helpers.import_from_plugin("pyarrow", plugin="parquet")
+        layout = self.resource.layout
+
+        # Open file
+        try:
+            if self.resource.format == "parquet":
+                pq = helpers.import_from_plugin("pyarrow.parquet", plugin="parquet")
+                file = pq.ParquetFile(self.loader.byte_stream)
+                arrow_schema = file.schema_arrow
+            else:
+                file = pa.ipc.open_file(self.loader.byte_stream)
+                arrow_schema = file.schema
+        except pa.ArrowException as exception:
+            note = f'invalid {self.resource.format} file "{self.resource.path}"'
+            raise FrictionlessException(errors.FormatError(note=note)) from exception
+
+        # Pushdown
+        # The layout still filters the stream so here we only skip reading
+        # columns and rows that can't pass it (skipped rows are emitted
+        # as empty lists the layout filters out to keep the row positions)
+        names = arrow_schema.names
+        prefixes = self.__read_pushdown_rows(arrow_schema)
+        positions = self.__read_pushdown_fields(names)
+
+        # Schema
+        # If picked fields are not known in advance the schema is detected
+        schema = self.__read_convert_schema(arrow_schema)
+        if positions:
+            schema.fields = [schema.fields[position - 1] for position in positions]
+        if not self.resource.schema and (positions or not layout.is_field_filtering):
+            self.resource.schema = schema
+
+        # Batches
+        if positions and prefixes:
+            positions = sorted(set(positions + [1]))
+        columns = [names[position - 1] for position in positions or []]
+        batch_size = global_settings.DEFAULT_BATCH_SIZE
+        if layout.limit_rows and not prefixes:
+            offset = (layout.offset_rows or 0) + max(layout.header_rows, default=0)
+            batch_size = min(batch_size, layout.limit_rows + offset)
+        if self.resource.format == "parquet":
+            row_groups = self.__read_pushdown_row_groups(file, prefixes)
+            batches = self.__read_parquet_batches(
+                file, batch_size=batch_size, row_groups=row_groups, columns=columns
+            )
+        else:
+            batches = self.__read_ipc_batches(file, batch_size=batch_size)
+            if columns:
+                batches = (batch.select(columns) for batch in batches)
+
+        # Lists
+        yield names
+        for batch in batches:
+            if isinstance(batch, int):
+                yield from repeat([], batch)
+                continue
+            size = batch.num_rows
+            if prefixes:
+                batch, indices = self.__read_filter_batch(batch, prefixes)
+            if not positions:
+                cells = [read_column_cells(column) for column in batch.columns]
+            else:
+                cells = [repeat(None)] * len(names)
+                for position, column in zip(positions, batch.columns):
+                    cells[position - 1] = read_column_cells(column)
+            lists = map(list, zip(*cells))
+            if prefixes:
+                lists = read_placed_lists(lists, indices=indices, size=size)
+            yield from lists
+
+    def __read_parquet_batches(self, file, *, batch_size, row_groups, columns):
+        options = dict(batch_size=batch_size, columns=columns or None)
+        if row_groups is None:
+            yield from file.iter_batches(**options)
+            return
+        # Skipped row groups are yielded as their number of rows
+        for index in range(file.num_row_groups):
+            if index not in row_groups:
+                yield file.metadata.row_group(index).num_rows
+                continue
+            yield from file.iter_batches(row_groups=[index], **options)
+
+    def __read_ipc_batches(self, file, *, batch_size):
+        for index in range(file.num_record_batches):
+            batch = file.get_batch(index)
+            for offset in range(0, batch.num_rows, batch_size):
+                yield batch.slice(offset, batch_size)
+
+    def __read_convert_schema(self, arrow_schema):
+        schema = Schema()
+        for arrow_field in arrow_schema:
+            metadata = arrow_field.metadata or {}
+            descriptor = metadata.get(settings.FIELD_METADATA_KEY)
+            if descriptor:
+                field = Field(json.loads(descriptor))
+            else:
+                type = self.__read_convert_type(arrow_field.type)
+                field = Field(name=arrow_field.name, type=type)
+                if not arrow_field.nullable:
+                    field.required = True
+            schema.fields.append(field)
+        return schema
+
+    def __read_convert_type(self, arrow_type):
+        pa = helpers.import_from_plugin("pyarrow", plugin="parquet")
+
+        # Dictionary
+        if pa.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+
+        # Mapping
+        mapping = [
+            ("boolean", pa.types.is_boolean),
+            ("integer", pa.types.is_integer),
+            ("number", pa.types.is_floating),
+            ("number", pa.types.is_decimal),
+            ("datetime", pa.types.is_timestamp),
+            ("date", pa.types.is_date),
+            ("time", pa.types.is_time),
+            ("duration", pa.types.is_duration),
+            ("array", pa.types.is_list),
+            ("array", pa.types.is_large_list),
+            ("array", pa.types.is_fixed_size_list),
+            ("object", pa.types.is_struct),
+            ("object", pa.types.is_map),
+            ("any", pa.types.is_null),
+        ]
+
+        # Return type
+        for type, check in mapping:
+            if check(arrow_type):
+                return type
+        return "string"
+
+    def __read_pushdown_fields(self, names):
+        layout = self.resource.layout
+        if not layout.is_field_filtering or not layout.header:
+            return None
+        if layout.header_rows != global_settings.DEFAULT_HEADER_ROWS:
+            return None
+        if not layout.read_filter_rows(names, row_position=1):
+            return None
+        positions = layout.read_labels([names])[1]
+        return positions or None
+
+    def __read_pushdown_rows(self, arrow_schema):
+        pa = helpers.import_from_plugin("pyarrow", plugin="parquet")
+        layout = self.resource.layout
+        if not layout.pick_rows or layout.skip_rows:
+            return None
+        if not len(arrow_schema) or not pa.types.is_string(arrow_schema.types[0]):
+            return None
+        for item in layout.pick_rows_compiled:
+            if not isinstance(item, str) or item in ["", "<blank>"]:
+                return None
+        return list(layout.pick_rows_compiled)
+
+    def __read_pushdown_row_groups(self, file, prefixes):
+        if not prefixes:
+            return None
+        row_groups = []
+        for index in range(file.num_row_groups):
+            stats = file.metadata.row_group(index).column(0).statistics
+            if stats is not None and stats.has_min_max:
+                for prefix in prefixes:
+                    if stats.max >= prefix and stats.min[: len(prefix)] <= prefix:
+                        break
+                else:
+                    continue
+            row_groups.append(index)
+        return row_groups
+
+    def __read_filter_batch(self, batch, prefixes):
+        pc = helpers.import_from_plugin("pyarrow.compute", plugin="parquet")
+        mask = None
+        for prefix in prefixes:
+            match = pc.starts_with(batch.column(0), prefix)
+            mask = match if mask is None else pc.or_(mask, match)
+        mask = pc.fill_null(mask, False)
+        indices = pc.indices_nonzero(mask).to_pylist()
+        return batch.filter(mask), indices
+
+    # Write
+
+    def write_row_stream(self, resource):
+        pa = helpers.import_from_plugin("pyarrow", plugin="parquet")
+        source = resource
+        target = self.resource
+        dialect = target.dialect
+        writer = None
+        try:
+            with source:
+                row_stream = iter(source.row_stream)
+                while True:
+                    rows = islice(row_stream, dialect.row_group_size)
+                    columns = list(zip(*(row.to_list() for row in rows)))
+                    if writer is None:
+                        arrow_schema = self.__write_convert_schema(source, columns)
+                        writer = self.__write_create_writer(arrow_schema)
+                    if not columns:
+                        break
+                    arrays = []
+                    for field, arrow_field, cells in zip(
+                        source.schema.fields, arrow_schema, columns
+                    ):
+                        cells = self.__write_convert_cells(field, cells)
+                        arrays.append(pa.array(cells, type=arrow_field.type))
+                    batch = pa.RecordBatch.from_arrays(arrays, schema=arrow_schema)
+                    if target.format == "parquet":
+                        writer.write_batch(batch, row_group_size=dialect.row_group_size)
+                    else:
+                        writer.write_batch(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def __write_create_writer(self, arrow_schema):
+        pa = helpers.import_from_plugin("pyarrow", plugin="parquet")
+        target = self.resource
+        dialect = target.dialect
+        helpers.ensure_dir(target.fullpath)
+        if target.format == "parquet":
+            pq = helpers.import_from_plugin("pyarrow.parquet", plugin="parquet")
+            options = {}
+            if dialect.compression:
+                options["compression"] = dialect.compression
+            return pq.ParquetWriter(target.fullpath, arrow_schema, **options)
+        options = pa.ipc.IpcWriteOptions(compression=dialect.compression)
+        return pa.ipc.new_file(target.fullpath, arrow_schema, options=options)
+
+    def __write_convert_schema(self, source, columns):
+        pa = helpers.import_from_plugin("pyarrow", plugin="parquet")
+        arrow_fields = []
+        for index, field in enumerate(source.schema.fields):
+            arrow_type = self.__write_convert_type(field.type)
+            if field.type == "datetime" and columns:
+                cells = (cell for cell in columns[index] if cell is not None)
+                cell = next(cells, None)
+                if cell is not None and cell.tzinfo is not None:
+                    arrow_type = pa.timestamp("us", tz="UTC")
+            # The descriptor keeps types and constraints that Arrow doesn't have
+            metadata = {settings.FIELD_METADATA_KEY: json.dumps(field.to_dict())}
+            arrow_field = pa.field(field.name, arrow_type, metadata=metadata)
+            arrow_fields.append(arrow_field)
+        return pa.schema(arrow_fields)
+
+    def __write_convert_type(self, type=None):
+        pa = helpers.import_from_plugin("pyarrow", plugin="parquet")
+
+        # Mapping
+        mapping = {
+            "boolean": pa.bool_(),
+            "date": pa.date32(),
+            "datetime": pa.timestamp("us"),
+            "integer": pa.int64(),
+            "number": pa.float64(),
+            "time": pa.time64("us"),
+            "year": pa.int64(),
+        }
+
+        # Return type
+        if type:
+            return mapping.get(type, pa.string())
+
+        # Return mapping
+        return mapping
+
+    def __write_convert_cells(self, field, cells):
+        if field.type == "number":
+            return [None if cell is None else float(cell) for cell in cells]
+        if field.type not in self.__write_convert_type():
+            return [None if cell is None else field.write_cell(cell)[0] for cell in cells]
+        return cells
+
+
+# Internal
+
+
+def read_column_cells(column):
+    pa = helpers.import_from_plugin("pyarrow", plugin="parquet")
+    if not column.null_count:
+        type = column.type
+        if pa.types.is_integer(type) or pa.types.is_floating(type):
+            return column.to_numpy().tolist()
+    return column.to_pylist()
+
+
+def read_placed_lists(lists, *, indices, size):
+    # Lists filtered out of a batch are replaced by empty ones
+    position = 0
+    for index, cells in zip(indices, lists):
+        yield from repeat([], index - position)
+        yield cells
+        position = index + 1
+    yield from repeat([], size - position)
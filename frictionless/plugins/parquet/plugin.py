@@ -0,0 +1,25 @@
+from ...plugin import Plugin
+from .dialect import ParquetDialect
+from .parser import ParquetParser
+from . import settings
+
+
+class ParquetPlugin(Plugin):
+    """Plugin for Parquet and Arrow IPC (Feather)
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless.plugins.parquet import ParquetPlugin`
+
+    """
+
+    code = "parquet"
+    status = "experimental"
+
+    def create_dialect(self, resource, *, descriptor):
+        if resource.format in settings.FORMATS:
+            return ParquetDialect(descriptor)
+
+    def create_parser(self, resource):
+        if resource.format in settings.FORMATS:
+            return ParquetParser(resource)
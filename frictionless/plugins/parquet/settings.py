@@ -0,0 +1,6 @@
+# General
+
+
+FORMATS = ["parquet", "arrow", "feather"]
+DEFAULT_ROW_GROUP_SIZE = 65536
+FIELD_METADATA_KEY = b"frictionless"
@@ -16,6 +16,7 @@ class RemoteControl(Control):
         http_session? (requests.Session): user defined HTTP session
         http_preload? (bool): don't use HTTP streaming and preload all the data
         http_timeout? (int): user defined HTTP timeout in minutes
+        http_read_ahead? (int): how many blocks to read ahead in a thread (0 to disable)
 
     Raises:
         FrictionlessException: raise any error that occurs during the process
@@ -29,10 +30,12 @@ class RemoteControl(Control):
         http_session=None,
         http_preload=None,
         http_timeout=None,
+        http_read_ahead=None,
     ):
         self.setinitial("httpSession", http_session)
         self.setinitial("httpPreload", http_preload)
         self.setinitial("httpTimeout", http_timeout)
+        self.setinitial("httpReadAhead", http_read_ahead)
         super().__init__(descriptor)
 
     @Metadata.property
@@ -62,12 +65,21 @@ class RemoteControl(Control):
         """
         return self.get("httpTimeout", settings.DEFAULT_HTTP_TIMEOUT)
 
+    @Metadata.property
+    def http_read_ahead(self):
+        """
+        Returns:
+            int: HTTP read-ahead in blocks
+        """
+        return self.get("httpReadAhead", settings.DEFAULT_HTTP_READ_AHEAD)
+
     # Expand
 
     def expand(self):
         """Expand metadata"""
         self.setdefault("httpPreload", self.http_preload)
         self.setdefault("httpTimeout", self.http_timeout)
+        self.setdefault("httpReadAhead", self.http_read_ahead)
 
     # Metadata
 
@@ -78,5 +90,6 @@ class RemoteControl(Control):
             "httpSession": {},
             "httpPreload": {"type": "boolean"},
             "httpTimeout": {"type": "number"},
+            "httpReadAhead": {"type": "integer", "minimum": 0},
         },
     }
@@ -1,6 +1,11 @@
 import io
+import queue
+import socket
+import threading
 import requests.utils
 from ...loader import Loader
+from ... import settings as global_settings
+from . import settings
 
 
 class RemoteLoader(Loader):
@@ -20,7 +25,13 @@ class RemoteLoader(Loader):
         fullpath = requests.utils.requote_uri(self.resource.fullpath)
         session = self.resource.control.http_session
         timeout = self.resource.control.http_timeout
-        byte_stream = RemoteByteStream(fullpath, session=session, timeout=timeout).open()
+        byte_stream = RemoteByteStream(
+            fullpath,
+            session=session,
+            timeout=timeout,
+            replay_size=self.resource.detector.buffer_size,
+            read_ahead=self.resource.control.http_read_ahead,
+        ).open()
         if self.resource.control.http_preload:
             buffer = io.BufferedRandom(io.BytesIO())
             buffer.write(byte_stream.read())
@@ -28,6 +39,22 @@ class RemoteLoader(Loader):
             byte_stream = buffer
         return byte_stream
 
+    def read_fingerprint(self):
+        fullpath = requests.utils.requote_uri(self.resource.fullpath)
+        session = self.resource.control.http_session
+        timeout = self.resource.control.http_timeout
+        try:
+            response = session.head(fullpath, allow_redirects=True, timeout=timeout)
+            response.raise_for_status()
+        except requests.RequestException:
+            return None
+        etag = response.headers.get("ETag")
+        modified = response.headers.get("Last-Modified")
+        if not etag and not modified:
+            return None
+        length = response.headers.get("Content-Length")
+        return [fullpath, etag, modified, length]
+
     # Write
 
     def write_byte_stream_save(self, byte_stream):
@@ -42,10 +69,32 @@ class RemoteLoader(Loader):
 
 
 class RemoteByteStream:
-    def __init__(self, source, *, session, timeout):
+    """Seekable byte stream reading a remote source with a single request
+
+    The bytes read from the beginning are kept up to the replay size
+    so rewinding within this prefix (e.g. after sampling the buffer) is free.
+    Other seeks are made using HTTP Range requests if the server supports them
+    and by restarting the request otherwise. If `read_ahead` is set, a thread
+    reads up to this number of blocks ahead of the consumer.
+    """
+
+    def __init__(
+        self,
+        source,
+        *,
+        session,
+        timeout,
+        replay_size=global_settings.DEFAULT_BUFFER_SIZE,
+        read_ahead=0,
+    ):
         self.__source = source
         self.__session = session
         self.__timeout = timeout
+        self.__replay_size = replay_size
+        self.__read_ahead = read_ahead
+        self.__response = None
+        self.__reader = None
+        self.__closed = True
 
     def __iter__(self):
         while True:
@@ -67,33 +116,228 @@ class RemoteByteStream:
     def closed(self):
         return self.__closed
 
+    @property
+    def length(self):
+        """
+        Returns:
+            int?: length of the source if it's known
+        """
+        return self.__length
+
+    @property
+    def ranges(self):
+        """
+        Returns:
+            bool: whether the server supports range requests
+        """
+        return self.__ranges
+
     def open(self):
         self.__closed = False
-        self.seek(0)
+        self.__replay = bytearray()
+        self.__position = 0
+        self.__offset = 0
+        self.__length = None
+        self.__ranges = False
+        self.__request(0)
         return self
 
     def close(self):
+        self.__release()
         self.__closed = True
 
     def tell(self):
-        return self.__response.raw.tell()
+        return self.__position
 
     def flush(self):
         pass
 
     def read(self, size=-1):
-        if size == -1:
-            size = None
-        return self.__response.raw.read(size)
+        size = -1 if size is None else size
+        chunk = b""
+
+        # Replay
+        if self.__position < self.__offset:
+            end = (
+                self.__offset if size < 0 else min(self.__offset, self.__position + size)
+            )
+            chunk = bytes(self.__replay[self.__position : end])
+            self.__position = end
+            if size >= 0:
+                size -= len(chunk)
+            if not size:
+                return chunk
+
+        # Request
+        data = b""
+        if self.__reader:
+            data = self.__reader.read(None if size < 0 else size)
+        self.__offset += len(data)
+        self.__position = self.__offset
+        if self.__replay is not None:
+            if self.__offset <= self.__replay_size:
+                self.__replay += data
+            else:
+                self.__replay = None
+        return chunk + data if chunk else data
 
     def read1(self, size=-1):
         return self.read(size)
 
-    def seek(self, offset, whence=0):
-        assert offset == 0
-        assert whence == 0
-        self.__response = self.__session.get(
-            self.__source, stream=True, timeout=self.__timeout
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence == io.SEEK_END:
+            if self.__length is None:
+                raise io.UnsupportedOperation("the source length is not known")
+            offset += self.__length
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+
+        # Replay
+        if offset == self.__offset or (
+            offset < self.__offset and self.__replay is not None
+        ):
+            self.__position = offset
+            return offset
+
+        # Request
+        # Without range requests we read forward or restart the request
+        if self.__ranges or offset < self.__offset:
+            self.__request(offset)
+        self.__position = self.__offset
+        self.__skip(offset - self.__offset)
+        return offset
+
+    # Helpers
+
+    def __request(self, offset):
+        self.__release()
+        headers = {}
+        if offset and self.__ranges:
+            headers["Range"] = f"bytes={offset}-"
+        response = self.__session.get(
+            self.__source, stream=True, timeout=self.__timeout, headers=headers
         )
-        self.__response.raise_for_status()
-        self.__response.raw.decode_content = True
+        if response.status_code == 416:
+            response.close()
+            self.__offset = self.__position = offset
+            self.__replay = None
+            return
+        response.raise_for_status()
+        response.raw.decode_content = True
+        self.__response = response
+
+        # Offset
+        # A server can ignore the Range header returning the whole source
+        self.__offset = offset if response.status_code == 206 else 0
+        self.__position = self.__offset
+        self.__replay = bytearray() if not self.__offset else None
+
+        # Ranges
+        # We only use ranges for sources without content encoding
+        # as ranges apply to encoded bytes while we read decoded ones
+        if response.status_code == 200:
+            encoding = response.headers.get("Content-Encoding", "identity")
+            if encoding == "identity":
+                length = response.headers.get("Content-Length")
+                self.__length = int(length) if length else None
+                accept = response.headers.get("Accept-Ranges", "none")
+                self.__ranges = accept == "bytes"
+
+        # Reader
+        self.__reader = response.raw
+        if self.__read_ahead:
+            self.__reader = ReadAheadReader(response.raw, blocks=self.__read_ahead)
+
+    def __skip(self, size):
+        while size > 0:
+            data = self.read(min(size, settings.DEFAULT_HTTP_BLOCK_SIZE))
+            if not data:
+                break
+            size -= len(data)
+
+    def __release(self):
+        if isinstance(self.__reader, ReadAheadReader):
+            self.__reader.close()
+        elif self.__response is not None:
+            self.__response.close()
+        self.__reader = None
+        self.__response = None
+
+
+class ReadAheadReader:
+    """Reader reading blocks from a raw stream in a thread into a bounded queue"""
+
+    def __init__(self, raw, *, blocks):
+        self.raw = raw
+        self.queue = queue.Queue(maxsize=blocks)
+        self.buffer = bytearray()
+        self.done = False
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.produce, daemon=True)
+        self.thread.start()
+
+    def read(self, size=-1):
+        size = -1 if size is None else size
+        while not self.done and (size < 0 or len(self.buffer) < size):
+            block = self.queue.get()
+            if isinstance(block, Exception):
+                self.done = True
+                raise block
+            if not block:
+                self.done = True
+                break
+            self.buffer += block
+        size = len(self.buffer) if size < 0 else size
+        chunk = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return chunk
+
+    def close(self):
+        # The thread can be blocked reading from the server holding the stream's
+        # lock so we wake it up shutting down the socket; if it's still running
+        # after the timeout it closes the stream itself when it stops
+        self.stopped.set()
+        sock = find_socket(self.raw)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.thread.join(timeout=1)
+        if not self.thread.is_alive():
+            self.raw.close()
+
+    # Produce
+
+    def produce(self):
+        try:
+            for block in self.raw.stream(settings.DEFAULT_HTTP_BLOCK_SIZE):
+                if self.stopped.is_set():
+                    return
+                self.put(block)
+            self.put(b"")
+        except Exception as exception:
+            self.put(exception)
+        finally:
+            if self.stopped.is_set():
+                self.raw.close()
+
+    def put(self, item):
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+
+
+def find_socket(raw):
+    connection = getattr(raw, "connection", None)
+    sock = getattr(connection, "sock", None)
+    if sock is None:
+        # The connection hands its socket to the response if it's not reused
+        fp = getattr(getattr(raw, "_fp", None), "fp", None)
+        sock = getattr(getattr(fp, "raw", None), "_sock", None)
+    return sock
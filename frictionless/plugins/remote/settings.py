@@ -2,6 +2,8 @@
 
 
 DEFAULT_HTTP_TIMEOUT = 10
+DEFAULT_HTTP_READ_AHEAD = 0
+DEFAULT_HTTP_BLOCK_SIZE = 65536
 DEFAULT_SCHEMES = ["http", "https", "ftp", "ftps"]
 DEFAULT_HTTP_HEADERS = {
     "User-Agent": (
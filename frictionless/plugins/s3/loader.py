@@ -26,6 +26,18 @@ class S3Loader(Loader):
         byte_stream = S3ByteStream(object)
         return byte_stream
 
+    def read_fingerprint(self):
+        boto3 = helpers.import_from_plugin("boto3", plugin="s3")
+        control = self.resource.control
+        parts = urlparse(self.resource.fullpath, allow_fragments=False)
+        client = boto3.resource("s3", endpoint_url=control.endpoint_url)
+        object = client.Object(bucket_name=parts.netloc, key=parts.path[1:])
+        try:
+            object.load()
+        except Exception:
+            return None
+        return [self.resource.fullpath, object.e_tag, object.content_length]
+
     # Write
 
     def write_byte_stream_save(self, byte_stream):
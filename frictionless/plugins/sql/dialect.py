@@ -1,5 +1,6 @@
 from ...metadata import Metadata
 from ...dialect import Dialect
+from ... import settings
 
 
 class SqlDialect(Dialect):
@@ -17,6 +18,9 @@ class SqlDialect(Dialect):
         where? (str): where statement passed to SQL
         namespace? (str): SQL schema
         basepath? (str): a basepath, for example, for SQLite path
+        batch_size? (int): number of rows written to SQL at once
+        fetch_size? (int): number of rows fetched from SQL at once
+        workers? (int): number of connections used to write/read tables concurrently
 
     Raises:
         FrictionlessException: raise any error that occurs during the process
@@ -33,6 +37,9 @@ class SqlDialect(Dialect):
         where=None,
         namespace=None,
         basepath=None,
+        batch_size=None,
+        fetch_size=None,
+        workers=None,
     ):
         self.setinitial("table", table)
         self.setinitial("prefix", prefix)
@@ -40,6 +47,9 @@ class SqlDialect(Dialect):
         self.setinitial("where", where)
         self.setinitial("namespace", namespace)
         self.setinitial("basepath", basepath)
+        self.setinitial("batch_size", batch_size)
+        self.setinitial("fetch_size", fetch_size)
+        self.setinitial("workers", workers)
         super().__init__(descriptor)
 
     @Metadata.property
@@ -66,6 +76,18 @@ class SqlDialect(Dialect):
     def basepath(self):
         return self.get("basepath")
 
+    @Metadata.property
+    def batch_size(self):
+        return self.get("batch_size", settings.DEFAULT_BATCH_SIZE)
+
+    @Metadata.property
+    def fetch_size(self):
+        return self.get("fetch_size", settings.DEFAULT_BATCH_SIZE)
+
+    @Metadata.property
+    def workers(self):
+        return self.get("workers", 1)
+
     # Metadata
 
     metadata_profile = {  # type: ignore
@@ -79,5 +101,8 @@ class SqlDialect(Dialect):
             "where": {"type": "string"},
             "namespace": {"type": "string"},
             "basepath": {"type": "string"},
+            "batch_size": {"type": "integer"},
+            "fetch_size": {"type": "integer"},
+            "workers": {"type": "integer"},
         },
     }
@@ -1,5 +1,9 @@
 import re
+import json
+import datetime
 from functools import partial
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlsplit, urlunsplit
 from ...exception import FrictionlessException
 from ...resource import Resource
@@ -44,8 +48,16 @@ class SqlStorage(Storage):
         dialect = dialect or SqlDialect()
         self.__prefix = dialect.prefix
         self.__namespace = dialect.namespace
+        self.__batch_size = dialect.batch_size
+        self.__fetch_size = dialect.fetch_size
+        self.__workers = dialect.workers
         self.__connection = engine.connect()
 
+        # Every connection to an in-memory database creates a new database
+        if engine.dialect.name.startswith("sqlite"):
+            if engine.url.database in [None, "", ":memory:"]:
+                self.__workers = 1
+
         # Add regex support
         # It will fail silently if this function already exists
         if self.__connection.engine.dialect.name.startswith("sqlite"):
@@ -67,6 +79,12 @@ class SqlStorage(Storage):
     def connection(self):
         return self.__connection
 
+    def __connect(self):
+        connection = self.__connection.engine.connect()
+        if connection.engine.dialect.name.startswith("sqlite"):
+            connection.connection.create_function("REGEXP", 2, regexp)
+        return connection
+
     # Read
 
     def read_resource(self, name, *, order_by=None, where=None):
@@ -130,21 +148,58 @@ class SqlStorage(Storage):
         return schema
 
     def __read_convert_data(self, name, *, order_by=None, where=None):
-        sa = helpers.import_from_plugin("sqlalchemy", plugin="sql")
         sql_table = self.__read_sql_table(name)
-        with self.__connection.begin():
-            # Streaming could be not working for some backends:
-            # http://docs.sqlalchemy.org/en/latest/core/connections.html
-            select = sql_table.select().execution_options(stream_results=True)
+        options = {"order_by": order_by, "where": where}
+
+        # Every data stream has its own connection to be read concurrently
+        if self.__workers > 1:
+            with self.__connect() as connection:
+                yield from self.__read_convert_data_stream(
+                    sql_table, connection, **options
+                )
+            return
+        yield from self.__read_convert_data_stream(
+            sql_table, self.__connection, **options
+        )
+
+    def __read_convert_data_stream(self, sql_table, connection, *, order_by, where):
+        sa = helpers.import_from_plugin("sqlalchemy", plugin="sql")
+        dialect = connection.engine.dialect
+        with connection.begin():
+            yield [str(column.name) for column in sql_table.columns]
+            select = sql_table.select()
             if order_by:
                 select = select.order_by(sa.sql.text(order_by))
             if where:
                 select = select.where(sa.sql.text(where))
-            result = select.execute()
-            yield list(result.keys())
-            for item in result:
-                cells = list(item)
-                yield cells
+
+            # Keyset pagination
+            # Drivers not supporting server-side cursors might buffer a whole result
+            # so the table is read by pages if it's not ordered explicitly
+            # (sqlite3 is an exception as it steps through a result lazily)
+            key_columns = list(sql_table.primary_key.columns)
+            if not dialect.supports_server_side_cursors and not order_by:
+                if key_columns and not dialect.name.startswith("sqlite"):
+                    select = select.order_by(*key_columns).limit(self.__fetch_size)
+                    page = select
+                    while True:
+                        items = connection.execute(page).fetchall()
+                        yield from map(list, items)
+                        if len(items) < self.__fetch_size:
+                            return
+                        keys = [items[-1][column] for column in key_columns]
+                        page = select.where(create_keyset_filter(key_columns, keys))
+
+            # Server-side cursor
+            select = select.execution_options(
+                stream_results=True, max_row_buffer=self.__fetch_size
+            )
+            result = connection.execute(select)
+            while True:
+                items = result.fetchmany(self.__fetch_size)
+                if not items:
+                    break
+                yield from map(list, items)
 
     def __read_convert_type(self, sql_type=None):
         sa = helpers.import_from_plugin("sqlalchemy", plugin="sql")
@@ -205,6 +260,11 @@ class SqlStorage(Storage):
                     raise FrictionlessException(errors.StorageError(note=note))
                 delete_names.append(resource.name)
 
+        # Write concurrently
+        if self.__workers > 1:
+            self.__write_package_concurrently(package, delete_names)
+            return
+
         # Wrap into a transaction
         with self.__connection.begin():
 
@@ -222,17 +282,60 @@ class SqlStorage(Storage):
             existent_names = list(self)
             for name in existent_names:
                 if package.has_resource(name):
-                    self.__write_convert_data(package.get_resource(name))
+                    resource = package.get_resource(name)
+                    self.__write_convert_data(resource, connection=self.__connection)
+
+    def __write_package_concurrently(self, package, delete_names):
+        sa = helpers.import_from_plugin("sqlalchemy", plugin="sql")
+        engine = self.__connection.engine
+
+        # NOTE:
+        # Tables are loaded in their own transactions so a failed load
+        # doesn't roll back the tables loaded by the other workers.
+        # As SQLite doesn't support adding constraints to existent tables
+        # and allows only one writer at a time, the tables are created with
+        # constraints and loaded one by one in the foreign key dependency order.
+
+        # Create tables
+        sql_tables = []
+        deferred = None
+        if not engine.dialect.name.startswith("sqlite"):
+            deferred = []
+        with self.__connection.begin():
+            self.delete_package(delete_names)
+            for resource in package.resources:
+                if not resource.schema:
+                    resource.infer()
+                sql_table = self.__write_convert_schema(resource, deferred=deferred)
+                sql_tables.append(sql_table)
+            self.__metadata.create_all(tables=sql_tables)
+
+        # Write data
+        workers = self.__workers if deferred is not None else 1
+        levels = [package.resources]
+        if deferred is None:
+            levels = create_dependency_levels(package.resources)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for resources in levels:
+                list(executor.map(self.__write_convert_data_concurrently, resources))
+
+        # Create constraints
+        if deferred:
+            with self.__connection.begin():
+                for sql_table, constraint in deferred:
+                    sql_table.append_constraint(constraint)
+                    self.__connection.execute(sa.schema.AddConstraint(constraint))
 
     def __write_convert_name(self, name):
         return self.__prefix + name
 
-    def __write_convert_schema(self, resource):
+    def __write_convert_schema(self, resource, *, deferred=None):
         sa = helpers.import_from_plugin("sqlalchemy", plugin="sql")
 
         # Prepare
         columns = []
         constraints = []
+        deferred_constraints = []
         engine = self.__connection.engine
         sql_name = self.__write_convert_name(resource.name)
 
@@ -273,6 +376,9 @@ class SqlStorage(Storage):
                     if field.type == "string":
                         enum_name = "%s_%s_enum" % (sql_name, field.name)
                         column_type = sa.Enum(*value, name=enum_name)
+            if unique and deferred is not None:
+                deferred_constraints.append(sa.UniqueConstraint(field.name))
+                unique = False
             column_args = [field.name, column_type] + checks
             column_kwargs = {"nullable": nullable, "unique": unique}
             if field.description:
@@ -296,44 +402,74 @@ class SqlStorage(Storage):
             composer = lambda field: ".".join([table_name, field])
             foreign_fields = list(map(composer, foreign_fields))
             constraint = sa.ForeignKeyConstraint(fields, foreign_fields)
+            if deferred is not None:
+                deferred_constraints.append(constraint)
+                continue
             constraints.append(constraint)
 
         # Create sql table
         sql_table = sa.Table(sql_name, self.__metadata, *(columns + constraints))
+        if deferred is not None:
+            for constraint in deferred_constraints:
+                deferred.append((sql_table, constraint))
         return sql_table
 
-    def __write_convert_data(self, resource):
+    def __write_convert_data_concurrently(self, resource):
+        with self.__connect() as connection, connection.begin():
+            self.__write_convert_data(resource, connection=connection)
 
-        # Fallback fields
-        fallback_fields = []
+    def __write_convert_data(self, resource, *, connection):
+
+        # Fallback/timezone fields
+        converters = []
         mapping = self.__write_convert_type()
-        for field in resource.schema.fields:
+        for index, field in enumerate(resource.schema.fields):
             if not mapping.get(field.type):
-                fallback_fields.append(field)
-
-        # Timezone fields
-        timezone_fields = []
-        for field in resource.schema.fields:
-            if field.type in ["datetime", "time"]:
-                timezone_fields.append(field)
+                converters.append((index, partial(write_fallback_cell, field)))
+            elif field.type in ["datetime", "time"]:
+                converters.append((index, write_timezone_cell))
 
         # Write data
-        buffer = []
-        buffer_size = 1000
         sql_table = self.__read_sql_table(resource.name)
+        field_names = resource.schema.field_names
         with resource:
-            for row in resource.row_stream:
-                for field in fallback_fields:
-                    row[field.name], notes = field.write_cell(row[field.name])
-                for field in timezone_fields:
-                    if row[field.name] is not None:
-                        row[field.name] = row[field.name].replace(tzinfo=None)
-                buffer.append(row)
-                if len(buffer) > buffer_size:
-                    self.__connection.execute(sql_table.insert().values(buffer))
+            cell_stream = self.__write_convert_cells(resource.row_stream, converters)
+            engine = connection.engine
+            if engine.dialect.name.startswith("postgresql"):
+                if engine.dialect.driver == "psycopg2":
+                    self.__write_convert_data_copy(
+                        sql_table, field_names, cell_stream, connection=connection
+                    )
+                    return
+            buffer = []
+            for cells in cell_stream:
+                buffer.append(dict(zip(field_names, cells)))
+                if len(buffer) >= self.__batch_size:
+                    connection.execute(sql_table.insert(), buffer)
                     buffer = []
-            if len(buffer):
-                self.__connection.execute(sql_table.insert().values(buffer))
+            if buffer:
+                connection.execute(sql_table.insert(), buffer)
+
+    def __write_convert_cells(self, row_stream, converters):
+        for row in row_stream:
+            cells = row.to_list()
+            for index, convert in converters:
+                cells[index] = convert(cells[index])
+            yield cells
+
+    def __write_convert_data_copy(
+        self, sql_table, field_names, cell_stream, *, connection
+    ):
+        preparer = connection.engine.dialect.identifier_preparer
+        table_name = preparer.format_table(sql_table)
+        column_names = ", ".join(map(preparer.quote, field_names))
+        query = f"COPY {table_name} ({column_names}) FROM STDIN"
+        text_stream = CopyTextStream(cell_stream, batch_size=self.__batch_size)
+        cursor = connection.connection.cursor()
+        try:
+            cursor.copy_expert(query, text_stream)
+        finally:
+            cursor.close()
 
     def __write_convert_type(self, type=None):
         sa = helpers.import_from_plugin("sqlalchemy", plugin="sql")
@@ -408,3 +544,97 @@ class SqlStorage(Storage):
 def regexp(expr, item):
     reg = re.compile(expr)
     return reg.search(item) is not None
+
+
+def create_dependency_levels(resources):
+    # Resources are grouped into levels referencing only resources of previous levels
+    # (references to not written resources are ignored; cycles are put into one level)
+    names = [resource.name for resource in resources]
+    dependencies = {}
+    for resource in resources:
+        dependencies[resource.name] = set()
+        for fk in resource.schema.foreign_keys:
+            name = fk["reference"]["resource"]
+            if name and name != resource.name and name in names:
+                dependencies[resource.name].add(name)
+    levels = []
+    done = set()
+    while len(done) < len(resources):
+        level = [
+            resource
+            for resource in resources
+            if resource.name not in done and dependencies[resource.name] <= done
+        ]
+        if not level:
+            level = [resource for resource in resources if resource.name not in done]
+        done.update(resource.name for resource in level)
+        levels.append(level)
+    return levels
+
+
+def create_keyset_filter(columns, keys):
+    sa = helpers.import_from_plugin("sqlalchemy", plugin="sql")
+    # (a, b) > (x, y) is expressed as a > x OR (a = x AND b > y) for portability
+    column, *columns = columns
+    key, *keys = keys
+    if not columns:
+        return column > key
+    return sa.or_(
+        column > key, sa.and_(column == key, create_keyset_filter(columns, keys))
+    )
+
+
+def write_fallback_cell(field, cell):
+    cell, notes = field.write_cell(cell)
+    return cell
+
+
+def write_timezone_cell(cell):
+    if cell is not None:
+        cell = cell.replace(tzinfo=None)
+    return cell
+
+
+def write_copy_cell(cell):
+    if cell is None:
+        return "\\N"
+    elif cell is True:
+        return "t"
+    elif cell is False:
+        return "f"
+    elif isinstance(cell, (dict, list)):
+        cell = json.dumps(cell)
+    elif isinstance(cell, (datetime.date, datetime.time)):
+        cell = cell.isoformat()
+    else:
+        cell = str(cell)
+    return cell.translate(COPY_ESCAPES)
+
+
+# https://www.postgresql.org/docs/current/sql-copy.html
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+class CopyTextStream:
+    # A file-like object streaming cells in the PostgreSQL COPY text format
+    # It's read by `cursor.copy_expert` so only the `read` method is needed
+
+    def __init__(self, cell_stream, *, batch_size):
+        self.__cell_stream = cell_stream
+        self.__batch_size = batch_size
+        self.__buffer = ""
+        self.__position = 0
+
+    def read(self, size=-1):
+        while size < 0 or len(self.__buffer) - self.__position < size:
+            lines = []
+            for cells in islice(self.__cell_stream, self.__batch_size):
+                lines.append("\t".join(map(write_copy_cell, cells)) + "\n")
+            if not lines:
+                break
+            self.__buffer = self.__buffer[self.__position :] + "".join(lines)
+            self.__position = 0
+        start = self.__position
+        end = len(self.__buffer) if size < 0 else start + size
+        self.__position = min(end, len(self.__buffer))
+        return self.__buffer[start:end]
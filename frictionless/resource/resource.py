@@ -4,7 +4,7 @@ import petl
 import warnings
 from pathlib import Path
 from copy import deepcopy
-from itertools import zip_longest, chain
+from itertools import zip_longest, chain, islice
 from ..exception import FrictionlessException
 from ..detector import Detector
 from ..metadata import Metadata
@@ -13,7 +13,8 @@ from ..schema import Schema
 from ..header import Header
 from ..system import system
 from ..field import Field
-from ..row import Row
+from ..row import Row, CompactRow
+from ..index import KeyIndex, read_lookup
 from .analyze import analyze
 from .describe import describe
 from .extract import extract
@@ -126,6 +127,21 @@ class Resource(Metadata):
             on resource level and they should be handled by the user
             being available in Header and Row objects.
 
+        row_type? (row|compact): Type of the row objects.
+            It defaults to 'row'. The 'compact' mode provides `CompactRow`
+            objects having the same API but using a lot less memory
+            that is useful for reading big tables into memory.
+
+        index_threshold? (int): Number of keys kept in memory by unique
+            and primary key checks before spilling them to a temporary
+            on-disk database. It defaults to 0 keeping all the keys in memory.
+            Spilling bounds the memory usage of big tables but slows down
+            the checks as the keys not found in memory are looked up on disk.
+
+        infer_cache? (InferCache): Cache of inferred metadata.
+            If provided, `resource.infer` reuses metadata inferred
+            for the same unchanged source instead of reading it again.
+
         trusted? (bool): Don't raise an exception on unsafe paths.
             A path provided as a part of the descriptor considered unsafe
             if there are path traversing or the path is absolute.
@@ -174,6 +190,9 @@ class Resource(Metadata):
         basepath="",
         detector=None,
         onerror="ignore",
+        row_type="row",
+        index_threshold=settings.DEFAULT_INDEX_THRESHOLD,
+        infer_cache=None,
         trusted=False,
         package=None,
     ):
@@ -218,6 +237,9 @@ class Resource(Metadata):
         self.__basepath = basepath or helpers.parse_basepath(descriptor)
         self.__detector = detector or Detector()
         self.__onerror = onerror
+        self.__row_type = row_type
+        self.__index_threshold = index_threshold
+        self.__infer_cache = infer_cache
         self.__trusted = trusted
         self.__package = package
 
@@ -286,6 +308,12 @@ class Resource(Metadata):
             self.__detector = value
         elif name == "onerror":
             self.__onerror = value
+        elif name == "row_type":
+            self.__row_type = value
+        elif name == "index_threshold":
+            self.__index_threshold = value
+        elif name == "infer_cache":
+            self.__infer_cache = value
         elif name == "trusted":
             self.__trusted = value
         elif name == "package":
@@ -619,6 +647,30 @@ class Resource(Metadata):
         """
         return self.__onerror
 
+    @Metadata.property(cache=False, write=False)
+    def row_type(self):
+        """
+        Returns:
+            row|compact: type of the row objects
+        """
+        return self.__row_type
+
+    @Metadata.property(cache=False, write=False)
+    def index_threshold(self):
+        """
+        Returns:
+            int: number of keys kept in memory by integrity checks
+        """
+        return self.__index_threshold
+
+    @Metadata.property(cache=False, write=False)
+    def infer_cache(self):
+        """
+        Returns:
+            InferCache?: cache of inferred metadata
+        """
+        return self.__infer_cache
+
     @Metadata.property(cache=False, write=False)
     def trusted(self):
         """
@@ -706,6 +758,21 @@ class Resource(Metadata):
         """
         return self.__row_stream
 
+    @property
+    def row_batch_stream(self):
+        """Row batch stream in form of a generator of Row lists
+
+        It's an alternative to `row_stream` that reads rows in batches
+        and parses cells column-wise. Only rows having errors are created
+        so for every batch of data rows it yields a list of invalid rows.
+        Only one of the row streams can be used for an open resource.
+
+        Yields:
+            gen<Row[][]>?: row batch stream
+        """
+        if self.__parser:
+            return self.__read_row_batch_stream(settings.DEFAULT_BATCH_SIZE)
+
     # Expand
 
     def expand(self):
@@ -738,12 +805,29 @@ class Resource(Metadata):
         if not self.closed:
             note = "Resource.infer canot be used on a open resource"
             raise FrictionlessException(errors.ResourceError(note=note))
+
+        # Read cache
+        key = None
+        if self.__infer_cache is not None and not stats:
+            key = self.__infer_cache.create_key(self)
+            descriptor = self.__infer_cache.read(key) if key else None
+            if descriptor is not None:
+                with self.batch_update():
+                    self.clear()
+                    self.update(descriptor)
+                return
+
+        # Infer
         with self:
-            if not stats:
-                self.pop("stats", None)
+            if stats:
+                stream = self.row_stream or self.byte_stream
+                helpers.pass_through(stream)
                 return
-            stream = self.row_stream or self.byte_stream
-            helpers.pass_through(stream)
+            self.pop("stats", None)
+
+        # Write cache
+        if key:
+            self.__infer_cache.write(key, self.to_dict())
 
     # Open/Close
 
@@ -756,21 +840,22 @@ class Resource(Metadata):
         self.close()
 
         # Infer
-        self.pop("stats", None)
-        self["name"] = self.name
-        self["profile"] = self.profile
-        self["scheme"] = self.scheme
-        self["format"] = self.format
-        self["hashing"] = self.hashing
-        if self.innerpath:
-            self["innerpath"] = self.innerpath
-        if self.compression:
-            self["compression"] = self.compression
-        if self.control:
-            self["control"] = self.control
-        if self.dialect:
-            self["dialect"] = self.dialect
-        self["stats"] = self.stats
+        with self.batch_update():
+            self.pop("stats", None)
+            self["name"] = self.name
+            self["profile"] = self.profile
+            self["scheme"] = self.scheme
+            self["format"] = self.format
+            self["hashing"] = self.hashing
+            if self.innerpath:
+                self["innerpath"] = self.innerpath
+            if self.compression:
+                self["compression"] = self.compression
+            if self.control:
+                self["control"] = self.control
+            if self.dialect:
+                self["dialect"] = self.dialect
+            self["stats"] = self.stats
 
         # Validate
         if self.metadata_errors:
@@ -887,6 +972,134 @@ class Resource(Metadata):
 
     def __read_row_stream(self):
 
+        # Create state
+        Row = self.__read_row_class()
+        field_info = self.__read_field_info()
+        read_integrity = self.__read_integrity()
+
+        # Create row stream
+        def row_stream():
+            for row_position, row_number, cells in self.__read_cell_stream():
+
+                # Create row
+                row = Row(
+                    cells,
+                    field_info=field_info,
+                    row_position=row_position,
+                    row_number=row_number,
+                )
+
+                # Integrity errors
+                if read_integrity:
+                    for Error, note, options in read_integrity(
+                        row_position, row.__getitem__
+                    ):
+                        row.errors.append(Error.from_row(row, note=note, **options))
+
+                # Handle errors
+                self.__read_handle_errors(row)
+
+                # Yield row
+                yield row
+
+            # Update stats
+            self.stats["rows"] = self.__row_number
+
+        # Return row stream
+        return row_stream()
+
+    def __read_row_batch_stream(self, size):
+
+        # Create state
+        Row = self.__read_row_class()
+        field_info = self.__read_field_info()
+        read_integrity = self.__read_integrity()
+        fields = [field for field, _, _ in field_info["mapping"].values()]
+        field_indexes = {field.name: index for index, field in enumerate(fields)}
+
+        # Create row batch stream
+        def row_batch_stream():
+            batch = []
+            iterator = self.__read_cell_stream()
+            while True:
+                batch.clear()
+                for item in iterator:
+                    batch.append(item)
+                    if len(batch) >= size:
+                        break
+                if not batch:
+                    break
+
+                # Read columns
+                # Rows having not matching width or only blank cells
+                # are marked as failed and processed by the Row class
+                failed = set()
+                columns = []
+                present = [False] * len(batch)
+                for index, (_, _, cells) in enumerate(batch):
+                    if len(cells) != len(fields):
+                        failed.add(index)
+                for field_index, field in enumerate(fields):
+                    column = [
+                        cells[field_index] if len(cells) > field_index else None
+                        for _, _, cells in batch
+                    ]
+                    column, notes = field.read_cells(column)
+                    failed.update(notes)
+                    for index, cell in enumerate(column):
+                        if cell is not None:
+                            present[index] = True
+                    columns.append(column)
+                for index, is_present in enumerate(present):
+                    if not is_present:
+                        failed.add(index)
+
+                # Create rows
+                rows = []
+                for index, (row_position, row_number, cells) in enumerate(batch):
+                    row = None
+                    if index in failed:
+                        row = Row(
+                            cells,
+                            field_info=field_info,
+                            row_position=row_position,
+                            row_number=row_number,
+                        )
+                    if read_integrity:
+                        if row:
+                            read_cell = row.__getitem__
+                        else:
+                            read_cell = lambda name: columns[field_indexes[name]][index]
+                        items = read_integrity(row_position, read_cell)
+                        if items and not row:
+                            row = Row(
+                                cells,
+                                field_info=field_info,
+                                row_position=row_position,
+                                row_number=row_number,
+                            )
+                        for Error, note, options in items:
+                            row.errors.append(Error.from_row(row, note=note, **options))
+                    if row:
+                        self.__read_handle_errors(row)
+                        rows.append(row)
+
+                # Yield rows
+                yield rows
+
+            # Update stats
+            self.stats["rows"] = self.__row_number
+
+        # Return row batch stream
+        return row_batch_stream()
+
+    def __read_row_class(self):
+        if self.row_type == "compact":
+            return CompactRow
+        return Row
+
+    def __read_field_info(self):
+
         # During row streaming we crate a field inf structure
         # This structure is optimized and detached version of schema.fields
         # We create all data structures in-advance to share them between rows
@@ -894,6 +1107,7 @@ class Resource(Metadata):
         # Create field info
         field_number = 0
         field_info = {"names": [], "objects": [], "positions": [], "mapping": {}}
+        field_info["readers"] = self.schema.create_cell_readers()
         iterator = zip_longest(self.schema.fields, self.__field_positions)
         for field, field_position in iterator:
             if field is None:
@@ -905,14 +1119,22 @@ class Resource(Metadata):
             if field_position is not None:
                 field_info["positions"].append(field_position)
 
+        return field_info
+
+    def __read_integrity(self):
+
+        # The integrity reader is called for every row with a cell getter
+        # It updates its state and returns a list of (Error, note, options)
+        # to be able to create the errors only if there is a Row object
+
         # Create state
         memory_unique = {}
-        memory_primary = {}
+        memory_primary = KeyIndex(threshold=self.__index_threshold)
         foreign_groups = []
         is_integrity = bool(self.schema.primary_key)
         for field in self.schema.fields:
             if field.constraints.get("unique"):
-                memory_unique[field.name] = {}
+                memory_unique[field.name] = KeyIndex(threshold=self.__index_threshold)
                 is_integrity = True
         if self.__lookup:
             for fk in self.schema.foreign_keys:
@@ -922,6 +1144,62 @@ class Resource(Metadata):
                 group["targetKey"] = tuple(fk["fields"])
                 foreign_groups.append(group)
                 is_integrity = True
+        if not is_integrity:
+            return None
+
+        # Create integrity reader
+        def read_integrity(row_position, read_cell):
+            items = []
+
+            # Unique Error
+            if memory_unique:
+                for field_name in memory_unique.keys():
+                    cell = read_cell(field_name)
+                    if cell is not None:
+                        match = memory_unique[field_name].add(cell, row_position)
+                        if match:
+                            note = "the same as in the row at position %s" % match
+                            options = {"field_name": field_name}
+                            items.append((errors.UniqueError, note, options))
+
+            # Primary Key Error
+            if self.schema.primary_key:
+                cells = tuple(read_cell(name) for name in self.schema.primary_key)
+                if set(cells) == {None}:
+                    note = 'cells composing the primary keys are all "None"'
+                    items.append((errors.PrimaryKeyError, note, {}))
+                else:
+                    match = memory_primary.add(cells, row_position)
+                    if match:
+                        note = "the same as in the row at position %s" % match
+                        items.append((errors.PrimaryKeyError, note, {}))
+
+            # Foreign Key Error
+            if foreign_groups:
+                for group in foreign_groups:
+                    group_lookup = self.__lookup.get(group["sourceName"])
+                    if group_lookup:
+                        cells = tuple(read_cell(name) for name in group["targetKey"])
+                        if set(cells) == {None}:
+                            continue
+                        match = cells in group_lookup.get(group["sourceKey"], set())
+                        if not match:
+                            note = (
+                                'for "%s": values "%s" not found in the lookup table "%s" as "%s"'
+                                % (
+                                    ", ".join(group["targetKey"]),
+                                    ", ".join(str(d) for d in cells),
+                                    group["sourceName"],
+                                    ", ".join(group["sourceKey"]),
+                                )
+                            )
+                            items.append((errors.ForeignKeyError, note, {}))
+
+            return items
+
+        return read_integrity
+
+    def __read_cell_stream(self):
 
         # Create iterator
         iterator = chain(
@@ -929,97 +1207,31 @@ class Resource(Metadata):
             self.__read_list_stream(),
         )
 
-        # Create row stream
-        def row_stream():
-            self.__row_number = 0
-            limit = self.layout.limit_rows
-            offset = self.layout.offset_rows or 0
-            for row_position, cells in iterator:
-                self.__row_position = row_position
-
-                # Offset/offset rows
-                if offset:
-                    offset -= 1
-                    continue
-                if limit and limit <= self.__row_number:
-                    break
-
-                # Create row
-                self.__row_number += 1
-                row = Row(
-                    cells,
-                    field_info=field_info,
-                    row_position=self.__row_position,
-                    row_number=self.__row_number,
-                )
-
-                # Unique Error
-                if is_integrity and memory_unique:
-                    for field_name in memory_unique.keys():
-                        cell = row[field_name]
-                        if cell is not None:
-                            match = memory_unique[field_name].get(cell)
-                            memory_unique[field_name][cell] = row.row_position
-                            if match:
-                                func = errors.UniqueError.from_row
-                                note = "the same as in the row at position %s" % match
-                                error = func(row, note=note, field_name=field_name)
-                                row.errors.append(error)
-
-                # Primary Key Error
-                if is_integrity and self.schema.primary_key:
-                    cells = tuple(row[name] for name in self.schema.primary_key)
-                    if set(cells) == {None}:
-                        note = 'cells composing the primary keys are all "None"'
-                        error = errors.PrimaryKeyError.from_row(row, note=note)
-                        row.errors.append(error)
-                    else:
-                        match = memory_primary.get(cells)
-                        memory_primary[cells] = row.row_position
-                        if match:
-                            if match:
-                                note = "the same as in the row at position %s" % match
-                                error = errors.PrimaryKeyError.from_row(row, note=note)
-                                row.errors.append(error)
-
-                # Foreign Key Error
-                if is_integrity and foreign_groups:
-                    for group in foreign_groups:
-                        group_lookup = self.__lookup.get(group["sourceName"])
-                        if group_lookup:
-                            cells = tuple(row[name] for name in group["targetKey"])
-                            if set(cells) == {None}:
-                                continue
-                            match = cells in group_lookup.get(group["sourceKey"], set())
-                            if not match:
-                                note = (
-                                    'for "%s": values "%s" not found in the lookup table "%s" as "%s"'
-                                    % (
-                                        ", ".join(group["targetKey"]),
-                                        ", ".join(str(d) for d in cells),
-                                        group["sourceName"],
-                                        ", ".join(group["sourceKey"]),
-                                    )
-                                )
-                                error = errors.ForeignKeyError.from_row(row, note=note)
-                                row.errors.append(error)
+        # Stream cells
+        self.__row_number = 0
+        limit = self.layout.limit_rows
+        offset = self.layout.offset_rows or 0
+        for row_position, cells in iterator:
+            self.__row_position = row_position
 
-                # Handle errors
-                if self.onerror != "ignore":
-                    if not row.valid:
-                        error = row.errors[0]
-                        if self.onerror == "raise":
-                            raise FrictionlessException(error)
-                        warnings.warn(error.message, UserWarning)
+            # Offset/offset rows
+            if offset:
+                offset -= 1
+                continue
+            if limit and limit <= self.__row_number:
+                break
 
-                # Yield row
-                yield row
+            # Yield cells
+            self.__row_number += 1
+            yield row_position, self.__row_number, cells
 
-            # Update stats
-            self.stats["rows"] = self.__row_number
-
-        # Return row stream
-        return row_stream()
+    def __read_handle_errors(self, row):
+        if self.onerror != "ignore":
+            if not row.valid:
+                error = row.errors[0]
+                if self.onerror == "raise":
+                    raise FrictionlessException(error)
+                warnings.warn(error.message, UserWarning)
 
     def __read_header(self):
 
@@ -1043,25 +1255,52 @@ class Resource(Metadata):
         return header
 
     def __read_list_stream(self):
+        layout = self.layout
 
         # Prepare iterator
-        iterator = (
-            (position, cells)
-            for position, cells in enumerate(self.__parser.list_stream, start=1)
-            if position > len(self.__parser.sample)
-        )
+        # The sample rows are already processed so we skip them
+        iterator = enumerate(self.__parser.list_stream, start=1)
+        iterator = islice(iterator, len(self.__parser.sample), None)
+
+        # Project fields
+        projected = self.__read_detect_projection()
+        if projected:
+            self.__parser.project(self.__field_positions)
+
+        # Filter rows
+        if layout.is_row_filtering:
+            iterator = (
+                (row_position, cells)
+                for row_position, cells in iterator
+                if layout.read_filter_rows(cells, row_position=row_position)
+            )
+
+        # Filter fields
+        if layout.is_field_filtering and not projected:
+            field_positions = self.__field_positions
+            iterator = (
+                (
+                    row_position,
+                    layout.read_filter_cells(cells, field_positions=field_positions),
+                )
+                for row_position, cells in iterator
+            )
 
-        # Stream without filtering
-        if not self.layout:
-            yield from iterator
-            return
+        return iterator
 
-        # Stream with filtering
-        for row_position, cells in iterator:
-            if self.layout.read_filter_rows(cells, row_position=row_position):
-                yield row_position, self.layout.read_filter_cells(
-                    cells, field_positions=self.__field_positions
-                )
+    def __read_detect_projection(self):
+        layout = self.layout
+        if not self.__parser.supports_projection or not layout.is_field_filtering:
+            return False
+
+        # Row filtering reads the first cell or all the cells for "<blank>"
+        if layout.is_row_filtering:
+            if 1 not in self.__field_positions:
+                return False
+            if "<blank>" in (layout.pick_rows or []) + (layout.skip_rows or []):
+                return False
+
+        return True
 
     def __read_detect_layout(self):
         sample = self.__parser.sample
@@ -1106,12 +1345,11 @@ class Resource(Metadata):
             lookup[source_name][source_key] = set()
             if not source_res:
                 continue
-            with source_res:
-                for row in source_res.row_stream:
-                    cells = tuple(row.get(field_name) for field_name in source_key)
-                    if set(cells) == {None}:
-                        continue
-                    lookup[source_name][source_key].add(cells)
+            if source_name and self.__package.lookup_cache:
+                cache = self.__package.lookup_cache
+                lookup[source_name][source_key] = cache.read(source_res, source_key)
+                continue
+            lookup[source_name][source_key] = read_lookup(source_res, source_key)
         self.__lookup = lookup
 
     # Write
@@ -1157,6 +1395,9 @@ class Resource(Metadata):
             basepath=self.__basepath,
             detector=self.__detector,
             onerror=self.__onerror,
+            row_type=self.__row_type,
+            index_threshold=self.__index_threshold,
+            infer_cache=self.__infer_cache,
             trusted=self.__trusted,
             package=self.__package,
             **options,
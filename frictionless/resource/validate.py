@@ -1,12 +1,18 @@
+import os
 import types
+import hashlib
+from copy import deepcopy
+from multiprocessing import Pool
 from typing import TYPE_CHECKING
 from ..check import Check
 from ..system import system
+from ..index import KeyIndex, create_digest
 from ..exception import FrictionlessException
 from ..report import Report, ReportTask
 from ..errors import TaskError
 from .. import helpers
 from .. import settings
+from .. import errors as errors_module
 
 if TYPE_CHECKING:
     from .resource import Resource
@@ -27,6 +33,8 @@ def validate(
     skip_errors=None,
     limit_errors=settings.DEFAULT_LIMIT_ERRORS,
     limit_memory=settings.DEFAULT_LIMIT_MEMORY,
+    engine="row",
+    workers=None,
 ):
     """Validate table
 
@@ -37,12 +45,26 @@ def validate(
         limit_errors? (int): limit errors
         limit_memory? (int): limit memory
         original? (bool): validate metadata as it is (without inferring)
+        engine? (row|columnar): validation engine; the columnar engine
+            parses cells column-wise in batches and creates only invalid rows.
+            It's used only if there are no other checks than baseline
+        workers? (int): number of processes validating a local CSV file
+            (or the local parts of a multipart CSV resource)
+            split into chunks aligned on record boundaries. Cross-chunk checks
+            e.g. unique or primary key are run after the chunks are validated.
+            It falls back to the sequential validation if the resource
+            or the checks are not supported by the chunked validation
         **options? (dict): Resource constructor options
 
     Returns:
         Report: validation report
     """
 
+    # Validate engine
+    if engine not in ["row", "columnar"]:
+        note = f'validation engine "{engine}" is not supported'
+        raise FrictionlessException(TaskError(note=note))
+
     # Create state
     partial = False
     timer = helpers.Timer()
@@ -75,6 +97,11 @@ def validate(
                 checks[index] = check
             errors.register(check)
 
+        # Only invalid rows are created by the columnar engine
+        # so custom checks require all the rows to be streamed
+        if any(check.code != "baseline" for check in checks):
+            engine = "row"
+
     # Validate checks
     if not errors:
         for index, check in enumerate(checks.copy()):
@@ -101,8 +128,23 @@ def validate(
                         del checks[index]
                     errors.append(error)
 
+            # Validate chunks
+            chunked = False
+            if resource.tabular and workers and workers > 1:
+                if is_chunkable(resource, checks):
+                    chunked = True
+                    partial = validate_chunks(
+                        resource,
+                        checks=checks,
+                        errors=errors,
+                        workers=workers,
+                        pick_errors=pick_errors,
+                        skip_errors=skip_errors,
+                        limit_errors=limit_errors,
+                    )
+
             # Validate rows
-            if resource.tabular:
+            if resource.tabular and engine == "row" and not chunked:
                 for row in resource.row_stream:
 
                     # Validate row
@@ -124,6 +166,35 @@ def validate(
                             partial = True
                             break
 
+            # Validate row batches
+            if resource.tabular and engine == "columnar" and not chunked:
+                memory_rows = 0
+                for rows in resource.row_batch_stream:
+
+                    # Validate rows
+                    for row in rows:
+                        for check in checks:
+                            for error in check.validate_row(row):
+                                errors.append(error)
+
+                    # Limit errors
+                    if limit_errors and len(errors) >= limit_errors:
+                        partial = True
+                        break
+
+                    # Limit memory
+                    # Batches only have invalid rows so we count batches to check
+                    # the memory as often as the row engine (every 100000 rows)
+                    memory_rows += settings.DEFAULT_BATCH_SIZE
+                    if limit_memory and memory_rows >= 100000:
+                        memory_rows = 0
+                        memory = helpers.get_current_memory_usage()
+                        if memory and memory > limit_memory:
+                            note = f'exceeded memory limit "{limit_memory}MB"'
+                            errors.append(TaskError(note=note))
+                            partial = True
+                            break
+
             # Validate end
             if not partial:
                 if not resource.tabular:
@@ -200,3 +271,373 @@ class ManagedErrors(list):
             if Error.code in self.__scope:
                 continue
             self.__scope.append(Error.code)
+
+
+# Chunks
+
+
+# The chunked validation splits a local CSV file into byte ranges aligned
+# on record boundaries. Every chunk is prepended with the header record
+# and validated by a worker using a schema without integrity constraints.
+# The parts of a multipart resource are split separately as every part
+# has its own header record (it's not hashed for the parts after the first).
+# Workers return row-level errors and key digests, and the main process
+# merges them in order running the cross-chunk checks (reduce phase).
+# The rows violating cross-chunk checks are then re-read from their chunks
+# to create the errors having the same contents as in sequential validation.
+
+CHUNK_ROW_CHECKS = [
+    "baseline",
+    "ascii-value",
+    "forbidden-value",
+    "row-constraint",
+    "truncated-value",
+]
+CHUNK_REDUCE_CHECKS = [
+    "duplicate-row",
+    "deviated-value",
+]
+CHUNK_LAYOUT_NAMES = ["header", "headerRows", "headerJoin", "headerCase"]
+
+
+def is_chunkable(resource, checks):
+    if resource.scheme not in ["file", "multipart"] or resource.format != "csv":
+        return False
+    if resource.compression or resource.innerpath:
+        return False
+    paths = resource.fullpath if resource.multipart else [resource.fullpath]
+    for path in paths:
+        file = system.create_file(path)
+        if file.scheme != "file" or file.compression:
+            return False
+    # Parts are joined into one stream so a part's last record without a line
+    # terminator continues in the next part while chunks are split by parts
+    for path in paths[:-1]:
+        if not is_line_terminated(path):
+            return False
+    if resource.schema.foreign_keys or not resource.header:
+        return False
+    if not resource.header.valid or resource.layout.header_rows != [1]:
+        return False
+    if any(name not in CHUNK_LAYOUT_NAMES for name in resource.layout):
+        return False
+    if not resource.layout.header:
+        return False
+    dialect = resource.dialect
+    if not dialect.double_quote or dialect.escape_char or dialect.comment_char:
+        return False
+    try:
+        if "\n".encode(resource.encoding) != b"\n":
+            return False
+        if len(dialect.quote_char.encode(resource.encoding)) != 1:
+            return False
+    except (LookupError, UnicodeError):
+        return False
+    codes = CHUNK_ROW_CHECKS + CHUNK_REDUCE_CHECKS
+    return all(check.code in codes for check in checks)
+
+
+def is_line_terminated(path):
+    with open(path, "rb") as file:
+        file.seek(0, os.SEEK_END)
+        if not file.tell():
+            return False
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) in [b"\n", b"\r"]
+
+
+def validate_chunks(
+    resource, *, checks, errors, workers, pick_errors, skip_errors, limit_errors
+):
+
+    # Prepare chunks
+    # The first range of a part is its header record prepended to every chunk
+    chunks = []
+    stats = {"bytes": 0}
+    hasher = hashlib.new(resource.hashing)
+    paths = resource.fullpath if resource.multipart else [resource.fullpath]
+    size = -(-sum(map(os.path.getsize, paths)) // workers)
+    size = max(min(size, settings.DEFAULT_CHUNK_SIZE), 1)
+    quote = resource.dialect.quote_char.encode(resource.encoding)
+    for number, path in enumerate(paths, start=1):
+        ranges, bytes = read_chunk_ranges(
+            path, size=size, quote=quote, hasher=hasher, skip_header=number > 1
+        )
+        for start, end in ranges[1:]:
+            chunks.append((path, ranges[0][1], start, end))
+        stats["bytes"] += bytes
+    stats["hash"] = hasher.hexdigest()
+
+    # Prepare schema (integrity is checked in the reduce phase)
+    schema = deepcopy(resource.schema.to_dict())
+    schema.pop("primaryKey", None)
+    schema.pop("foreignKeys", None)
+    for field in schema.get("fields", []):
+        field.get("constraints", {}).pop("unique", None)
+
+    # Prepare dialect (chunks must not re-infer it from their own sample)
+    dialect = resource.dialect.to_copy()
+    dialect.expand()
+    dialect = dialect.to_dict()
+
+    # Prepare tasks
+    tasks = []
+    for path, header, start, end in chunks:
+        task = {}
+        task["path"] = path
+        task["header"] = header
+        task["start"] = start
+        task["end"] = end
+        task["encoding"] = resource.encoding
+        task["dialect"] = dialect
+        task["detector"] = resource.detector
+        task["schema"] = schema
+        task["checks"] = []
+        task["unique"] = []
+        task["primary"] = resource.schema.primary_key
+        task["duplicate"] = None
+        task["deviated"] = []
+        task["pick_errors"] = pick_errors
+        task["skip_errors"] = skip_errors
+        task["limit_errors"] = limit_errors
+        for field in resource.schema.fields:
+            if field.constraints.get("unique"):
+                task["unique"].append(field.name)
+        for stage, check in enumerate(checks):
+            if check.code in CHUNK_ROW_CHECKS:
+                task["checks"].append((stage, check.to_dict()))
+            elif check.code == "duplicate-row":
+                task["duplicate"] = stage
+            elif check.code == "deviated-value":
+                task["deviated"].append(check["fieldName"])
+        tasks.append(task)
+
+    # Create state
+    items = []
+    fetches = []
+    row_offset = 0
+    threshold = resource.index_threshold
+    memory_unique = {}
+    memory_primary = KeyIndex(threshold=threshold)
+    memory_duplicate = KeyIndex(threshold=threshold)
+    for field in resource.schema.fields:
+        if field.constraints.get("unique"):
+            memory_unique[field.name] = KeyIndex(threshold=threshold)
+
+    with Pool(workers) as pool:
+
+        # Validate chunks (map)
+        for task, result in zip(tasks, pool.imap(validate_chunk, tasks)):
+
+            # Merge errors
+            for row_position, stage, error in result["errors"]:
+                error = shift_chunk_error(error, offset=row_offset)
+                items.append((row_position + row_offset, stage, 0, error))
+
+            # Check keys (reduce)
+            fetch = []
+            for row_position, unique, primary, duplicate in result["keys"]:
+                position = row_position + row_offset
+                for name, digest in zip(memory_unique, unique):
+                    if digest is not None:
+                        match = memory_unique[name].add_digest(digest, position)
+                        if match:
+                            note = "the same as in the row at position %s" % match
+                            options = {"field_name": name}
+                            fetch.append((row_position, 0, "unique", note, options))
+                if task["primary"]:
+                    if primary is None:
+                        note = 'cells composing the primary keys are all "None"'
+                        fetch.append((row_position, 0, "primary-key", note, {}))
+                    else:
+                        match = memory_primary.add_digest(primary, position)
+                        if match:
+                            note = "the same as in the row at position %s" % match
+                            fetch.append((row_position, 0, "primary-key", note, {}))
+                if task["duplicate"] is not None:
+                    match = memory_duplicate.add_digest(duplicate, position)
+                    if match:
+                        note = 'the same as row at position "%s"' % match
+                        stage = task["duplicate"]
+                        fetch.append((row_position, stage, "duplicate-row", note, {}))
+            if fetch:
+                fetches.append((row_offset, dict(task, fetch=fetch)))
+
+            # Replay cells
+            for check in checks:
+                if check.code == "deviated-value":
+                    name = check["fieldName"]
+                    for row_position, cell in result["cells"][name]:
+                        row_position += row_offset
+                        row = ChunkRow({name: cell}, row_position=row_position)
+                        for error in check.validate_row(row):
+                            items.append((row_position, 0, 0, error))
+
+            # Update offset
+            row_offset += result["rows"]
+
+        # Fetch errors
+        fetch_tasks = [task for _, task in fetches]
+        fetch_results = pool.map(read_chunk_errors, fetch_tasks)
+        for (offset, _), result in zip(fetches, fetch_results):
+            for row_position, stage, error in result:
+                error = shift_chunk_error(error, offset=offset)
+                items.append((row_position + offset, stage, 1, error))
+
+    # Close indexes
+    for index in [memory_primary, memory_duplicate, *memory_unique.values()]:
+        index.close()
+
+    # Update stats
+    resource.stats["hash"] = stats["hash"]
+    resource.stats["bytes"] = stats["bytes"]
+    resource.stats["rows"] = row_offset
+
+    # Append errors
+    items.sort(key=lambda item: item[:3])
+    for _, _, _, error in items:
+        errors.append(error)
+    return bool(limit_errors and len(errors) >= limit_errors)
+
+
+def read_chunk_ranges(path, *, size, quote, hasher, skip_header=False):
+    ranges = []
+    quoted = False
+    start = 0
+    offset = 0
+    target = 0
+    bytes = 0
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(settings.DEFAULT_BUFFER_SIZE * 100)
+            if not block:
+                break
+            cursor = 0
+            while offset + len(block) > target:
+                index = max(target - offset, cursor)
+                quoted ^= block.count(quote, cursor, index) % 2 == 1
+                cursor = index
+                boundary = None
+                while True:
+                    newline = block.find(b"\n", cursor)
+                    if newline == -1:
+                        break
+                    quoted ^= block.count(quote, cursor, newline) % 2 == 1
+                    cursor = newline + 1
+                    if not quoted:
+                        boundary = offset + cursor
+                        break
+                if boundary is None:
+                    break
+                ranges.append((start, boundary))
+                start = boundary
+                target = boundary + size
+            quoted ^= block.count(quote, cursor) % 2 == 1
+            data = block
+            if skip_header:
+                data = block[max(ranges[0][1] - offset, 0) :] if ranges else b""
+            hasher.update(data)
+            bytes += len(data)
+            offset += len(block)
+    if start < offset:
+        ranges.append((start, offset))
+    return ranges, bytes
+
+
+def validate_chunk(task):
+    managed_errors = ManagedErrors(task["pick_errors"], task["skip_errors"], None)
+    checks = [(stage, system.create_check(check)) for stage, check in task["checks"]]
+    result = {"rows": 0, "errors": [], "keys": [], "cells": {}}
+    for name in task["deviated"]:
+        result["cells"][name] = []
+    with open_chunk(task) as resource:
+        for _, check in checks:
+            check.connect(resource)
+        for row in resource.row_stream:
+            result["rows"] = row.row_number
+
+            # Validate row
+            for stage, check in checks:
+                for error in check.validate_row(row):
+                    if task["limit_errors"]:
+                        if len(result["errors"]) >= task["limit_errors"]:
+                            continue
+                    if managed_errors.match(error):
+                        result["errors"].append((row.row_position, stage, error))
+
+            # Collect keys
+            if task["unique"] or task["primary"] or task["duplicate"] is not None:
+                unique = []
+                for name in task["unique"]:
+                    cell = row[name]
+                    unique.append(create_digest(cell) if cell is not None else None)
+                primary = None
+                if task["primary"]:
+                    cells = tuple(row[name] for name in task["primary"])
+                    if set(cells) != {None}:
+                        primary = create_digest(cells)
+                duplicate = None
+                if task["duplicate"] is not None:
+                    text = ",".join(map(str, row.values()))
+                    duplicate = hashlib.sha256(text.encode("utf-8")).digest()
+                result["keys"].append((row.row_position, unique, primary, duplicate))
+
+            # Collect cells
+            for name in task["deviated"]:
+                cell = row[name]
+                if cell is not None:
+                    result["cells"][name].append((row.row_position, cell))
+
+    return result
+
+
+def read_chunk_errors(task):
+    items = []
+    fetch = {}
+    for row_position, stage, code, note, options in task["fetch"]:
+        fetch.setdefault(row_position, []).append((stage, code, note, options))
+    with open_chunk(task) as resource:
+        for row in resource.row_stream:
+            for stage, code, note, options in fetch.get(row.row_position, []):
+                Error = CHUNK_ERRORS[code]
+                error = Error.from_row(row, note=note, **options)
+                items.append((row.row_position, stage, error))
+    return items
+
+
+def open_chunk(task):
+    from .resource import Resource
+
+    with open(task["path"], "rb") as file:
+        source = file.read(task["header"])
+        file.seek(task["start"])
+        source += file.read(task["end"] - task["start"])
+    return Resource(
+        source,
+        format="csv",
+        encoding=task["encoding"],
+        dialect=task["dialect"],
+        schema=task["schema"],
+        detector=task["detector"],
+    )
+
+
+def shift_chunk_error(error, *, offset):
+    if offset:
+        error["rowNumber"] += offset
+        error["rowPosition"] += offset
+        error["message"] = helpers.safe_format(error.template, error)
+    return error
+
+
+class ChunkRow(dict):
+    def __init__(self, cells, *, row_position):
+        super().__init__(cells)
+        self.row_position = row_position
+
+
+CHUNK_ERRORS = {
+    "unique": errors_module.UniqueError,
+    "primary-key": errors_module.PrimaryKeyError,
+    "duplicate-row": errors_module.DuplicateRowError,
+}
@@ -1,5 +1,6 @@
 from itertools import zip_longest
 from importlib import import_module
+from collections.abc import Mapping
 from .helpers import cached_property
 from . import helpers
 from . import errors
@@ -210,29 +211,9 @@ class Row(dict):
         Returns:
             dict: a row as a list
         """
-
-        # Prepare
         self.__process()
-        plugin = import_module("frictionless.plugins.json")
         result = [self[name] for name in self.__field_info["names"]]
-        if types is None and json:
-            types = plugin.JsonParser.supported_types
-
-        # Convert
-        if types is not None:
-            for index, field in enumerate(self.__field_info["objects"]):
-                # Here we can optimize performance if we use a types mapping
-                if field.type in types:
-                    continue
-                # NOTE: Move somehow to be in the json plugin
-                if json is True and field.type == "number" and field.float_number:
-                    continue
-                cell = result[index]
-                cell, notes = field.write_cell(cell, ignore_missing=True)
-                result[index] = cell
-
-        # Return
-        return result
+        return write_list(result, field_info=self.__field_info, json=json, types=types)
 
     def to_dict(self, *, json=False, types=None):
         """
@@ -242,25 +223,9 @@ class Row(dict):
         Returns:
             dict: a row as a dictionary
         """
-
-        # Prepare
         self.__process()
-        plugin = import_module("frictionless.plugins.json")
         result = {name: self[name] for name in self.__field_info["names"]}
-        if types is None and json:
-            types = plugin.JsonParser.supported_types
-
-        # Covert
-        if types is not None:
-            for index, field in enumerate(self.__field_info["objects"]):
-                # Here we can optimize performance if we use a types mapping
-                if field.type not in types:
-                    cell = result[field.name]
-                    cell, notes = field.write_cell(cell, ignore_missing=True)
-                    result[field.name] = cell
-
-        # Return
-        return result
+        return write_dict(result, field_info=self.__field_info, json=json, types=types)
 
     # Process
 
@@ -276,126 +241,489 @@ class Row(dict):
 
         # Prepare context
         cells = self.__cells
-        to_str = lambda v: str(v) if v is not None else ""
-        fields = self.__field_info["objects"]
         field_mapping = self.__field_info["mapping"]
-        field_positions = self.__field_info["positions"]
-        iterator = zip_longest(field_mapping.values(), cells)
-        is_empty = not bool(super().__len__())
+        mappings = field_mapping.values()
         if key:
             try:
-                field, field_number, field_position = self.__field_info["mapping"][key]
+                mappings = [field_mapping[key]]
             except KeyError:
                 raise KeyError(f"Row does not have a field {key}")
-            cell = cells[field_number - 1] if len(cells) >= field_number else None
-            iterator = zip([(field, field_number, field_position)], [cell])
+        elif super().__len__():
+            mappings = [m for m in mappings if not dict.__contains__(self, m[0].name)]
+
+        # Read cells
+        targets = read_cells(
+            cells,
+            mappings,
+            field_info=self.__field_info,
+            row_number=self.__row_number,
+            row_position=self.__row_position,
+            blank_cells=self.__blank_cells,
+            error_cells=self.__error_cells,
+            row_errors=self.__errors,
+        )
+
+        # Set/return value
+        for (field, _, _), target in zip(mappings, targets):
+            super().__setitem__(field.name, target)
+        if key:
+            return targets[0]
+
+        # Read errors
+        self.__errors = read_errors(
+            cells,
+            field_info=self.__field_info,
+            row_number=self.__row_number,
+            row_position=self.__row_position,
+            blank_cells=self.__blank_cells,
+            row_errors=self.__errors,
+        )
 
-        # Iterate cells
-        for field_mapping, source in iterator:
+        # Set processed
+        self.__processed = True
 
-            # Prepare context
-            if field_mapping is None:
-                break
-            field, field_number, field_position = field_mapping
-            if not is_empty and super().__contains__(field.name):
-                continue
 
-            # Read cell
-            target, notes = field.read_cell(source)
-            type_note = notes.pop("type", None) if notes else None
-            if target is None and not type_note:
-                self.__blank_cells[field.name] = source
-
-            # Type error
-            if type_note:
-                self.__error_cells[field.name] = source
-                self.__errors.append(
-                    errors.TypeError(
-                        note=type_note,
-                        cells=list(map(to_str, cells)),
-                        row_number=self.__row_number,
-                        row_position=self.__row_position,
-                        cell=str(source),
-                        field_name=field.name,
-                        field_number=field_number,
-                        field_position=field_position,
-                    )
-                )
+class CompactRow(Mapping):
+    """Compact row representation
 
-            # NOTE: review this logic (why we can't skip reading also?)
-            # Check constriants if there is an existent cell
-            # Otherwise we emit only "missing-cell" which is enough
-            if field_position:
-
-                # Constraint errors
-                if notes:
-                    for note in notes.values():
-                        self.__errors.append(
-                            errors.ConstraintError(
-                                note=note,
-                                cells=list(map(to_str, cells)),
-                                row_number=self.__row_number,
-                                row_position=self.__row_position,
-                                cell=str(source),
-                                field_name=field.name,
-                                field_number=field_number,
-                                field_position=field_position,
-                            )
-                        )
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import CompactRow`
 
-            # Set/return value
-            super().__setitem__(field.name, target)
-            if key:
-                return target
-
-        # Extra cells
-        if len(fields) < len(cells):
-            iterator = cells[len(fields) :]
-            start = max(field_positions[: len(fields)]) + 1
-            for field_position, cell in enumerate(iterator, start=start):
-                self.__errors.append(
-                    errors.ExtraCellError(
-                        note="",
-                        cells=list(map(to_str, cells)),
-                        row_number=self.__row_number,
-                        row_position=self.__row_position,
-                        cell=str(cell),
-                        field_name="",
-                        field_number=len(fields) + field_position - start,
-                        field_position=field_position,
-                    )
-                )
+    > Constructor of this object is not Public API
+
+    It's a memory efficient alternative to the `Row` class provided
+    by `Resource(..., row_type="compact")`. It has the same API as `Row`
+    being a read-only mapping instead of a dict. Parsed cells are stored
+    in a list and error containers are created only if they are not empty.
+
+    Parameters:
+        cells (any[]): array of cells
+        field_info (dict): special field info structure
+        row_position (int): row position from 1
+        row_number (int): row number from 1
+    """
+
+    __slots__ = (
+        "__cells",
+        "__field_info",
+        "__row_position",
+        "__row_number",
+        "__targets",
+        "__blank_cells",
+        "__error_cells",
+        "__errors",
+    )
+
+    def __init__(
+        self,
+        cells,
+        *,
+        field_info,
+        row_position,
+        row_number,
+    ):
+        self.__cells = cells
+        self.__field_info = field_info
+        self.__row_position = row_position
+        self.__row_number = row_number
+        self.__targets = None
+        self.__blank_cells = None
+        self.__error_cells = None
+        self.__errors = None
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __str__(self):
+        return str(dict(self.items()))
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __getitem__(self, key):
+        try:
+            field, field_number, field_position = self.__field_info["mapping"][key]
+        except KeyError:
+            raise KeyError(f"Row does not have a field {key}")
+        self.__process()
+        return self.__targets[field_number - 1]
 
-        # Missing cells
-        if len(fields) > len(cells):
-            start = len(cells) + 1
-            iterator = zip_longest(field_positions[len(cells) :], fields[len(cells) :])
-            for field_number, (field_position, field) in enumerate(iterator, start=start):
-                if field is not None:
-                    self.__errors.append(
-                        errors.MissingCellError(
-                            note="",
-                            cells=list(map(to_str, cells)),
-                            row_number=self.__row_number,
-                            row_position=self.__row_position,
-                            cell="",
+    def __setitem__(self, key, value):
+        try:
+            field, field_number, field_position = self.__field_info["mapping"][key]
+        except KeyError:
+            raise KeyError(f"Row does not have a field {key}")
+        self.__process()
+        if len(self.__cells) < field_number:
+            self.__cells.extend([None] * (field_number - len(self.__cells)))
+        self.__cells[field_number - 1] = value
+        self.__targets[field_number - 1] = value
+
+    def __iter__(self):
+        return iter(self.__field_info["names"])
+
+    def __len__(self):
+        return len(self.__field_info["names"])
+
+    def __contains__(self, key):
+        return key in self.__field_info["mapping"]
+
+    def keys(self):
+        return iter(self.__field_info["names"])
+
+    def values(self):
+        self.__process()
+        return iter(self.__targets)
+
+    def items(self):
+        self.__process()
+        return zip(self.__field_info["names"], self.__targets)
+
+    def get(self, key, default=None):
+        if key not in self.__field_info["mapping"]:
+            return default
+        return self[key]
+
+    @property
+    def cells(self):
+        """
+        Returns:
+            Field[]: table schema fields
+        """
+        return self.__cells
+
+    @property
+    def fields(self):
+        """
+        Returns:
+            Field[]: table schema fields
+        """
+        return self.__field_info["objects"]
+
+    @property
+    def field_names(self):
+        """
+        Returns:
+            Schema: table schema
+        """
+        return self.__field_info["names"]
+
+    @property
+    def field_positions(self):
+        """
+        Returns:
+            int[]: table field positions
+        """
+        return self.__field_info["positions"]
+
+    @property
+    def row_position(self):
+        """
+        Returns:
+            int: row position from 1
+        """
+        return self.__row_position
+
+    @property
+    def row_number(self):
+        """
+        Returns:
+            int: row number from 1
+        """
+        return self.__row_number
+
+    @property
+    def blank_cells(self):
+        """A mapping indexed by a field name with blank cells before parsing
+
+        Returns:
+            dict: row blank cells
+        """
+        self.__process()
+        if self.__blank_cells is None:
+            self.__blank_cells = {}
+        return self.__blank_cells
+
+    @property
+    def error_cells(self):
+        """A mapping indexed by a field name with error cells before parsing
+
+        Returns:
+            dict: row error cells
+        """
+        self.__process()
+        if self.__error_cells is None:
+            self.__error_cells = {}
+        return self.__error_cells
+
+    @property
+    def errors(self):
+        """
+        Returns:
+            Error[]: row errors
+        """
+        self.__process()
+        if self.__errors is None:
+            self.__errors = []
+        return self.__errors
+
+    @property
+    def valid(self):
+        """
+        Returns:
+            bool: if row valid
+        """
+        self.__process()
+        return not self.__errors
+
+    # Import/Export
+
+    def to_str(self):
+        """
+        Returns:
+            str: a row as a CSV string
+        """
+        plugin = import_module("frictionless.plugins.csv")
+        cells = self.to_list(types=plugin.CsvParser.supported_types)
+        return helpers.stringify_csv_string(cells)
+
+    def to_list(self, *, json=False, types=None):
+        """
+        Parameters:
+            json (bool): make data types compatible with JSON format
+            types (str[]): list of supported types
+
+        Returns:
+            dict: a row as a list
+        """
+        self.__process()
+        result = list(self.__targets)
+        return write_list(result, field_info=self.__field_info, json=json, types=types)
+
+    def to_dict(self, *, json=False, types=None):
+        """
+        Parameters:
+            json (bool): make data types compatible with JSON format
+
+        Returns:
+            dict: a row as a dictionary
+        """
+        self.__process()
+        result = dict(zip(self.__field_info["names"], self.__targets))
+        return write_dict(result, field_info=self.__field_info, json=json, types=types)
+
+    # Process
+
+    def __process(self):
+
+        # Exit if processed
+        if self.__targets is not None:
+            return
+
+        # Read cells
+        blank_cells = {}
+        error_cells = {}
+        row_errors = []
+        self.__targets = read_cells(
+            self.__cells,
+            self.__field_info["mapping"].values(),
+            field_info=self.__field_info,
+            row_number=self.__row_number,
+            row_position=self.__row_position,
+            blank_cells=blank_cells,
+            error_cells=error_cells,
+            row_errors=row_errors,
+        )
+
+        # Read errors
+        row_errors = read_errors(
+            self.__cells,
+            field_info=self.__field_info,
+            row_number=self.__row_number,
+            row_position=self.__row_position,
+            blank_cells=blank_cells,
+            row_errors=row_errors,
+        )
+
+        # Store containers
+        self.__blank_cells = blank_cells or None
+        self.__error_cells = error_cells or None
+        self.__errors = row_errors or None
+
+
+# Internal
+
+
+def read_cells(
+    cells,
+    mappings,
+    *,
+    field_info,
+    row_number,
+    row_position,
+    blank_cells,
+    error_cells,
+    row_errors,
+):
+    # Prepare context
+    targets = []
+    text_cells = None
+    field_readers = field_info["readers"]
+
+    # Iterate cells
+    for field, field_number, field_position in mappings:
+        source = cells[field_number - 1] if len(cells) >= field_number else None
+
+        # Read cell
+        target, notes = field_readers[field.name](source)
+        type_note = notes.pop("type", None) if notes else None
+        if target is None and not type_note:
+            blank_cells[field.name] = source
+
+        # Type error
+        if type_note:
+            text_cells = text_cells or list(map(to_str, cells))
+            error_cells[field.name] = source
+            row_errors.append(
+                errors.TypeError(
+                    note=type_note,
+                    cells=list(text_cells),
+                    row_number=row_number,
+                    row_position=row_position,
+                    cell=str(source),
+                    field_name=field.name,
+                    field_number=field_number,
+                    field_position=field_position,
+                )
+            )
+
+        # NOTE: review this logic (why we can't skip reading also?)
+        # Check constriants if there is an existent cell
+        # Otherwise we emit only "missing-cell" which is enough
+        if field_position:
+
+            # Constraint errors
+            if notes:
+                text_cells = text_cells or list(map(to_str, cells))
+                for note in notes.values():
+                    row_errors.append(
+                        errors.ConstraintError(
+                            note=note,
+                            cells=list(text_cells),
+                            row_number=row_number,
+                            row_position=row_position,
+                            cell=str(source),
                             field_name=field.name,
                             field_number=field_number,
-                            field_position=field_position
-                            or max(field_positions) + field_number - start + 1,
+                            field_position=field_position,
                         )
                     )
 
-        # Blank row
-        if len(fields) == len(self.__blank_cells):
-            self.__errors = [
-                errors.BlankRowError(
+        targets.append(target)
+
+    return targets
+
+
+def read_errors(cells, *, field_info, row_number, row_position, blank_cells, row_errors):
+    # Prepare context
+    fields = field_info["objects"]
+    field_positions = field_info["positions"]
+
+    # Extra cells
+    if len(fields) < len(cells):
+        text_cells = list(map(to_str, cells))
+        iterator = cells[len(fields) :]
+        start = max(field_positions[: len(fields)]) + 1
+        for field_position, cell in enumerate(iterator, start=start):
+            row_errors.append(
+                errors.ExtraCellError(
                     note="",
-                    cells=list(map(to_str, cells)),
-                    row_number=self.__row_number,
-                    row_position=self.__row_position,
+                    cells=list(text_cells),
+                    row_number=row_number,
+                    row_position=row_position,
+                    cell=str(cell),
+                    field_name="",
+                    field_number=len(fields) + field_position - start,
+                    field_position=field_position,
+                )
+            )
+
+    # Missing cells
+    if len(fields) > len(cells):
+        text_cells = list(map(to_str, cells))
+        start = len(cells) + 1
+        iterator = zip_longest(field_positions[len(cells) :], fields[len(cells) :])
+        for field_number, (field_position, field) in enumerate(iterator, start=start):
+            if field is not None:
+                row_errors.append(
+                    errors.MissingCellError(
+                        note="",
+                        cells=list(text_cells),
+                        row_number=row_number,
+                        row_position=row_position,
+                        cell="",
+                        field_name=field.name,
+                        field_number=field_number,
+                        field_position=field_position
+                        or max(field_positions) + field_number - start + 1,
+                    )
                 )
-            ]
 
-        # Set processed
-        self.__processed = True
+    # Blank row
+    if len(fields) == len(blank_cells):
+        text_cells = list(map(to_str, cells))
+        row_errors = [
+            errors.BlankRowError(
+                note="",
+                cells=list(text_cells),
+                row_number=row_number,
+                row_position=row_position,
+            )
+        ]
+
+    return row_errors
+
+
+def write_list(result, *, field_info, json, types):
+    plugin = import_module("frictionless.plugins.json")
+    if types is None and json:
+        types = plugin.JsonParser.supported_types
+
+    # Convert
+    if types is not None:
+        for index, field in enumerate(field_info["objects"]):
+            # Here we can optimize performance if we use a types mapping
+            if field.type in types:
+                continue
+            # NOTE: Move somehow to be in the json plugin
+            if json is True and field.type == "number" and field.float_number:
+                continue
+            cell = result[index]
+            cell, notes = field.write_cell(cell, ignore_missing=True)
+            result[index] = cell
+
+    return result
+
+
+def write_dict(result, *, field_info, json, types):
+    plugin = import_module("frictionless.plugins.json")
+    if types is None and json:
+        types = plugin.JsonParser.supported_types
+
+    # Covert
+    if types is not None:
+        for index, field in enumerate(field_info["objects"]):
+            # Here we can optimize performance if we use a types mapping
+            if field.type not in types:
+                cell = result[field.name]
+                cell, notes = field.write_cell(cell, ignore_missing=True)
+                result[field.name] = cell
+
+    return result
+
+
+def to_str(value):
+    return str(value) if value is not None else ""
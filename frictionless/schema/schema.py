@@ -209,6 +209,14 @@ class Schema(Metadata):
             result_notes.append(notes)
         return result_cells, result_notes
 
+    def create_cell_readers(self):
+        """Create cell readers (see `field.create_cell_reader`)
+
+        Returns:
+            dict: a mapping of field names to cell readers
+        """
+        return {field.name: field.create_cell_reader() for field in self.fields}
+
     # Write
 
     def write_cells(self, cells, *, types=[]):
@@ -249,30 +257,38 @@ class Schema(Metadata):
         assert isinstance(required, list)
         properties = profile.get("properties", {})
         assert isinstance(properties, dict)
-        for name, prop in properties.items():
-
-            # Field
-            assert isinstance(name, str)
-            assert isinstance(prop, dict)
-            field = Field(name=name)
-            schema.add_field(field)
-
-            # Type
-            type = prop.get("type")
-            if type:
-                assert isinstance(type, str)
-                if type in ["string", "integer", "number", "boolean", "object", "array"]:
-                    field.type = type
-
-            # Description
-            description = prop.get("description")
-            if description:
-                assert isinstance(description, str)
-                field.description = description
-
-            # Required
-            if name in required:
-                field.constraints["required"] = True
+        with schema.batch_update():
+            for name, prop in properties.items():
+
+                # Field
+                assert isinstance(name, str)
+                assert isinstance(prop, dict)
+                field = Field(name=name)
+                schema.add_field(field)
+
+                # Type
+                type = prop.get("type")
+                if type:
+                    assert isinstance(type, str)
+                    if type in [
+                        "string",
+                        "integer",
+                        "number",
+                        "boolean",
+                        "object",
+                        "array",
+                    ]:
+                        field.type = type
+
+                # Description
+                description = prop.get("description")
+                if description:
+                    assert isinstance(description, str)
+                    field.description = description
+
+                # Required
+                if name in required:
+                    field.constraints["required"] = True
 
         return schema
 
@@ -326,7 +342,7 @@ class Schema(Metadata):
                 field.schema = self
             if not isinstance(fields, helpers.ControlledList):
                 fields = helpers.ControlledList(fields)
-                fields.__onchange__(self.metadata_process)
+                fields.__onchange__(self.metadata_process_nested)
                 dict.__setitem__(self, "fields", fields)
 
     def metadata_validate(self):
@@ -18,7 +18,7 @@ def read_asset(*paths, encoding="utf-8"):
 
 UNDEFINED = object()
 VERSION = read_asset("VERSION")
-COMPRESSION_FORMATS = ["zip", "gz"]
+COMPRESSION_FORMATS = ["zip", "gz", "bz2", "xz", "zst"]
 INQUIRY_PROFILE = json.loads(read_asset("profiles", "inquiry.json"))
 PIPELINE_PROFILE = json.loads(read_asset("profiles", "pipeline.json"))
 REPORT_PROFILE = json.loads(read_asset("profiles", "report.json"))
@@ -31,6 +31,8 @@ FISCAL_PACKAGE_PROFILE = json.loads(read_asset("profiles", "package", "fiscal.js
 TABULAR_PACKAGE_PROFILE = json.loads(read_asset("profiles", "package", "tabular.json"))
 GEOJSON_PROFILE = json.loads(read_asset("profiles", "geojson", "general.json"))
 TOPOJSON_PROFILE = json.loads(read_asset("profiles", "geojson", "topojson.json"))
+PROFILE_CACHE_SIZE = 100
+PROFILE_CACHE_PATH = os.environ.get("FRICTIONLESS_PROFILE_CACHE_PATH")
 
 
 # Defaults
@@ -52,6 +54,9 @@ DEFAULT_MISSING_VALUES = [""]
 DEFAULT_LIMIT_ERRORS = 1000
 DEFAULT_LIMIT_MEMORY = 1000
 DEFAULT_BUFFER_SIZE = 10000
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CHUNK_SIZE = 64000000
+DEFAULT_INDEX_THRESHOLD = 0
 DEFAULT_SAMPLE_SIZE = 100
 DEFAULT_ENCODING_CONFIDENCE = 0.5
 DEFAULT_FIELD_CONFIDENCE = 0.9
@@ -46,6 +46,21 @@ class Type:
         """
         raise NotImplementedError()
 
+    def read_cells(self, cells):
+        """Convert a column of cells (read direction)
+
+        This method can be overriden by a type to provide a faster
+        column-wise conversion. It has to return the same results
+        as calling `type.read_cell` for every cell.
+
+        Parameters:
+            cells (any[]): cells to covert
+
+        Returns:
+            any[]: converted cells
+        """
+        return list(map(self.read_cell, cells))
+
     # Write
 
     def write_cell(self, cell):
@@ -1,3 +1,4 @@
+import re
 import json
 from ..type import Type
 
@@ -37,7 +38,23 @@ class ArrayType(Type):
                 return None
         return cell
 
+    def read_cells(self, cells):
+        result = []
+        for cell in cells:
+            # Strings not matching the pattern can't be read
+            if type(cell) is str and not array_pattern.match(cell):
+                cell = None
+            elif cell is not None:
+                cell = self.read_cell(cell)
+            result.append(cell)
+        return result
+
     # Write
 
     def write_cell(self, cell):
         return json.dumps(cell)
+
+
+# Internal
+
+array_pattern = re.compile(r"[ \t\n\r]*\[")
@@ -25,6 +25,12 @@ class BooleanType(Type):
             return cell
         return self.read_cell_mapping.get(cell)
 
+    def read_cells(self, cells):
+        mapping = self.read_cell_mapping
+        return [
+            cell if cell is True or cell is False else mapping.get(cell) for cell in cells
+        ]
+
     @cached_property
     def read_cell_mapping(self):
         mapping = {}
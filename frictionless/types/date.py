@@ -1,3 +1,4 @@
+import re
 from datetime import datetime, date
 from dateutil.parser import parse
 from ..type import Type
@@ -51,8 +52,26 @@ class DateType(Type):
 
         return cell
 
+    def read_cells(self, cells):
+        if self.field.format != "default":
+            return super().read_cells(cells)
+        result = []
+        for cell in cells:
+            # Strings not matching the pattern can't be read
+            if type(cell) is str and not date_pattern.fullmatch(cell):
+                cell = None
+            elif cell is not None:
+                cell = self.read_cell(cell)
+            result.append(cell)
+        return result
+
     # Write
 
     def write_cell(self, cell):
         format = self.field.get("format", settings.DEFAULT_DATE_PATTERN)
         return cell.strftime(format)
+
+
+# Internal
+
+date_pattern = re.compile(r"\d{4}-\d\d?-[ \d]?\d")
@@ -42,6 +42,19 @@ class DatetimeType(Type):
                 return None
         return cell
 
+    def read_cells(self, cells):
+        if self.field.format != "default":
+            return super().read_cells(cells)
+        result = []
+        for cell in cells:
+            # Guard against shorter formats without raising
+            if type(cell) is str and not (len(cell) >= 19 and cell[16] == ":"):
+                cell = None
+            elif cell is not None:
+                cell = self.read_cell(cell)
+            result.append(cell)
+        return result
+
     # Write
 
     def write_cell(self, cell):
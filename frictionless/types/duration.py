@@ -1,3 +1,4 @@
+import re
 import isodate
 import datetime
 from ..type import Type
@@ -31,7 +32,23 @@ class DurationType(Type):
                 return None
         return cell
 
+    def read_cells(self, cells):
+        result = []
+        for cell in cells:
+            # Strings not matching the pattern can't be read
+            if type(cell) is str and not duration_pattern.match(cell):
+                cell = None
+            elif cell is not None:
+                cell = self.read_cell(cell)
+            result.append(cell)
+        return result
+
     # Write
 
     def write_cell(self, cell):
         return isodate.duration_isoformat(cell)
+
+
+# Internal
+
+duration_pattern = re.compile(r"[+-]?P")
@@ -1,3 +1,4 @@
+import re
 import json
 from jsonschema.validators import validator_for
 from .. import settings
@@ -37,6 +38,17 @@ class GeojsonType(Type):
                 return None
         return cell
 
+    def read_cells(self, cells):
+        result = []
+        for cell in cells:
+            # Strings not matching the pattern can't be read
+            if type(cell) is str and not object_pattern.match(cell):
+                cell = None
+            elif cell is not None:
+                cell = self.read_cell(cell)
+            result.append(cell)
+        return result
+
     # Write
 
     def write_cell(self, cell):
@@ -45,6 +57,7 @@ class GeojsonType(Type):
 
 # Internal
 
+object_pattern = re.compile(r"[ \t\n\r]*\{")
 
 validators = {
     "default": validator_for(settings.GEOJSON_PROFILE)(settings.GEOJSON_PROFILE),
@@ -56,6 +56,19 @@ class GeopointType(Type):
 
         return cell
 
+    def read_cells(self, cells):
+        if self.field.format != "default":
+            return super().read_cells(cells)
+        result = []
+        for cell in cells:
+            # Strings without exactly one separator can't be read
+            if type(cell) is str and not cell.count(",") == 1:
+                cell = None
+            elif cell is not None:
+                cell = self.read_cell(cell)
+            result.append(cell)
+        return result
+
     # Write
 
     def write_cell(self, cell):
@@ -42,6 +42,21 @@ class IntegerType(Type):
             return int(cell)
         return None
 
+    def read_cells(self, cells):
+        if self.read_cell_pattern:
+            return super().read_cells(cells)
+        result = []
+        for cell in cells:
+            if type(cell) is str:
+                try:
+                    cell = int(cell)
+                except Exception:
+                    cell = None
+            elif cell is not None:
+                cell = self.read_cell(cell)
+            result.append(cell)
+        return result
+
     @Metadata.property(write=False)
     def read_cell_pattern(self):
         if not self.field.bare_number:
@@ -47,6 +47,22 @@ class NumberType(Type):
             return Primary(str(cell) if Primary is Decimal else cell)
         return None
 
+    def read_cells(self, cells):
+        if self.read_cell_processor:
+            return super().read_cells(cells)
+        Primary = float if self.field.float_number else Decimal
+        result = []
+        for cell in cells:
+            if type(cell) is str:
+                try:
+                    cell = Primary(cell)
+                except Exception:
+                    cell = None
+            elif cell is not None:
+                cell = self.read_cell(cell)
+            result.append(cell)
+        return result
+
     @Metadata.property(write=False)
     def read_cell_processor(self):
         if set(["groupChar", "decimalChar", "bareNumber"]).intersection(
@@ -49,6 +49,11 @@ class StringType(Type):
                 return None
         return cell
 
+    def read_cells(self, cells):
+        if self.field.format != "default":
+            return super().read_cells(cells)
+        return [cell if isinstance(cell, str) else None for cell in cells]
+
     # Write
 
     def write_cell(self, cell):
@@ -41,6 +41,17 @@ class YearmonthType(Type):
             return None
         return cell
 
+    def read_cells(self, cells):
+        result = []
+        for cell in cells:
+            # Strings without exactly one separator can't be read
+            if type(cell) is str and not cell.count("-") == 1:
+                cell = None
+            elif cell is not None:
+                cell = self.read_cell(cell)
+            result.append(cell)
+        return result
+
     # Write
 
     def write_cell(self, cell):
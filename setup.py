@@ -49,10 +49,12 @@ EXTRAS_REQUIRE = {
     "json": ["ijson>=3.0", "jsonlines>=1.2"],
     "ods": ["ezodf>=0.3", "lxml>=4.0"],
     "pandas": ["pandas>=1.0"],
+    "parquet": ["pyarrow>=8.0"],
     "s3": ["boto3>=1.9"],
     "server": ["gunicorn>=20.0", "flask>=1.1"],
     "spss": ["savReaderWriter>=3.0"],
     "sql": ["sqlalchemy>=1.3"],
+    "zstd": ["zstandard>=0.15"],
     "dev": TESTS_REQUIRE
 }
 INSTALL_REQUIRES = [
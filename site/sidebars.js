@@ -68,6 +68,7 @@ module.exports = {
         "tutorials/formats/json-tutorial",
         "tutorials/formats/ods-tutorial",
         "tutorials/formats/pandas-tutorial",
+        "tutorials/formats/parquet-tutorial",
         "tutorials/formats/spss-tutorial",
         "tutorials/formats/sql-tutorial",
       ],
@@ -1199,3 +1199,22 @@ def test_validate_resource_duplicate_labels_with_sync_schema_issue_910():
             'Duplicate labels in header is not supported with "schema_sync"',
         ],
     ]
+
+
+# Engines
+
+
+@pytest.mark.parametrize("options", [{"engine": "columnar"}, {"workers": 2}])
+def test_validate_resource_engine_options(options):
+    keys = ["rowPosition", "fieldPosition", "code"]
+    report = validate("data/invalid.csv")
+    report_engine = validate("data/invalid.csv", **options)
+    assert report_engine.flatten(keys) == report.flatten(keys)
+    assert report_engine.task.resource.stats == report.task.resource.stats
+
+
+def test_validate_resource_engine_not_supported():
+    report = validate("data/table.csv", engine="bad")
+    assert report.flatten(["code", "note"]) == [
+        ["task-error", 'validation engine "bad" is not supported'],
+    ]
@@ -1,3 +1,4 @@
+import pytest
 from frictionless import validate, checks
 
 
@@ -14,3 +15,46 @@ def test_validate_duplicate_row():
 def test_validate_duplicate_row_valid():
     report = validate("data/table.csv", checks=[{"code": "duplicate-row"}])
     assert report.flatten(["rowPosition", "fieldPosition", "code"]) == []
+
+
+def test_validate_duplicate_row_bounded():
+    check = {"code": "duplicate-row", "memory": "bounded", "capacity": 100}
+    report = validate("data/duplicate-rows.csv", checks=[check])
+    assert report.flatten(["rowPosition", "fieldPosition", "code", "note"]) == [
+        [4, None, "duplicate-row", 'the same as row at position "2"'],
+    ]
+
+
+def test_validate_duplicate_row_bounded_false_positives():
+    source = [["id", "name"]] + [[str(i), "a"] for i in range(100)] + [["5", "a"]]
+    check = checks.duplicate_row(memory="bounded", capacity=1, error_rate=0.5)
+    report = validate(source, checks=[check])
+    assert report.flatten(["rowPosition", "code", "note"]) == [
+        [102, "duplicate-row", 'the same as row at position "7"'],
+    ]
+
+
+def test_validate_duplicate_row_bounded_spill():
+    source = [["id", "name"]] + [[str(i % 3), "a"] for i in range(6)]
+    source.insert(5, ["1"])
+    check = checks.duplicate_row(memory="bounded", capacity=10)
+    report = validate(source, checks=[check], index_threshold=2)
+    assert report.flatten(["rowPosition", "code", "note"]) == [
+        [5, "duplicate-row", 'the same as row at position "2"'],
+        [6, "missing-cell", ""],
+        [7, "duplicate-row", 'the same as row at position "3"'],
+        [8, "duplicate-row", 'the same as row at position "4"'],
+    ]
+
+
+def test_validate_duplicate_row_bounded_capacity_invalid():
+    check = {"code": "duplicate-row", "memory": "bounded", "capacity": 0}
+    report = validate("data/duplicate-rows.csv", checks=[check])
+    assert report.flatten(["code"]) == [["check-error"]]
+
+
+@pytest.mark.parametrize("error_rate", [0, -0.5, 1])
+def test_validate_duplicate_row_bounded_error_rate_invalid(error_rate):
+    check = {"code": "duplicate-row", "memory": "bounded", "errorRate": error_rate}
+    report = validate("data/duplicate-rows.csv", checks=[check])
+    assert report.flatten(["code"]) == [["check-error"]]
@@ -129,6 +129,52 @@ def test_schema_from_synthetic_sparse_sample(confidence):
     }
 
 
+def test_schema_from_large_sample():
+    labels = ["id", "price", "date", "flag", "name"]
+    sample = []
+    for number in range(10000):
+        sample.append(
+            [
+                str(number) if number % 50 else "",
+                f"{number}.5" if number % 3 else str(number),
+                f"2020-01-{number % 28 + 1:02}" if number > 5000 else "",
+                "true" if number % 2 else "false",
+                f"name{number % 7}",
+            ]
+        )
+    detector = Detector(sample_size=10000)
+    schema = detector.detect_schema(sample, labels=labels)
+    assert schema == {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "price", "type": "number"},
+            {"name": "date", "type": "date"},
+            {"name": "flag", "type": "boolean"},
+            {"name": "name", "type": "string"},
+        ],
+    }
+
+
+def test_schema_from_sample_mixed_cells():
+    labels = ["id", "object", "array", "extra"]
+    sample = [
+        [1, '{"key": "value"}', (1, 2), "1"],
+        ["2", '{"key": "value"}', "[3]"],
+        [3.0, "", "[]", "NA"],
+    ]
+    detector = Detector(field_missing_values=["", "NA"])
+    schema = detector.detect_schema(sample, labels=labels)
+    assert schema == {
+        "missingValues": ["", "NA"],
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "object", "type": "object"},
+            {"name": "array", "type": "array"},
+            {"name": "extra", "type": "integer"},
+        ],
+    }
+
+
 def test_schema_infer_no_names():
     sample = [[1], [2], [3]]
     detector = Detector()
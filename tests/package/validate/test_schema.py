@@ -1,5 +1,5 @@
 from copy import deepcopy
-from frictionless import Package, helpers
+from frictionless import Package, LookupCache, helpers, index
 
 
 IS_UNIX = not helpers.is_platform("windows")
@@ -129,3 +129,81 @@ def test_validate_package_schema_multiple_foreign_key_resource_violation_non_exi
             'for "from, to": values "1, 2" not found in the lookup table "cities" as "id, next_id"',
         ],
     ]
+
+
+def test_validate_package_schema_foreign_key_lookup_cache(monkeypatch):
+    descriptor = deepcopy(DESCRIPTOR_FK)
+    descriptor["resources"].append(
+        {
+            "name": "capitals",
+            "data": [["id", "name"], [1, "london"], [2, "paris"], [5, "cairo"]],
+            "schema": {
+                "fields": [
+                    {"name": "id", "type": "integer"},
+                    {"name": "name", "type": "string"},
+                ],
+                "foreignKeys": [
+                    {
+                        "fields": "id",
+                        "reference": {"resource": "people", "fields": "label"},
+                    }
+                ],
+            },
+        }
+    )
+    calls = []
+    read_lookup = index.read_lookup
+    monkeypatch.setattr(
+        index, "read_lookup", lambda *args: calls.append(args) or read_lookup(*args)
+    )
+    package = Package(descriptor)
+    report = package.validate()
+    assert report.flatten(["rowPosition", "fieldPosition", "code", "cells"]) == [
+        [4, None, "foreign-key-error", ["5", "cairo"]],
+    ]
+    assert len(calls) == 1
+    assert package.lookup_cache is None
+
+
+def test_validate_package_schema_foreign_key_lookup_cache_persisted(tmpdir, monkeypatch):
+    cities = tmpdir.join("cities.csv")
+    people = tmpdir.join("people.csv")
+    cities.write("id,name\n1,london\n2,paris\n")
+    people.write("label,population\n1,8\n2,2\n")
+    descriptor = {
+        "resources": [
+            {
+                "name": "cities",
+                "path": "cities.csv",
+                "schema": {
+                    "fields": [
+                        {"name": "id", "type": "integer"},
+                        {"name": "name", "type": "string"},
+                    ],
+                    "foreignKeys": [
+                        {
+                            "fields": "id",
+                            "reference": {"resource": "people", "fields": "label"},
+                        }
+                    ],
+                },
+            },
+            {"name": "people", "path": "people.csv"},
+        ]
+    }
+    cache = str(tmpdir.join("lookup.cache"))
+    calls = []
+    read_lookup = index.read_lookup
+    monkeypatch.setattr(
+        index, "read_lookup", lambda *args: calls.append(args) or read_lookup(*args)
+    )
+    assert Package(descriptor, basepath=str(tmpdir)).validate(lookup_cache=cache).valid
+    assert Package(descriptor, basepath=str(tmpdir)).validate(lookup_cache=cache).valid
+    assert Package(descriptor, basepath=str(tmpdir), lookup_cache=cache).validate().valid
+    package = Package(descriptor, basepath=str(tmpdir))
+    assert package.validate(lookup_cache=LookupCache(path=cache)).valid
+    assert len(calls) == 1
+    people.write("label,population\n1,8\n")
+    report = Package(descriptor, basepath=str(tmpdir)).validate(lookup_cache=cache)
+    assert report.flatten(["rowPosition", "code"]) == [[3, "foreign-key-error"]]
+    assert len(calls) == 2
@@ -16,7 +16,7 @@ from frictionless.plugins.bigquery import BigqueryDialect
 def test_bigquery_parser_write(options):
     prefix = options.pop("prefix")
     service = options.pop("service")
-    dialect = BigqueryDialect(table=prefix, **options)
+    dialect = BigqueryDialect(table=prefix, order_by="id", **options)
     source = Resource("data/table.csv")
     target = source.write(service, dialect=dialect)
     with target:
@@ -1,4 +1,7 @@
+import io
 import os
+import csv
+import gzip
 import json
 import uuid
 import pytest
@@ -7,6 +10,7 @@ from apiclient.discovery import build
 from oauth2client.client import GoogleCredentials
 from frictionless import Package, Resource, FrictionlessException
 from frictionless.plugins.bigquery import BigqueryDialect, BigqueryStorage
+from frictionless.plugins.bigquery import settings
 
 
 # We don't use VCR for this module testing because
@@ -108,13 +112,15 @@ def test_bigquery_storage_integrity(options):
     }
 
     # Assert data (main)
-    assert target.get_resource("integrity_main").read_rows() == [
+    rows = target.get_resource("integrity_main").read_rows()
+    assert sorted(rows, key=lambda row: row["id"]) == [
         {"id": 1, "parent": None, "description": "english"},
         {"id": 2, "parent": 1, "description": "中国人"},
     ]
 
     # Assert data (link)
-    assert target.get_resource("integrity_link").read_rows() == [
+    rows = target.get_resource("integrity_link").read_rows()
+    assert sorted(rows, key=lambda row: row["main_id"]) == [
         {"main_id": 1, "some_id": 1, "description": "note1"},
         {"main_id": 2, "some_id": 2, "description": "note2"},
     ]
@@ -214,6 +220,80 @@ def test_storage_big_file(options):
     storage.delete_package(list(storage))
 
 
+# Paging
+
+
+def test_bigquery_storage_read_pages():
+    service = FakeService(rows=[[str(number), "name"] for number in range(5)])
+    dialect = BigqueryDialect(project="project", dataset="dataset", page_size=2)
+    storage = BigqueryStorage(service, dialect=dialect)
+    resource = storage.read_resource("table")
+    assert resource.read_rows() == [{"id": number, "name": "name"} for number in range(5)]
+    assert [request[0] for request in service.requests] == ["get"] + ["list"] * 3
+    assert [request[1].get("pageToken") for request in service.requests] == [
+        None,
+        None,
+        "2",
+        "4",
+    ]
+    assert service.requests[1][1]["maxResults"] == 2
+
+
+def test_bigquery_storage_read_pages_order_by():
+    service = FakeService(rows=[["1", "a"], ["2", "b"], ["3", "c"]], pending=1)
+    dialect = BigqueryDialect(
+        project="project", dataset="dataset", order_by="id DESC", page_size=2
+    )
+    storage = BigqueryStorage(service, dialect=dialect)
+    resource = storage.read_resource("table")
+    assert resource.read_rows() == [
+        {"id": 3, "name": "c"},
+        {"id": 2, "name": "b"},
+        {"id": 1, "name": "a"},
+    ]
+    assert [request[0] for request in service.requests] == [
+        "get",
+        "query",
+        "getQueryResults",
+        "getQueryResults",
+    ]
+    assert service.requests[1][1]["body"]["query"] == (
+        "SELECT * FROM `project.dataset.table` ORDER BY id DESC"
+    )
+    assert service.requests[3][1]["pageToken"] == "2"
+    assert service.requests[3][1]["location"] == "US"
+
+
+def test_bigquery_storage_write_batches(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL", 0)
+    service = FakeService(polls=2)
+    dialect = BigqueryDialect(
+        project="project", dataset="dataset", batch_size=2, max_jobs=2
+    )
+    storage = BigqueryStorage(service, dialect=dialect)
+    data = [["id", "name"]] + [[number, f"name{number}"] for number in range(5)]
+    storage.write_resource(Resource(name="table", data=data))
+    assert [request[0] for request in service.requests].count("insert") == 4
+    assert service.max_running == 2
+    assert service.running == 0
+    resource = storage.read_resource("table")
+    assert sorted(resource.read_rows(), key=lambda row: row["id"]) == [
+        {"id": number, "name": f"name{number}"} for number in range(5)
+    ]
+
+
+def test_bigquery_storage_write_job_error(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL", 0)
+    service = FakeService(errors=["bad row"])
+    dialect = BigqueryDialect(project="project", dataset="dataset")
+    storage = BigqueryStorage(service, dialect=dialect)
+    with pytest.raises(FrictionlessException) as excinfo:
+        storage.write_resource(Resource(name="table", data=[["id"], [1]]))
+    error = excinfo.value.error
+    assert error.code == "storage-error"
+    assert error.note == "bad row"
+
+
 # Fixtures
 
 
@@ -228,3 +308,138 @@ def options(google_credentials_path):
             "dataset": "python",
             "prefix": "%s_" % uuid.uuid4().hex,
         }
+
+
+# Helpers
+
+
+class FakeService:
+    """Discovery client mock keeping tables in memory
+
+    Query results are sorted by the first column in descending order. Load jobs
+    are done after the given number of polls and they fail with the given errors.
+    """
+
+    def __init__(self, rows=None, *, pending=0, polls=0, errors=None):
+        self.tables_ = {}
+        self.jobs_ = {}
+        self.pending = pending
+        self.polls = polls
+        self.errors = errors
+        self.running = 0
+        self.max_running = 0
+        self.requests = []
+        if rows is not None:
+            fields = [
+                {"name": "id", "type": "INTEGER", "mode": "NULLABLE"},
+                {"name": "name", "type": "STRING", "mode": "NULLABLE"},
+            ]
+            self.tables_["table"] = {"schema": {"fields": fields}, "rows": rows}
+
+    def tables(self):
+        methods = dict(get=self.get_table, list=self.list_tables)
+        return FakeResource(self, insert=self.insert_table, **methods)
+
+    def tabledata(self):
+        return FakeResource(self, list=self.list_rows)
+
+    def jobs(self):
+        methods = dict(query=self.query, getQueryResults=self.get_query_results)
+        return FakeResource(self, insert=self.insert_job, get=self.get_job, **methods)
+
+    # Tables
+
+    def get_table(self, *, tableId, **options):
+        return {"schema": self.tables_[tableId]["schema"]}
+
+    def list_tables(self, **options):
+        names = list(self.tables_)
+        return {"tables": [{"tableReference": {"tableId": name}} for name in names]}
+
+    def insert_table(self, *, body, **options):
+        name = body["tableReference"]["tableId"]
+        self.tables_[name] = {"schema": body["schema"], "rows": []}
+
+    def list_rows(self, *, tableId, **options):
+        return self.read_page(self.tables_[tableId]["rows"], options)
+
+    # Queries
+
+    def query(self, *, body, **options):
+        reference = {"projectId": "project", "jobId": "job", "location": "US"}
+        response = {"jobReference": reference, "jobComplete": False}
+        if not self.pending:
+            response.update(self.read_page(self.read_sorted_rows(), body))
+        return response
+
+    def get_query_results(self, **options):
+        self.pending = max(self.pending - 1, 0)
+        reference = {"projectId": "project", "jobId": "job", "location": "US"}
+        response = {"jobReference": reference, "jobComplete": not self.pending}
+        response.update(self.read_page(self.read_sorted_rows(), options))
+        return response
+
+    def read_sorted_rows(self):
+        rows = self.tables_["table"]["rows"]
+        return sorted(rows, key=lambda cells: int(cells[0]), reverse=True)
+
+    def read_page(self, rows, options):
+        start = int(options.get("pageToken", 0))
+        end = start + options["maxResults"]
+        page = {"rows": [{"f": [{"v": cell} for cell in cells]} for cells in rows]}
+        page["rows"] = page["rows"][start:end]
+        if end < len(rows):
+            page["pageToken"] = str(end)
+        return page
+
+    # Jobs
+
+    def insert_job(self, *, body, media_body, **options):
+        bytes = media_body.getbytes(0, media_body.size())
+        text = gzip.decompress(bytes).decode("utf-8")
+        job_id = str(len(self.jobs_))
+        self.jobs_[job_id] = {
+            "name": body["configuration"]["load"]["destinationTable"]["tableId"],
+            "rows": list(csv.reader(io.StringIO(text))),
+            "polls": self.polls,
+        }
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        return {"jobReference": {"projectId": "project", "jobId": job_id}}
+
+    def get_job(self, *, jobId, **options):
+        job = self.jobs_[jobId]
+        job["polls"] -= 1
+        if job["polls"] >= 0:
+            return {"status": {"state": "RUNNING"}}
+        if job["polls"] == -1:
+            self.running -= 1
+            if not self.errors:
+                self.tables_[job["name"]]["rows"].extend(job["rows"])
+        status = {"state": "DONE"}
+        if self.errors:
+            status["errors"] = [{"message": message} for message in self.errors]
+        return {"status": status}
+
+
+class FakeResource:
+    def __init__(self, service, **methods):
+        self.service = service
+        self.methods = methods
+
+    def __getattr__(self, name):
+        method = self.methods[name]
+
+        def request(**options):
+            self.service.requests.append((name, options))
+            return FakeRequest(lambda: method(**options))
+
+        return request
+
+
+class FakeRequest:
+    def __init__(self, execute):
+        self.execute_ = execute
+
+    def execute(self, **options):
+        return self.execute_()
@@ -1,7 +1,16 @@
+import json
+import time
+import socket
 import pytest
 import datetime
+import requests
+import threading
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from frictionless import Package, Resource, FrictionlessException
+from frictionless import system
 from frictionless.plugins.ckan import CkanStorage, CkanDialect
+from frictionless.plugins.ckan import settings
 
 
 # General
@@ -217,3 +226,178 @@ def test_ckan_storage_delete_resource_not_existent_error(options):
     error = excinfo.value.error
     assert error.code == "storage-error"
     assert error.note.count("does not exist")
+
+
+# Batches
+
+
+def test_ckan_storage_write_batches(ckan_server):
+    dialect = CkanDialect(dataset="dataset", batch_size=100, workers=2)
+    storage = CkanStorage(ckan_server.url, dialect=dialect)
+    data = [["id", "name"]] + [[number, f"name{number}"] for number in range(250)]
+    storage.write_resource(Resource(name="table", data=data))
+    assert ckan_server.count("datastore_upsert") == 3
+    assert ckan_server.active["max"] == 2
+    rows = storage.read_resource("table").read_rows()
+    assert sorted(rows, key=lambda row: row["id"]) == [
+        {"id": number, "name": f"name{number}"} for number in range(250)
+    ]
+
+
+def test_ckan_storage_read_pages(ckan_server):
+    dialect = CkanDialect(dataset="dataset", batch_size=1000)
+    storage = CkanStorage(ckan_server.url, dialect=dialect)
+    data = [["id"]] + [[number] for number in range(250)]
+    storage.write_resource(Resource(name="table", data=data))
+    rows = storage.read_resource("table").read_rows()
+    assert rows == [{"id": number} for number in range(250)]
+    offsets = [query.get("offset") for path, query in ckan_server.requests]
+    assert offsets[-3:] == [None, "100", "200"]
+
+
+def test_ckan_storage_read_retries(ckan_server, monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_RETRY_DELAY", 0)
+    dialect = CkanDialect(dataset="dataset")
+    storage = CkanStorage(ckan_server.url, dialect=dialect)
+    storage.write_resource(Resource(name="table", data=[["id"], [1], [2]]))
+    resource = storage.read_resource("table")
+    ckan_server.failing = "datastore_search"
+    ckan_server.failures = 2
+    assert resource.read_rows() == [{"id": 1}, {"id": 2}]
+    assert ckan_server.failures == 0
+
+
+def test_ckan_storage_write_retries_insert_not_sent(ckan_server, monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_RETRY_DELAY", 0)
+    dialect = CkanDialect(dataset="dataset")
+    storage = CkanStorage(ckan_server.url, dialect=dialect)
+    with system.use_http_session(RefusingSession(refusals=2)):
+        storage.write_resource(Resource(name="table", data=[["id"], [1], [2]]))
+    assert ckan_server.count("datastore_upsert") == 1
+    assert storage.read_resource("table").read_rows() == [{"id": 1}, {"id": 2}]
+
+
+def test_ckan_storage_write_retries_insert_sent(ckan_server, monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_RETRY_DELAY", 0)
+    ckan_server.failures = 1
+    dialect = CkanDialect(dataset="dataset")
+    storage = CkanStorage(ckan_server.url, dialect=dialect)
+    with pytest.raises(ValueError):
+        storage.write_resource(Resource(name="table", data=[["id"], [1], [2]]))
+    assert ckan_server.count("datastore_upsert") == 1
+
+
+# Fixtures
+
+
+@pytest.fixture
+def ckan_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CkanHandler)
+    server.url = "http://127.0.0.1:%s" % server.server_port
+    server.resources = {}
+    server.requests = []
+    server.failures = 0
+    server.failing = "datastore_upsert"
+    server.active = {"now": 0, "max": 0}
+    server.lock = threading.Lock()
+    server.count = lambda name: [path for path, _ in server.requests].count(name)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+# Helpers
+
+
+class RefusingSession(requests.Session):
+    """Session sending first upserts to a closed port"""
+
+    def __init__(self, *, refusals):
+        super().__init__()
+        self.refusals = refusals
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.closed_url = "http://127.0.0.1:%s/" % sock.getsockname()[1]
+
+    def request(self, method, url, **options):
+        if url.endswith("datastore_upsert") and self.refusals:
+            self.refusals -= 1
+            url = self.closed_url
+        return super().request(method, url, **options)
+
+
+class CkanHandler(BaseHTTPRequestHandler):
+    """Stub of the CKAN datastore API serving pages of 100 records"""
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.respond(url.path.split("/")[-1], dict(parse_qsl(url.query)))
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        self.respond(url.path.split("/")[-1], json.loads(self.rfile.read(length)))
+
+    def respond(self, action, params):
+        server = self.server
+        with server.lock:
+            server.requests.append((action, params))
+            if action == server.failing and server.failures:
+                server.failures -= 1
+                self.send_response(503)
+                self.end_headers()
+                self.wfile.write(b"<html>Service Unavailable</html>")
+                return
+        result = getattr(self, action)(params)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        body = {"success": True, "result": result}
+        self.wfile.write(json.dumps(body).encode("utf-8"))
+
+    def package_show(self, params):
+        resources = self.server.resources
+        return {
+            "resources": [{"id": id, "name": r["name"]} for id, r in resources.items()]
+        }
+
+    def datastore_search(self, params):
+        resource = self.server.resources[params["resource_id"]]
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 100))
+        records = resource["records"][offset : offset + limit]
+        link = dict(params, offset=offset + limit)
+        return {
+            "resource_id": params["resource_id"],
+            "fields": [{"id": "_id", "type": "int"}] + resource["fields"],
+            "records": records,
+            "limit": limit,
+            "_links": {"next": "/api/3/action/datastore_search?" + urlencode(link)},
+        }
+
+    def datastore_create(self, params):
+        id = str(len(self.server.resources))
+        name = params["resource"]["name"]
+        self.server.resources[id] = {"name": name, "fields": params["fields"]}
+        self.server.resources[id]["records"] = []
+        return {"resource_id": id}
+
+    def datastore_upsert(self, params):
+        active = self.server.active
+        with self.server.lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.05)
+        with self.server.lock:
+            active["now"] -= 1
+            self.server.resources[params["resource_id"]]["records"] += params["records"]
+        return {}
+
+    def resource_delete(self, params):
+        del self.server.resources[params["id"]]
+        return {}
+
+    def log_message(self, *args):
+        pass
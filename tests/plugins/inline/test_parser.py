@@ -1,5 +1,6 @@
+import pytest
 from collections import OrderedDict
-from frictionless import Resource
+from frictionless import Resource, FrictionlessException
 from frictionless.plugins.inline import InlineDialect
 
 
@@ -91,6 +92,27 @@ def test_inline_parser_from_ordered_dict():
         assert rows[1].cells == ["中国人", "2"]
 
 
+def test_inline_parser_keyed_missing_keys():
+    source = [{"id": index, "name": "name"} for index in range(1500)]
+    source[1200] = {"id": 1200}
+    with Resource(source) as resource:
+        lists = resource.read_lists()
+        assert len(lists) == 1501
+        assert lists[1201] == [1200, None]
+        assert lists[1202] == [1201, "name"]
+
+
+def test_inline_parser_keyed_not_dict():
+    source = [{"id": index} for index in range(1500)]
+    source[1200] = [1200]
+    resource = Resource(source)
+    with pytest.raises(FrictionlessException) as excinfo:
+        resource.read_rows()
+    error = excinfo.value.error
+    assert error.code == "source-error"
+    assert error.note == "unsupported inline data"
+
+
 def test_inline_parser_write(tmpdir):
     source = Resource("data/table.csv")
     target = source.write(format="inline")
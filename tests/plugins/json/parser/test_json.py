@@ -1,6 +1,8 @@
 import json
+import ijson
 import pytest
-from frictionless import Resource
+from decimal import Decimal
+from frictionless import Resource, FrictionlessException
 from frictionless.plugins.json import JsonDialect
 
 
@@ -61,6 +63,37 @@ def test_json_parser_from_buffer_keyed():
         ]
 
 
+def test_json_parser_large_keyed():
+    data = [{"id": index, "value": index / 2} for index in range(2500)]
+    source = json.dumps(data).encode("utf-8")
+    with Resource(source, format="json") as resource:
+        assert resource.header == ["id", "value"]
+        lists = resource.read_lists()
+        assert lists[1:] == [[index, index / 2] for index in range(2500)]
+
+
+def test_json_parser_python_backend(monkeypatch):
+    monkeypatch.setattr(ijson, "backend", "python")
+    data = [{"id": index, "value": index / 2, "note": "a, ]"} for index in range(2500)]
+    source = json.dumps(data, indent=2).encode("utf-8")
+    with Resource(source, format="json") as resource:
+        lists = resource.read_lists()
+        assert lists[0] == ["id", "value", "note"]
+        assert lists[1:] == [[index, index / 2, "a, ]"] for index in range(2500)]
+        assert lists[2][1] == Decimal("0.5")
+
+
+def test_json_parser_python_backend_invalid(monkeypatch):
+    monkeypatch.setattr(ijson, "backend", "python")
+    source = '[["id", "name"], [1, "english"] [2, "中国人"]]'.encode("utf-8")
+    resource = Resource(source, format="json")
+    with pytest.raises(FrictionlessException) as excinfo:
+        resource.read_rows()
+    error = excinfo.value.error
+    assert error.code == "source-error"
+    assert error.note == "Expecting ',' delimiter"
+
+
 @pytest.mark.vcr
 def test_json_parser_from_remote():
     with Resource(path=BASEURL % "data/table.json") as resource:
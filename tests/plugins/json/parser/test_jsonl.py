@@ -1,5 +1,7 @@
-from frictionless import Resource
+import pytest
+from frictionless import Resource, FrictionlessException
 from frictionless.plugins.json import JsonDialect
+from frictionless.plugins.json.parser import jsonl as module
 
 
 BASEURL = "https://raw.githubusercontent.com/frictionlessdata/frictionless-py/master/%s"
@@ -26,6 +28,44 @@ def test_jsonl_parser_ndjson():
         ]
 
 
+def test_jsonl_parser_large():
+    lines = ['{"id": %s, "name": "name%s"}' % (index, index) for index in range(2500)]
+    source = "\n".join(lines).encode("utf-8")
+    with Resource(source, format="jsonl") as resource:
+        assert resource.header == ["id", "name"]
+        lists = resource.read_lists()
+        assert len(lists) == 2501
+        assert lists[-1] == [2499, "name2499"]
+
+
+def test_jsonl_parser_invalid_line():
+    lines = ['{"id": %s}' % index for index in range(1500)]
+    lines.insert(1200, '{"id": 1200} {"id": 1201}')
+    source = "\n".join(lines).encode("utf-8")
+    resource = Resource(source, format="jsonl")
+    with pytest.raises(FrictionlessException) as excinfo:
+        resource.read_rows()
+    error = excinfo.value.error
+    assert error.code == "source-error"
+    assert error.note.count("line contains invalid json")
+
+
+def test_jsonl_parser_without_orjson(monkeypatch):
+    def import_module(name):
+        raise ImportError(name)
+
+    monkeypatch.setattr(module, "import_module", import_module)
+    lines = ['{"id": %s, "name": "name%s"}' % (index, index) for index in range(1500)]
+    lines.insert(1200, '{"id": 1200} {"id": 1201}')
+    source = "\n".join(lines[:1200]).encode("utf-8")
+    with Resource(source, format="jsonl") as resource:
+        assert resource.read_lists()[-1] == [1199, "name1199"]
+    resource = Resource("\n".join(lines).encode("utf-8"), format="jsonl")
+    with pytest.raises(FrictionlessException) as excinfo:
+        resource.read_rows()
+    assert excinfo.value.error.note.count("line contains invalid json")
+
+
 def test_jsonl_parser_write(tmpdir):
     source = Resource("data/table.csv")
     target = source.write(str(tmpdir.join("table.jsonl")))
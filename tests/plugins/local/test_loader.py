@@ -1,4 +1,6 @@
 from frictionless import Resource
+from frictionless.plugins.local import LocalControl
+from frictionless.plugins.local.loader import MappedByteStream
 from importlib import import_module
 
 
@@ -22,3 +24,31 @@ def test_local_loader_pathlib_path():
             {"id": 1, "name": "english"},
             {"id": 2, "name": "中国人"},
         ]
+
+
+def test_local_loader_mmap():
+    control = LocalControl(mmap=True)
+    with Resource("data/table.csv", control=control) as resource:
+        assert isinstance(resource.byte_stream, MappedByteStream)
+        assert resource.stats["hash"] == "6c2c61dd9b0e9c6876139a449ed87933"
+        assert resource.stats["bytes"] == 30
+        assert resource.header == ["id", "name"]
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+
+
+def test_local_loader_mmap_validate():
+    report = Resource("data/invalid.csv", control={"mmap": True}).validate()
+    assert report.flatten(["rowPosition", "fieldPosition", "code"]) == Resource(
+        "data/invalid.csv"
+    ).validate().flatten(["rowPosition", "fieldPosition", "code"])
+
+
+def test_local_loader_mmap_empty_file(tmpdir):
+    path = str(tmpdir.join("empty.csv"))
+    open(path, "w").close()
+    with Resource(path, control={"mmap": True}) as resource:
+        assert not isinstance(resource.byte_stream, MappedByteStream)
+        assert resource.read_rows() == []
@@ -3,6 +3,8 @@ import json
 import pytest
 from frictionless import Resource, validate, helpers
 from frictionless import FrictionlessException
+from frictionless.plugins.multipart.loader import MultipartByteStream, skip_first_line
+from frictionless.plugins.multipart import settings
 
 
 IS_UNIX = not helpers.is_platform("windows")
@@ -144,6 +146,67 @@ def test_multipart_loader_resource_validate():
     assert report.task.resource.stats["rows"] == 2
 
 
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_multipart_loader_prefetch(tmpdir, prefetch):
+    paths = []
+    for number in range(1, 8):
+        paths.append(f"table{number}.csv")
+        tmpdir.join(paths[-1]).write(f"id,name\n{number},name{number}\n")
+    descriptor = {"path": paths, "control": {"prefetch": prefetch}}
+    with Resource(descriptor, basepath=str(tmpdir)) as resource:
+        assert resource.header == ["id", "name"]
+        assert resource.read_rows() == [
+            {"id": number, "name": f"name{number}"} for number in range(1, 8)
+        ]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_multipart_byte_stream(tmpdir, prefetch):
+    parts = [b"id\r\n1\r\n", b"id\r\n2\r\n", b"id\r3\r", b"id\n4\n"]
+    for number, bytes in enumerate(parts, start=1):
+        tmpdir.join(f"table{number}.csv").write_binary(bytes)
+    path = [str(tmpdir.join(f"table{number}.csv")) for number in range(1, 5)]
+    options = dict(remote=False, headless=False, prefetch=prefetch, replay_size=4)
+    with MultipartByteStream(path, **options) as byte_stream:
+        assert byte_stream.read(3) == b"id\r"
+        assert byte_stream.seek(0) == 0
+        assert byte_stream.read() == b"id\r\n1\r\n2\r\n3\r4\n"
+        assert byte_stream.seek(2) == 2
+        assert byte_stream.read(4) == b"\r\n1\r"
+        assert byte_stream.tell() == 6
+
+
+def test_multipart_byte_stream_headless(tmpdir):
+    tmpdir.join("table1.csv").write_binary(b"1\n")
+    tmpdir.join("table2.csv").write_binary(b"2\n")
+    path = [str(tmpdir.join("table1.csv")), str(tmpdir.join("table2.csv"))]
+    with MultipartByteStream(path, remote=False, headless=True) as byte_stream:
+        assert byte_stream.read() == b"1\n2\n"
+
+
+def test_multipart_byte_stream_iter(tmpdir, monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_BLOCK_SIZE", 3)
+    tmpdir.join("table1.csv").write_binary(b"id,name\n1,english\n")
+    tmpdir.join("table2.csv").write_binary(b"id,name\n2,german")
+    path = [str(tmpdir.join("table1.csv")), str(tmpdir.join("table2.csv"))]
+    with MultipartByteStream(path, remote=False, headless=False) as byte_stream:
+        assert list(byte_stream) == [b"id,name\n", b"1,english\n", b"2,german"]
+
+
+@pytest.mark.parametrize(
+    "blocks, result",
+    [
+        ([b"id\r\n1"], b"1"),
+        ([b"i", b"d\r", b"\n1", b"\n"], b"1\n"),
+        ([b"id\r", b"1\r"], b"1\r"),
+        ([b"id\r"], b""),
+        ([b"id"], b""),
+    ],
+)
+def test_multipart_skip_first_line(blocks, result):
+    assert b"".join(skip_first_line(blocks)) == result
+
+
 # We're better implement here a round-robin testing including
 # reading using Resource as we do for other tests
 def test_multipart_loader_resource_write_file(tmpdir):
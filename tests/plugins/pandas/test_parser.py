@@ -260,3 +260,50 @@ def test_pandas_parser_from_dataframe_with_primary_key_having_datetime():
                 "VIXOpen": Decimal("17.66"),
             },
         ]
+
+
+def test_pandas_parser_read_missing_values():
+    df = pd.DataFrame(
+        {
+            "integer": pd.array([1, None, 3], dtype="Int64"),
+            "number": [1.5, float("nan"), 3.5],
+            "string": ["a", None, "c"],
+        }
+    )
+    with Resource(df) as resource:
+        assert resource.read_rows() == [
+            {"integer": 1, "number": Decimal("1.5"), "string": "a"},
+            {"integer": None, "number": None, "string": None},
+            {"integer": 3, "number": Decimal("3.5"), "string": "c"},
+        ]
+
+
+def test_pandas_parser_write_dtypes():
+    source = Resource(
+        [
+            ["integer", "number", "boolean", "datetime"],
+            ["1", "1.5", "true", "2020-01-01T15:00:00"],
+            ["", "", "", "2020-01-02T15:00:00"],
+        ]
+    )
+    target = source.write(format="pandas")
+    assert target.data.dtypes.astype(str).to_dict() == {
+        "integer": "Int64",
+        "number": "float64",
+        "boolean": "boolean",
+        "datetime": "datetime64[ns]",
+    }
+    assert target.read_rows() == [
+        {
+            "integer": 1,
+            "number": Decimal("1.5"),
+            "boolean": True,
+            "datetime": datetime.datetime(2020, 1, 1, 15),
+        },
+        {
+            "integer": None,
+            "number": None,
+            "boolean": None,
+            "datetime": datetime.datetime(2020, 1, 2, 15),
+        },
+    ]
@@ -0,0 +1,190 @@
+import pytest
+import isodate
+import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+from decimal import Decimal
+from frictionless import Package, Resource, Layout, Schema, Field, validate
+from frictionless import FrictionlessException
+from frictionless.plugins.parquet import ParquetDialect
+
+
+# General
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow", "feather"])
+def test_parquet_parser_write(tmpdir, format):
+    source = Resource("data/table.csv")
+    target = source.write(str(tmpdir.join(f"table.{format}")))
+    with target:
+        assert target.format == format
+        assert target.header == ["id", "name"]
+        assert target.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_parquet_parser_write_types(tmpdir, format):
+    source = Package("data/storage/types.json").get_resource("types")
+    target = source.write(str(tmpdir.join(f"table.{format}")))
+    with target:
+
+        # Assert schema
+        assert target.schema == source.schema
+
+        # Assert rows
+        assert target.read_rows() == [
+            {
+                "any": "中国人",
+                "array": ["Mike", "John"],
+                "boolean": True,
+                "date": datetime.date(2015, 1, 1),
+                "date_year": datetime.date(2015, 1, 1),
+                "datetime": datetime.datetime(2015, 1, 1, 3, 0),
+                "duration": isodate.parse_duration("P1Y1M"),
+                "geojson": {"type": "Point", "coordinates": [33, 33.33]},
+                "geopoint": (30, 70),
+                "integer": 1,
+                "number": Decimal("7.0"),
+                "object": {"chars": 560},
+                "string": "english",
+                "time": datetime.time(3, 0),
+                "year": 2015,
+                "yearmonth": (2015, 1),
+            },
+        ]
+
+
+def test_parquet_parser_read_arrow_types(tmpdir):
+    path = str(tmpdir.join("table.parquet"))
+    table = pa.table(
+        {
+            "integer": pa.array([1, None], pa.int32()),
+            "number": pa.array([1.5, 2.5], pa.float64()),
+            "boolean": pa.array([True, False]),
+            "string": pa.array(["a", "b"]).dictionary_encode(),
+            "date": pa.array([datetime.date(2020, 1, 1), None]),
+            "datetime": pa.array([datetime.datetime(2020, 1, 1, 15), None]),
+            "array": pa.array([[1, 2], []]),
+        }
+    )
+    pq.write_table(table, path)
+    with Resource(path) as resource:
+        assert resource.schema == {
+            "fields": [
+                {"name": "integer", "type": "integer"},
+                {"name": "number", "type": "number"},
+                {"name": "boolean", "type": "boolean"},
+                {"name": "string", "type": "string"},
+                {"name": "date", "type": "date"},
+                {"name": "datetime", "type": "datetime"},
+                {"name": "array", "type": "array"},
+            ]
+        }
+        assert resource.read_rows() == [
+            {
+                "integer": 1,
+                "number": Decimal("1.5"),
+                "boolean": True,
+                "string": "a",
+                "date": datetime.date(2020, 1, 1),
+                "datetime": datetime.datetime(2020, 1, 1, 15),
+                "array": [1, 2],
+            },
+            {
+                "integer": None,
+                "number": Decimal("2.5"),
+                "boolean": False,
+                "string": "b",
+                "date": None,
+                "datetime": None,
+                "array": [],
+            },
+        ]
+
+
+def test_parquet_parser_read_invalid_file():
+    resource = Resource("data/table.csv", format="parquet")
+    with pytest.raises(FrictionlessException) as excinfo:
+        resource.open()
+    error = excinfo.value.error
+    assert error.code == "format-error"
+    assert error.note.count("invalid parquet file")
+
+
+# Layout
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_parquet_parser_read_pick_fields(tmpdir, format):
+    source = Resource("data/table.csv")
+    target = source.write(str(tmpdir.join(f"table.{format}")))
+    target = Resource(target.path, layout=Layout(pick_fields=["name"]))
+    with target:
+        assert target.header == ["name"]
+        assert target.schema == {"fields": [{"name": "name", "type": "string"}]}
+        assert target.read_rows() == [{"name": "english"}, {"name": "中国人"}]
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_parquet_parser_read_pick_rows(tmpdir, format):
+    path = str(tmpdir.join(f"table.{format}"))
+    source = Resource(
+        [["name", "id"], ["a1", 1], ["a2", 2], ["b1", 3], ["b2", 4], ["c1", 5]]
+    )
+    source.write(path, dialect=ParquetDialect(row_group_size=2))
+    with Resource(path, layout=Layout(pick_rows=["name", "b", "c"])) as target:
+        assert target.read_rows() == [
+            {"name": "b1", "id": 3},
+            {"name": "b2", "id": 4},
+            {"name": "c1", "id": 5},
+        ]
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_parquet_parser_read_pick_rows_row_positions(tmpdir, format):
+    data = [["name", "value"], ["a1", "1"], ["a2", "x"], ["b1", "y"], ["a3", "2"]]
+    data += [["b2", "3"], [None, "4"], ["b3", "z"]]
+    schema = Schema(
+        fields=[Field(name="name", type="string"), Field(name="value", type="integer")]
+    )
+    layout = {"pickRows": ["name", "b"]}
+    Resource(data).write(str(tmpdir.join("table.csv")))
+    Resource(data).write(
+        str(tmpdir.join(f"table.{format}")), dialect=ParquetDialect(row_group_size=2)
+    )
+    report = validate(str(tmpdir.join("table.csv")), schema=schema, layout=layout)
+    report_pushdown = validate(
+        str(tmpdir.join(f"table.{format}")), schema=schema, layout=layout
+    )
+    assert report_pushdown.flatten(["rowPosition", "code"]) == [
+        [4, "type-error"],
+        [8, "type-error"],
+    ]
+    assert report_pushdown.flatten(["rowPosition", "rowNumber", "code"]) == (
+        report.flatten(["rowPosition", "rowNumber", "code"])
+    )
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_parquet_parser_read_limit_rows(tmpdir, format):
+    path = str(tmpdir.join(f"table.{format}"))
+    source = Resource([["id"], [1], [2], [3]])
+    source.write(path)
+    with Resource(path, layout=Layout(limit_rows=1, offset_rows=1)) as target:
+        assert target.read_rows() == [{"id": 2}]
+
+
+# Dialect
+
+
+def test_parquet_parser_write_row_group_size(tmpdir):
+    path = str(tmpdir.join("table.parquet"))
+    source = Resource([["id"], [1], [2], [3], [4], [5]])
+    source.write(path, dialect=ParquetDialect(row_group_size=2, compression="zstd"))
+    file = pq.ParquetFile(path)
+    assert file.num_row_groups == 3
+    assert file.metadata.row_group(0).column(0).compression == "ZSTD"
+    assert Resource(path).read_rows() == [{"id": id} for id in range(1, 6)]
@@ -1,5 +1,11 @@
+import io
+import os
 import pytest
-from frictionless import Resource, Layout
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from frictionless import Resource, Layout, system
+from frictionless.plugins.remote import RemoteControl
+from frictionless.plugins.remote.loader import RemoteByteStream
 
 
 BASEURL = "https://raw.githubusercontent.com/frictionlessdata/frictionless-py/master/%s"
@@ -48,3 +54,151 @@ def test_remote_loader_write(requests_mock):
     source = Resource("data/table.csv")
     target = source.write(path)
     assert target
+
+
+# Stream
+
+
+def test_remote_loader_single_request(http_server):
+    with Resource(http_server.url("data/table.csv")) as resource:
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+        assert resource.stats["bytes"] == 30
+    assert http_server.requests == [("/data/table.csv", None)]
+
+
+def test_remote_loader_read_ahead(http_server):
+    control = RemoteControl(http_read_ahead=2)
+    path = http_server.url("data/table.csv")
+    with Resource(path, control=control) as resource:
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+    assert http_server.requests == [("/data/table.csv", None)]
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_remote_byte_stream_replay(http_server, read_ahead):
+    content = create_content(http_server)
+    byte_stream = create_byte_stream(http_server, read_ahead=read_ahead)
+    assert byte_stream.read(1000) == content[:1000]
+    assert byte_stream.seek(10) == 10
+    assert byte_stream.read(2000) == content[10:2010]
+    assert byte_stream.read() == content[2010:]
+    assert http_server.requests == [("/big.bin", None)]
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_remote_byte_stream_range_requests(http_server, read_ahead):
+    content = create_content(http_server)
+    byte_stream = create_byte_stream(http_server, read_ahead=read_ahead)
+    assert byte_stream.read(10) == content[:10]
+    assert byte_stream.ranges is True
+    assert byte_stream.length == len(content)
+    byte_stream.seek(-100, io.SEEK_END)
+    assert byte_stream.read() == content[-100:]
+    byte_stream.seek(20000)
+    assert byte_stream.read(10) == content[20000:20010]
+    byte_stream.seek(0)
+    assert byte_stream.read(10) == content[:10]
+    byte_stream.close()
+    assert http_server.requests == [
+        ("/big.bin", None),
+        ("/big.bin", f"bytes={len(content) - 100}-"),
+        ("/big.bin", "bytes=20000-"),
+        ("/big.bin", None),
+    ]
+
+
+def test_remote_byte_stream_without_range_requests(http_server):
+    http_server.ranges = False
+    content = create_content(http_server)
+    byte_stream = create_byte_stream(http_server)
+    assert byte_stream.read(10) == content[:10]
+    assert byte_stream.ranges is False
+    byte_stream.seek(20000)
+    assert byte_stream.read(10) == content[20000:20010]
+    byte_stream.seek(15000)
+    assert byte_stream.read(10) == content[15000:15010]
+    byte_stream.close()
+    assert http_server.requests == [("/big.bin", None), ("/big.bin", None)]
+
+
+def test_remote_byte_stream_close_stalled_server(http_server):
+    http_server.stalled = threading.Event()
+    content = create_content(http_server)
+    byte_stream = create_byte_stream(http_server, read_ahead=2)
+    assert byte_stream.read(10) == content[:10]
+    timer = threading.Timer(5, http_server.stalled.set)
+    timer.start()
+    byte_stream.close()
+    assert not http_server.stalled.is_set()
+    http_server.stalled.set()
+    timer.cancel()
+
+
+# Fixtures
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), HttpHandler)
+    server.ranges = True
+    server.requests = []
+    server.url = lambda path: "http://127.0.0.1:%s/%s" % (server.server_port, path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+# Helpers
+
+
+class HttpHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get("Range")))
+        content = getattr(self.server, "content", None)
+        if self.path != "/big.bin" or content is None:
+            return super().do_GET()
+        start = 0
+        range = self.headers.get("Range")
+        if range and self.server.ranges:
+            start = int(range[len("bytes=") : -1])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-/{len(content)}")
+        else:
+            self.send_response(200)
+            if self.server.ranges:
+                self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(content) - start))
+        self.end_headers()
+        stalled = getattr(self.server, "stalled", None)
+        if stalled:
+            self.wfile.write(content[start:-1000])
+            self.wfile.flush()
+            stalled.wait()
+            start = len(content) - 1000
+        self.wfile.write(content[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+def create_content(http_server):
+    http_server.content = os.urandom(100000)
+    return http_server.content
+
+
+def create_byte_stream(http_server, *, read_ahead=0):
+    return RemoteByteStream(
+        http_server.url("big.bin"),
+        session=system.get_http_session(),
+        timeout=10,
+        replay_size=5000,
+        read_ahead=read_ahead,
+    ).open()
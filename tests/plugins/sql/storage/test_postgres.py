@@ -3,6 +3,7 @@ import datetime
 import sqlalchemy as sa
 from frictionless import Package, Resource
 from frictionless.plugins.sql import SqlDialect, SqlStorage
+from frictionless.plugins.sql.storage import CopyTextStream
 
 
 # General
@@ -230,3 +231,53 @@ def test_sql_storage_postgresql_comment_support(postgresql_url):
             {"id": 1, "name": "english"},
             {"id": 2, "name": "中国人"},
         ]
+
+
+def test_sql_storage_postgresql_write_batch_size(postgresql_url):
+    data = [["id", "name"]] + [[index, f"name{index}"] for index in range(5)]
+    dialect = SqlDialect(prefix="prefix_", batch_size=2)
+    storage = SqlStorage(postgresql_url, dialect=dialect)
+    storage.write_resource(Resource(name="table", data=data))
+    assert storage.read_resource("table").read_lists() == data
+    storage.delete_resource("table")
+
+
+def test_sql_storage_postgresql_copy_text_stream():
+    cell_stream = iter(
+        [
+            [1, "english", True, None],
+            [2, "tab\tnew\nline\\", False, {"key": [1]}],
+            [3, "中国人", None, datetime.date(2015, 1, 1)],
+        ]
+    )
+    text_stream = CopyTextStream(cell_stream, batch_size=2)
+    chunks = []
+    while True:
+        chunk = text_stream.read(8)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    assert max(map(len, chunks)) == 8
+    assert "".join(chunks) == (
+        "1\tenglish\tt\t\\N\n"
+        '2\ttab\\tnew\\nline\\\\\tf\t{"key": [1]}\n'
+        "3\t中国人\t\\N\t2015-01-01\n"
+    )
+
+
+def test_sql_storage_postgresql_workers(postgresql_url):
+    dialect = SqlDialect(prefix="prefix_", workers=2)
+    source = Package("data/storage/integrity.json")
+    storage = source.to_sql(postgresql_url, dialect=dialect)
+    target = Package.from_sql(postgresql_url, dialect=dialect)
+    assert target.get_resource("integrity_link").schema.foreign_keys == [
+        {
+            "fields": ["main_id"],
+            "reference": {"resource": "integrity_main", "fields": ["id"]},
+        }
+    ]
+    assert target.get_resource("integrity_link").read_rows() == [
+        {"main_id": 1, "some_id": 1, "description": "note1"},
+        {"main_id": 2, "some_id": 2, "description": "note2"},
+    ]
+    storage.delete_package(target.resource_names)
@@ -2,7 +2,9 @@ import pytest
 import datetime
 import sqlalchemy as sa
 from frictionless import Package, Resource, FrictionlessException
+from concurrent.futures import ThreadPoolExecutor
 from frictionless.plugins.sql import SqlDialect, SqlStorage
+from frictionless.plugins.sql.storage import create_dependency_levels
 
 
 # General
@@ -258,6 +260,103 @@ def test_sql_storage_sqlite_package_url_argument(sqlite_url):
     ]
 
 
+def test_sql_storage_sqlite_write_batch_size(sqlite_url):
+    calls = []
+    engine = sa.create_engine(sqlite_url)
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, params, context, executemany):
+        if statement.startswith("INSERT"):
+            calls.append(len(params) if executemany else 1)
+
+    data = [["id", "name"]] + [[index, f"name{index}"] for index in range(5)]
+    dialect = SqlDialect(batch_size=2)
+    storage = SqlStorage(engine, dialect=dialect)
+    storage.write_resource(Resource(name="table", data=data))
+    assert calls == [2, 2, 1]
+    assert storage.read_resource("table").read_lists() == data
+
+
+def test_sql_storage_sqlite_read_fetch_size(sqlite_url):
+    data = [["id", "name"]] + [[index, f"name{index}"] for index in range(5)]
+    storage = SqlStorage(sqlite_url, dialect=SqlDialect(fetch_size=2))
+    storage.write_resource(Resource(name="table", data=data))
+    assert storage.read_resource("table").read_lists() == data
+    assert SqlDialect().fetch_size == 1000
+
+
+@pytest.mark.parametrize("primary_key", [["id"], ["group", "id"]])
+def test_sql_storage_sqlite_read_keyset_pagination(sqlite_url, monkeypatch, primary_key):
+    statements = []
+    engine = sa.create_engine(sqlite_url)
+    data = [["group", "id"]] + [[index % 2, index] for index in range(5)]
+    schema = {
+        "fields": [
+            {"name": "group", "type": "integer"},
+            {"name": "id", "type": "integer"},
+        ],
+        "primaryKey": primary_key,
+    }
+    storage = SqlStorage(engine, dialect=SqlDialect(fetch_size=2))
+    storage.write_resource(Resource(name="table", data=data, schema=schema))
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    # Emulate a driver without server-side cursors buffering results
+    monkeypatch.setattr(engine.dialect, "name", "other")
+    rows = storage.read_resource("table").read_lists()
+    assert rows[0] == ["group", "id"]
+    assert sorted(rows[1:]) == sorted(data[1:])
+    assert len(statements) == 3
+
+
+def test_sql_storage_sqlite_workers(sqlite_url):
+    dialect = SqlDialect(prefix="prefix_", workers=2)
+    source = Package("data/storage/integrity.json")
+    storage = source.to_sql(sqlite_url, dialect=dialect)
+    target = Package.from_sql(sqlite_url, dialect=dialect)
+    assert target.resource_names == ["integrity_main", "integrity_link"]
+    assert target.get_resource("integrity_link").schema.foreign_keys == [
+        {
+            "fields": ["main_id"],
+            "reference": {"resource": "integrity_main", "fields": ["id"]},
+        }
+    ]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        read_rows = lambda name: storage.read_resource(name).read_rows()
+        main, link = executor.map(read_rows, target.resource_names)
+    assert main == [
+        {"id": 1, "parent": None, "description": "english"},
+        {"id": 2, "parent": 1, "description": "中国人"},
+    ]
+    assert link == [
+        {"main_id": 1, "some_id": 1, "description": "note1"},
+        {"main_id": 2, "some_id": 2, "description": "note2"},
+    ]
+    storage.delete_package(target.resource_names)
+
+
+def test_sql_storage_create_dependency_levels():
+    package = Package(
+        resources=[
+            Resource(name="link", schema=create_schema("main", "other")),
+            Resource(name="main", schema=create_schema("", "extra")),
+            Resource(name="other", schema=create_schema()),
+            Resource(name="cycle1", schema=create_schema("cycle2")),
+            Resource(name="cycle2", schema=create_schema("cycle1")),
+        ]
+    )
+    levels = create_dependency_levels(package.resources)
+    assert [[resource.name for resource in level] for level in levels] == [
+        ["main", "other"],
+        ["link"],
+        ["cycle1", "cycle2"],
+    ]
+
+
 def test_sql_storage_sqlite_integer_enum_issue_776(sqlite_url):
     dialect = SqlDialect(table="table")
     source = Resource(path="data/table.csv")
@@ -278,3 +377,14 @@ def test_sql_storage_dialect_basepath_issue_964(sqlite_url):
             {"id": 2, "name": "bar"},
             {"id": 3, "name": "baz"},
         ]
+
+
+# Helpers
+
+
+def create_schema(*references):
+    schema = {"fields": [{"name": "id", "type": "integer"}], "foreignKeys": []}
+    for reference in references:
+        ref = {"resource": reference, "fields": ["id"]}
+        schema["foreignKeys"].append({"fields": ["id"], "reference": ref})
+    return schema
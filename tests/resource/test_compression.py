@@ -1,5 +1,9 @@
 import sys
+import bz2
+import lzma
+import types
 import pytest
+import zipfile
 from frictionless import Resource, FrictionlessException, helpers
 
 
@@ -65,6 +69,85 @@ def test_resource_compression_local_csv_gz():
         ]
 
 
+def test_resource_compression_local_csv_bz2(tmpdir):
+    path = str(tmpdir.join("table.csv.bz2"))
+    with open(path, "wb") as file:
+        file.write(
+            bz2.compress(b"id,name\n1,english\n2,\xe4\xb8\xad\xe5\x9b\xbd\xe4\xba\xba\n")
+        )
+    with Resource(path) as resource:
+        assert resource.innerpath == ""
+        assert resource.compression == "bz2"
+        assert resource.header == ["id", "name"]
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+
+
+def test_resource_compression_local_csv_xz(tmpdir):
+    path = str(tmpdir.join("table.csv.xz"))
+    with open(path, "wb") as file:
+        file.write(
+            lzma.compress(b"id,name\n1,english\n2,\xe4\xb8\xad\xe5\x9b\xbd\xe4\xba\xba\n")
+        )
+    with Resource(path) as resource:
+        assert resource.innerpath == ""
+        assert resource.compression == "xz"
+        assert resource.header == ["id", "name"]
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+
+
+def test_resource_compression_local_csv_zst(tmpdir):
+    zstandard = pytest.importorskip("zstandard")
+    path = str(tmpdir.join("table.csv.zst"))
+    with open(path, "wb") as file:
+        compressor = zstandard.ZstdCompressor()
+        file.write(compressor.compress(b"id,name\n1,english\n2,german\n"))
+    with Resource(path) as resource:
+        assert resource.compression == "zst"
+        assert resource.header == ["id", "name"]
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "german"},
+        ]
+
+
+def test_resource_compression_local_csv_bz2_concatenated_streams(tmpdir):
+    path = str(tmpdir.join("table.csv.bz2"))
+    with open(path, "wb") as file:
+        file.write(bz2.compress(b"id,name\n1,english\n"))
+        file.write(bz2.compress(b"2,german\n"))
+    with Resource(path) as resource:
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "german"},
+        ]
+
+
+def test_resource_compression_local_csv_zip_data_descriptor(tmpdir):
+    path = str(tmpdir.join("table.csv.zip"))
+    text = "id,name\n" + "".join(f"{number},name{number}\n" for number in range(10000))
+    with open(path, "wb") as file:
+        # Unseekable target makes zipfile write data descriptors
+        target = types.SimpleNamespace(write=file.write, flush=file.flush)
+        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as archive:
+            with archive.open("first.csv", "w") as member:
+                member.write(b"id,name\n1,english\n")
+            with archive.open("second.csv", "w") as member:
+                member.write(text.encode("utf-8"))
+    assert zipfile.ZipFile(path).infolist()[1].flag_bits & 0x8
+    with Resource(path, innerpath="second.csv") as resource:
+        assert resource.innerpath == "second.csv"
+        assert resource.header == ["id", "name"]
+        rows = resource.read_rows()
+        assert len(rows) == 10000
+        assert rows[-1] == {"id": 9999, "name": "name9999"}
+
+
 def test_resource_compression_stream_csv_zip():
     with open("data/table.csv.zip", "rb") as file:
         with Resource(file, format="csv", compression="zip") as resource:
@@ -137,6 +220,26 @@ def test_resource_compression_error_invalid_gz():
     assert error.note == "Not a gzipped file (b'id')"
 
 
+def test_resource_compression_error_invalid_bz2():
+    source = b"id,filename\n1,archive"
+    resource = Resource(source, format="csv", compression="bz2")
+    with pytest.raises(FrictionlessException) as excinfo:
+        resource.open()
+    error = excinfo.value.error
+    assert error.code == "compression-error"
+    assert error.note == "Invalid data stream"
+
+
+def test_resource_compression_error_truncated_xz():
+    source = lzma.compress(b"id,name\n1,english\n")[:-10]
+    resource = Resource(source, format="csv", compression="xz")
+    with pytest.raises(FrictionlessException) as excinfo:
+        resource.open()
+    error = excinfo.value.error
+    assert error.code == "compression-error"
+    assert error.note == "compressed file ended before the end-of-stream marker"
+
+
 def test_resource_compression_legacy_no_value_issue_616():
     with pytest.warns(UserWarning):
         with Resource("data/table.csv", compression="no") as resource:
@@ -1,7 +1,8 @@
 import pytest
-from frictionless import Resource, Schema, Field, Layout, helpers
+from frictionless import Resource, Schema, Field, Layout, Detector, helpers
 from frictionless import FrictionlessException
-from frictionless.plugins.excel import ExcelDialect
+from frictionless.plugins.excel import ExcelDialect, XlsxParser
+from frictionless.plugins.csv import CsvParser
 
 
 IS_UNIX = not helpers.is_platform("windows")
@@ -536,3 +537,52 @@ def test_resource_layout_respect_set_after_creation_issue_503():
     resource.layout = Layout(limit_rows=1)
     assert resource.read_rows() == [{"id": 1, "name": "english"}]
     assert resource.header == ["id", "name"]
+
+
+# Projection
+
+
+@pytest.mark.parametrize("supports_projection", [True, False])
+def test_resource_layout_pick_fields_projection(monkeypatch, supports_projection):
+    monkeypatch.setattr(CsvParser, "supports_projection", supports_projection)
+    detector = Detector(sample_size=2)
+    layout = Layout(pick_fields=["header1", "header3"])
+    source = b"header1,header2,header3\n1,2,3\n4,5,6\n7,8\n9,10,11,12"
+    with Resource(source, format="csv", layout=layout, detector=detector) as resource:
+        assert resource.header == ["header1", "header3"]
+        rows = resource.read_rows()
+        assert rows == [
+            {"header1": 1, "header3": 3},
+            {"header1": 4, "header3": 6},
+            {"header1": 7, "header3": None},
+            {"header1": 9, "header3": 11},
+        ]
+        assert rows[2].errors[0].code == "missing-cell"
+        assert rows[3].valid
+
+
+@pytest.mark.parametrize("pick_fields", [["header1", "header3"], ["header3"]])
+@pytest.mark.parametrize("supports_projection", [True, False])
+def test_resource_layout_pick_fields_and_rows_projection(
+    monkeypatch, pick_fields, supports_projection
+):
+    monkeypatch.setattr(CsvParser, "supports_projection", supports_projection)
+    detector = Detector(sample_size=2)
+    layout = Layout(pick_fields=pick_fields, skip_rows=["x"])
+    source = b"header1,header2,header3\n1,2,3\nx,5,6\n7,8,9"
+    with Resource(source, format="csv", layout=layout, detector=detector) as resource:
+        assert resource.header == pick_fields
+        assert resource.read_rows() == [
+            {name: cells[name] for name in pick_fields}
+            for cells in [{"header1": 1, "header3": 3}, {"header1": 7, "header3": 9}]
+        ]
+
+
+@pytest.mark.parametrize("supports_projection", [True, False])
+def test_resource_layout_pick_fields_projection_xlsx(monkeypatch, supports_projection):
+    monkeypatch.setattr(XlsxParser, "supports_projection", supports_projection)
+    detector = Detector(sample_size=1)
+    layout = Layout(pick_fields=["name"])
+    with Resource("data/table.xlsx", layout=layout, detector=detector) as resource:
+        assert resource.header == ["name"]
+        assert resource.read_rows() == [{"name": "english"}, {"name": "中国人"}]
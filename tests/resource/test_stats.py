@@ -1,3 +1,5 @@
+import bz2
+import hashlib
 import pytest
 from frictionless import Resource, Layout, helpers
 
@@ -86,6 +88,18 @@ def test_resource_stats_bytes_compressed():
             assert resource.stats["bytes"] == 1265
 
 
+def test_resource_stats_compressed_bz2(tmpdir):
+    path = str(tmpdir.join("table.csv.bz2"))
+    with open(path, "wb") as file:
+        file.write(bz2.compress(b"id,name\n1,english\n2,german\n"))
+    with open(path, "rb") as file:
+        bytes = file.read()
+    with Resource(path) as resource:
+        resource.read_rows()
+        assert resource.stats["hash"] == hashlib.md5(bytes).hexdigest()
+        assert resource.stats["bytes"] == len(bytes)
+
+
 @pytest.mark.vcr
 def test_resource_stats_bytes_remote():
     with Resource(BASEURL % "data/doublequote.csv") as resource:
@@ -0,0 +1,123 @@
+import pytest
+from frictionless import Resource, Schema, Check, errors, helpers, settings
+
+
+# General
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "data/table.csv",
+        "data/invalid.csv",
+        "data/capital-invalid.csv",
+        "data/unique-field.csv",
+        "data/issue-313.xlsx",
+    ],
+)
+def test_validate_engine_columnar(path):
+    report_row = Resource(path).validate()
+    report_columnar = Resource(path).validate(engine="columnar")
+    keys = ["rowPosition", "fieldPosition", "code", "note"]
+    assert report_columnar.flatten(keys) == report_row.flatten(keys)
+    assert report_columnar.task.resource.stats == report_row.task.resource.stats
+
+
+def test_validate_engine_columnar_schema():
+    source = [["id", "name"], ["1", "a"], ["x", "b"], ["1", ""], ["3", "d", "e"]]
+    schema = Schema(
+        fields=[
+            {"name": "id", "type": "integer", "constraints": {"unique": True}},
+            {"name": "name", "type": "string", "constraints": {"required": True}},
+        ]
+    )
+    resource = Resource(source, schema=schema)
+    report = resource.validate(engine="columnar")
+    assert report.flatten(["rowPosition", "fieldPosition", "code"]) == [
+        [3, 1, "type-error"],
+        [4, 2, "constraint-error"],
+        [4, 1, "unique-error"],
+        [5, 3, "extra-cell"],
+    ]
+    assert report.task.resource.stats["rows"] == 4
+
+
+def test_validate_engine_columnar_primary_key_across_batches(monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_BATCH_SIZE", 2)
+    source = [["id"], ["1"], ["2"], ["3"], ["1"], ["2"]]
+    schema = Schema(fields=[{"name": "id", "type": "integer"}], primary_key=["id"])
+    resource = Resource(source, schema=schema)
+    report = resource.validate(engine="columnar")
+    assert report.flatten(["rowPosition", "code", "note"]) == [
+        [5, "primary-key-error", "the same as in the row at position 2"],
+        [6, "primary-key-error", "the same as in the row at position 3"],
+    ]
+
+
+def test_validate_engine_columnar_limit_memory_throttled(monkeypatch):
+    calls = []
+    monkeypatch.setattr(helpers, "get_current_memory_usage", lambda: calls.append(1))
+    source = lambda: ([number] for number in range(250000))
+    schema = Schema(fields=[{"name": "id", "type": "integer"}])
+    layout = {"header": False}
+    resource = Resource(source, schema=schema, layout=layout)
+    report = resource.validate(engine="columnar", limit_memory=50)
+    assert report.valid
+    assert len(calls) == 2
+
+
+def test_validate_engine_columnar_foreign_key():
+    source = {
+        "path": "data/nested-invalid.csv",
+        "schema": {
+            "fields": [
+                {"name": "id", "type": "integer"},
+                {"name": "cat", "type": "integer"},
+                {"name": "name", "type": "string"},
+            ],
+            "foreignKeys": [
+                {"fields": "cat", "reference": {"resource": "", "fields": "id"}}
+            ],
+        },
+    }
+    resource = Resource(source)
+    report = resource.validate(engine="columnar")
+    assert report.flatten(["rowPosition", "fieldPosition", "code", "cells"]) == [
+        [6, None, "foreign-key-error", ["5", "6", "Rome"]],
+    ]
+
+
+def test_validate_engine_columnar_limit_errors():
+    resource = Resource("data/invalid.csv")
+    report = resource.validate(engine="columnar", limit_errors=3)
+    assert report.task.partial
+    assert report.flatten(["rowPosition", "fieldPosition", "code"]) == [
+        [None, 3, "blank-label"],
+        [None, 4, "duplicate-label"],
+        [2, 3, "missing-cell"],
+    ]
+
+
+def test_validate_engine_columnar_fallback_to_row_with_custom_checks():
+    def custom(row):
+        yield errors.BlankRowError(
+            note="",
+            cells=list(map(str, row.values())),
+            row_number=row.row_number,
+            row_position=row.row_position,
+        )
+
+    resource = Resource("data/table.csv")
+    report = resource.validate(engine="columnar", checks=[Check(function=custom)])
+    assert report.flatten(["rowPosition", "code"]) == [
+        [2, "blank-row"],
+        [3, "blank-row"],
+    ]
+
+
+def test_validate_engine_not_supported():
+    resource = Resource("data/table.csv")
+    report = resource.validate(engine="bad")
+    assert report.flatten(["code", "note"]) == [
+        ["task-error", 'validation engine "bad" is not supported'],
+    ]
@@ -0,0 +1,129 @@
+import pytest
+from frictionless import Resource, Schema, settings
+
+
+# General
+
+
+KEYS = ["rowPosition", "rowNumber", "fieldPosition", "code", "note", "message"]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "data/table.csv",
+        "data/invalid.csv",
+        "data/capital-invalid.csv",
+        "data/unique-field.csv",
+    ],
+)
+def test_validate_workers(path, monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_CHUNK_SIZE", 20)
+    report = Resource(path).validate()
+    report_workers = Resource(path).validate(workers=2)
+    assert report_workers.flatten(KEYS) == report.flatten(KEYS)
+    assert report_workers.task.resource.stats == report.task.resource.stats
+
+
+def test_validate_workers_dialect(monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_CHUNK_SIZE", 10)
+    report = Resource("data/dialect.csv").validate()
+    report_workers = Resource("data/dialect.csv").validate(workers=3)
+    assert report.valid
+    assert report_workers.valid
+    assert report_workers.task.resource.stats == report.task.resource.stats
+
+
+def test_validate_workers_integrity(tmpdir, monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_CHUNK_SIZE", 20)
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id,code,name\n")
+        file.write('1,a,"multi\nline ""quoted"" name"\n')
+        file.write("2,b,name\n3,a,\n")
+        file.write('1,c,"quoted, with\ndelimiter"\n')
+        file.write("x,d,name\n,,\n2,b,name\n")
+    schema = Schema(
+        fields=[
+            {"name": "id", "type": "integer"},
+            {"name": "code", "type": "string", "constraints": {"unique": True}},
+            {"name": "name", "type": "string"},
+        ],
+        primary_key=["id"],
+    )
+    checks = lambda: [
+        {"code": "duplicate-row"},
+        {"code": "deviated-value", "fieldName": "id"},
+    ]
+    report = Resource(path, schema=schema).validate(checks=checks())
+    report_workers = Resource(path, schema=schema).validate(checks=checks(), workers=2)
+    assert report_workers.flatten(KEYS) == report.flatten(KEYS)
+    assert report_workers.flatten(["rowPosition", "code"]) == [
+        [4, "unique-error"],
+        [5, "primary-key-error"],
+        [6, "type-error"],
+        [6, "primary-key-error"],
+        [7, "blank-row"],
+        [7, "primary-key-error"],
+        [8, "unique-error"],
+        [8, "primary-key-error"],
+        [8, "duplicate-row"],
+    ]
+
+
+def test_validate_workers_multipart(tmpdir, monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_CHUNK_SIZE", 20)
+    parts = ["id,name\n1,a\nx,b\n", "id,name\n2,c\n1,d\n", "id,name\n,e\n"]
+    for number, text in enumerate(parts, start=1):
+        tmpdir.join(f"table{number}.csv").write(text)
+    descriptor = {
+        "path": ["table1.csv", "table2.csv", "table3.csv"],
+        "schema": {
+            "fields": [
+                {"name": "id", "type": "integer"},
+                {"name": "name", "type": "string"},
+            ],
+            "primaryKey": ["id"],
+        },
+    }
+    report = Resource(descriptor, basepath=str(tmpdir)).validate()
+    report_workers = Resource(descriptor, basepath=str(tmpdir)).validate(workers=2)
+    assert report_workers.flatten(KEYS) == report.flatten(KEYS)
+    assert report_workers.task.resource.stats == report.task.resource.stats
+    assert report_workers.flatten(["rowPosition", "code"]) == [
+        [3, "type-error"],
+        [3, "primary-key-error"],
+        [5, "primary-key-error"],
+        [6, "primary-key-error"],
+    ]
+
+
+def test_validate_workers_multipart_not_line_terminated(tmpdir):
+    tmpdir.join("table1.csv").write("id,name\n1,a")
+    tmpdir.join("table2.csv").write("id,name\n2,b\n")
+    descriptor = {"path": ["table1.csv", "table2.csv"]}
+    report = Resource(descriptor, basepath=str(tmpdir)).validate()
+    report_workers = Resource(descriptor, basepath=str(tmpdir)).validate(workers=2)
+    assert report_workers.flatten(KEYS) == report.flatten(KEYS)
+    assert report_workers.task.resource.stats == report.task.resource.stats
+    assert report_workers.flatten(["rowPosition", "code"]) == [[2, "extra-cell"]]
+
+
+def test_validate_workers_limit_errors(monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_CHUNK_SIZE", 20)
+    report = Resource("data/invalid.csv").validate(limit_errors=3)
+    report_workers = Resource("data/invalid.csv").validate(workers=2, limit_errors=3)
+    assert report_workers.task.partial
+    assert report_workers.flatten(KEYS) == report.flatten(KEYS)
+
+
+def test_validate_workers_fallback():
+    source = [["id", "name"], ["1", "a"], ["1", "b"]]
+    schema = {"fields": [{"name": "id", "type": "integer"}], "primaryKey": ["id"]}
+    report = Resource(source, schema=schema).validate(workers=2)
+    assert report.flatten(["rowPosition", "code"]) == [
+        [None, "extra-label"],
+        [2, "extra-cell"],
+        [3, "extra-cell"],
+        [3, "primary-key-error"],
+    ]
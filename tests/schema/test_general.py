@@ -74,6 +74,16 @@ def test_schema_read_cells():
     assert cells == target
 
 
+def test_schema_create_cell_readers():
+    schema = Schema(DESCRIPTOR_MAX)
+    readers = schema.create_cell_readers()
+    source = ["string", "-", "1", "string", "null"]
+    target = ["string", None, 1, "string", None]
+    cells = [readers[name](cell)[0] for name, cell in zip(schema.field_names, source)]
+    assert list(readers) == schema.field_names
+    assert cells == target
+
+
 def test_schema_read_cells_null_values():
     schema = Schema(DESCRIPTOR_MAX)
     source = ["string", "", "-", "string", "null"]
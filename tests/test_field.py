@@ -321,6 +321,51 @@ def test_field_read_cell_multiple_constraints():
     assert read("") == (None, None)
 
 
+@pytest.mark.parametrize(
+    "descriptor",
+    [
+        DESCRIPTOR,
+        {"name": "name", "type": "string", "constraints": {"pattern": "a|b"}},
+        {"name": "name", "type": "number", "missingValues": ["", "NA"]},
+        {"name": "name", "type": "boolean", "constraints": {"enum": ["true"]}},
+        {"name": "name", "type": "array", "arrayItem": {"type": "integer"}},
+    ],
+)
+def test_field_create_cell_reader(descriptor):
+    field = Field(descriptor)
+    read_cell = field.create_cell_reader()
+    for cell in ["1", "a", "c", "-", "", "NA", "true", "false", '["1"]', 1, None]:
+        assert read_cell(cell) == field.read_cell(cell)
+
+
+def test_field_read_cells():
+    field = Field(DESCRIPTOR)
+    cells, notes = field.read_cells(["1", "string", "-", 2])
+    assert cells == [1, None, None, 2]
+    assert notes == {
+        1: {"type": 'type is "integer/default"'},
+        2: {"required": 'constraint "required" is "True"'},
+    }
+
+
+def test_field_read_cells_multiple_constraints():
+    field = Field(
+        {
+            "name": "name",
+            "type": "string",
+            "constraints": {"pattern": "a|b", "enum": ["a", "b"]},
+        }
+    )
+    cells, notes = field.read_cells(["a", "c", ""])
+    assert cells == ["a", "c", None]
+    assert notes == {
+        1: {
+            "pattern": 'constraint "pattern" is "a|b"',
+            "enum": "constraint \"enum\" is \"['a', 'b']\"",
+        }
+    }
+
+
 @pytest.mark.parametrize("example_value", [(None), (42), ("foo")])
 def test_field_with_example_set(example_value):
     field = Field({"name": "name", "type": "string", "example": example_value})
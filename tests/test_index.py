@@ -0,0 +1,149 @@
+import hashlib
+import datetime
+from decimal import Decimal
+import os
+import shutil
+from frictionless import Resource, Detector, KeyIndex, LookupCache, InferCache
+from frictionless.index import BloomFilter
+
+
+# General
+
+
+def test_key_index():
+    index = KeyIndex()
+    assert index.add(1, 2) is None
+    assert index.add(2, 3) is None
+    assert index.add(1, 4) == 2
+    assert index.add(1, 5) == 4
+    assert index.add((1, "a"), 6) is None
+    assert index.add((1, "a"), 7) == 6
+    assert index.spilled is False
+    assert len(index) == 3
+
+
+def test_key_index_equal_values():
+    index = KeyIndex()
+    assert index.add(Decimal("1.0"), 2) is None
+    assert index.add(Decimal("1"), 3) == 2
+    moment = datetime.datetime(2020, 1, 1, 12, tzinfo=datetime.timezone.utc)
+    offset = datetime.timezone(datetime.timedelta(hours=1))
+    assert index.add(moment, 4) is None
+    assert index.add(moment.astimezone(offset), 5) == 4
+    assert index.add("1", 6) is None
+
+
+def test_key_index_equal_numbers():
+    index = KeyIndex()
+    assert index.add("1", 6) is None
+    assert index.add(1, 7) is None
+    assert index.add(1.0, 8) == 7
+    assert index.add(Decimal("1.00"), 9) == 8
+    assert index.add(True, 10) == 9
+    assert index.add(0.5, 11) is None
+    assert index.add(Decimal("0.50"), 12) == 11
+    assert index.add(0.1, 13) is None
+    assert index.add(Decimal("0.1"), 14) is None
+    assert index.add((1, "a"), 15) is None
+    assert index.add((1.0, "a"), 16) == 15
+
+
+def test_key_index_spill_disabled_by_default():
+    source = [["id"]] + [[str(i)] for i in range(20)]
+    schema = {"fields": [{"name": "id", "type": "integer"}], "primaryKey": ["id"]}
+    resource = Resource(source, schema=schema)
+    assert resource.index_threshold == 0
+    assert KeyIndex().threshold is None
+
+
+def test_key_index_spill():
+    index = KeyIndex(threshold=2)
+    for position in range(2, 12):
+        assert index.add(position, position) is None
+    assert index.spilled is True
+    assert len(index) == 10
+    assert index.add(3, 12) == 3
+    assert index.add(3, 13) == 12
+    assert index.add(11, 14) == 11
+    index.close()
+    assert index.spilled is False
+
+
+def test_key_index_resource_validate_spill():
+    source = [["id", "name"]] + [[str(i % 5), "a"] for i in range(20)]
+    schema = {
+        "fields": [{"name": "id", "type": "integer"}, {"name": "name"}],
+        "primaryKey": ["id"],
+    }
+    default = Resource(source, schema=schema).validate()
+    spilled = Resource(source, schema=schema, index_threshold=2).validate()
+    assert spilled.flatten(["rowPosition", "code", "note"]) == default.flatten(
+        ["rowPosition", "code", "note"]
+    )
+    assert len(spilled.task.errors) == 15
+
+
+# Bloom Filter
+
+
+def test_bloom_filter():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    digests = [hashlib.sha256(str(i).encode()).digest() for i in range(2000)]
+    assert sum(bloom.add(digest) for digest in digests[:1000]) < 10
+    assert all(bloom.add(digest) for digest in digests[:1000])
+    assert sum(bloom.add(digest) for digest in digests[1000:1100]) < 5
+    assert bloom.size == 9586
+
+
+def test_infer_cache(tmpdir, monkeypatch):
+    path = str(tmpdir.join("table.csv"))
+    shutil.copy("data/table.csv", path)
+    cache = InferCache(path=str(tmpdir.join("cache.db")))
+    resource = Resource(path, infer_cache=cache)
+    resource.infer()
+    expected = resource.to_dict()
+    monkeypatch.setattr(Resource, "open", None)
+    resource = Resource(path, infer_cache=InferCache(path=cache.path))
+    resource.infer()
+    assert resource == expected
+    assert resource.schema.field_names == ["id", "name"]
+
+
+def test_infer_cache_source_changed(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    shutil.copy("data/table.csv", path)
+    cache = InferCache()
+    resource = Resource(path, infer_cache=cache)
+    resource.infer()
+    with open(path, "w") as file:
+        file.write("id;name;age\n1;english;10\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    resource = Resource(path, infer_cache=cache)
+    resource.infer()
+    assert resource.dialect.delimiter == ";"
+    assert resource.schema.field_names == ["id", "name", "age"]
+
+
+def test_infer_cache_detector_options(tmpdir):
+    cache = InferCache()
+    resource = Resource("data/table.csv", infer_cache=cache)
+    resource.infer()
+    detector = Detector(field_type="string")
+    resource = Resource("data/table.csv", detector=detector, infer_cache=cache)
+    resource.infer()
+    assert resource.schema.get_field("id").type == "string"
+
+
+def test_infer_cache_inline_not_cached():
+    cache = InferCache()
+    resource = Resource(data=[["id"], [1]], infer_cache=cache)
+    assert cache.create_key(resource) is None
+
+
+def test_lookup_cache_resource_reused_id():
+    cache = LookupCache()
+    for number in range(10):
+        resource = Resource([["id"], [number]], name="ids")
+        assert cache.read(resource, ["id"]) == {(number,)}
+        del resource
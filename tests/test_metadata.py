@@ -1,4 +1,7 @@
-from frictionless import Metadata
+import json
+import hashlib
+from frictionless import Metadata, Package, Resource, Schema, Field, settings
+from frictionless import metadata as module
 
 # General
 
@@ -13,6 +16,83 @@ def test_descriptor_from_path():
     assert metadata["primaryKey"] == "id"
 
 
+def test_metadata_validate_validator_cache():
+    profile = {"type": "object", "required": ["name"]}
+    assert module.create_validator(profile) is module.create_validator(profile)
+    errors = list(Metadata({}).metadata_validate(profile))
+    assert errors[0].note.startswith("\"'name' is a required property\"")
+    assert not list(Metadata({"name": "name"}).metadata_validate(profile))
+
+
+def test_metadata_validate_nested_change():
+    resource = Resource(name="table", path="data/table.csv", sources=[{"title": "t"}])
+    assert resource.metadata_valid
+    resource["sources"][0]["title"] = 1
+    assert not resource.metadata_valid
+    assert 'at "sources/0/title" in metadata' in resource.metadata_errors[0].note
+
+
+def test_metadata_read_profile_local():
+    profile = module.read_profile("data/profiles/camtrap.json")
+    assert profile["title"]
+    assert module.read_profile("data/profiles/camtrap.json") is profile
+
+
+def test_metadata_read_profile_remote_persisted(tmpdir, monkeypatch):
+    source = "https://example.com/profiles/package.json"
+    name = hashlib.md5(source.encode("utf-8")).hexdigest()
+    with open(str(tmpdir.join(f"{name}.json")), "w") as file:
+        json.dump({"type": "object", "required": ["title"]}, file)
+    monkeypatch.setattr(settings, "PROFILE_CACHE_PATH", str(tmpdir))
+    package = Package(name="name", profile=source)
+    assert len(package.metadata_errors) == 1
+    assert "'title' is a required property" in package.metadata_errors[0].note
+
+
+def test_metadata_batch_update(monkeypatch):
+    calls = []
+    process = Schema.metadata_process
+    monkeypatch.setattr(
+        Schema, "metadata_process", lambda self: calls.append(process(self))
+    )
+    schema = Schema()
+    calls.clear()
+    with schema.batch_update():
+        for number in range(2000):
+            schema.add_field(Field(name=f"field{number}", type="integer"))
+        assert schema.fields[0].schema is None
+    assert len(calls) == 1
+    assert len(schema.fields) == 2000
+    assert schema.fields[-1].schema is schema
+    assert schema.metadata_valid
+
+
+def test_metadata_batch_update_nested(monkeypatch):
+    calls = []
+    process = Schema.metadata_process
+    monkeypatch.setattr(
+        Schema, "metadata_process", lambda self: calls.append(process(self))
+    )
+    schema = Schema()
+    calls.clear()
+    with schema.batch_update():
+        schema.add_field(Field(name="id"))
+        with schema.batch_update():
+            schema.primary_key = ["id"]
+        assert not calls
+    assert len(calls) == 1
+    assert schema == {"fields": [{"name": "id"}], "primaryKey": ["id"]}
+
+
+def test_metadata_batch_update_without_changes(monkeypatch):
+    calls = []
+    schema = Schema()
+    monkeypatch.setattr(Schema, "metadata_process", lambda self: calls.append(None))
+    with schema.batch_update():
+        pass
+    assert not calls
+
+
 # Issues
 
 
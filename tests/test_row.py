@@ -1,6 +1,7 @@
 import json
+import tracemalloc
 from decimal import Decimal
-from frictionless import Resource, extract
+from frictionless import Resource, CompactRow, extract
 
 
 # General
@@ -20,6 +21,53 @@ def test_basic():
     assert row.to_dict() == {"field1": 1, "field2": 2, "field3": 3}
 
 
+def test_compact():
+    resource = Resource(data=[["field1", "field2", "field3"], ["1", "2", "3"]])
+    resource.row_type = "compact"
+    row = resource.read_rows()[0]
+    assert isinstance(row, CompactRow)
+    assert row == {"field1": 1, "field2": 2, "field3": 3}
+    assert row["field2"] == 2
+    assert row.get("bad") is None
+    assert list(row) == ["field1", "field2", "field3"]
+    assert row.field_positions == [1, 2, 3]
+    assert row.row_position == 2
+    assert row.row_number == 1
+    assert row.blank_cells == {}
+    assert row.error_cells == {}
+    assert row.errors == []
+    assert row.valid is True
+    assert row.to_list() == [1, 2, 3]
+    assert row.to_dict() == {"field1": 1, "field2": 2, "field3": 3}
+    assert row.to_str() == "1,2,3"
+
+
+def test_compact_errors():
+    source = [["id", "name"], ["1", "a"], ["x", "b", "c"], ["", ""]]
+    schema = {"fields": [{"name": "id", "type": "integer"}, {"name": "name"}]}
+    resource = Resource(source, schema=schema, row_type="compact")
+    rows = resource.read_rows()
+    assert rows[0].valid
+    assert rows[1].error_cells == {"id": "x"}
+    assert [error.code for error in rows[1].errors] == ["type-error", "extra-cell"]
+    assert rows[2].blank_cells == {"id": "", "name": ""}
+    assert [error.code for error in rows[2].errors] == ["blank-row"]
+
+
+def test_compact_memory():
+    source = [["id", "name", "score"]]
+    source.extend([str(index), f"name{index}", "1.5"] for index in range(10000))
+    sizes = {}
+    for row_type in ["row", "compact"]:
+        resource = Resource(source, row_type=row_type)
+        tracemalloc.start()
+        rows = resource.read_rows()
+        assert all(row.valid for row in rows)
+        sizes[row_type], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    assert sizes["compact"] < sizes["row"] * 0.6
+
+
 # Import/Export
 
 
@@ -29,6 +29,7 @@ def test_array_read_cell(format, source, target, options):
     field.update(options)
     cell, notes = field.read_cell(source)
     assert cell == target
+    assert field.read_cells([source])[0] == [target]
 
 
 def test_array_read_cell_array_item():
@@ -44,5 +44,6 @@ def test_date_read_cell(format, source, target, recwarn):
     field = Field({"name": "name", "type": "date", "format": format})
     cell, notes = field.read_cell(source)
     assert cell == target
+    assert field.read_cells([source])[0] == [target]
     if not format.startswith("fmt:"):
         assert recwarn.list == []
@@ -35,3 +35,4 @@ def test_duration_read_cell(format, source, target):
     field = Field({"name": "name", "type": "duration", "format": format})
     cell, notes = field.read_cell(source)
     assert cell == target
+    assert field.read_cells([source])[0] == [target]
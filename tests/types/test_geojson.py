@@ -45,3 +45,4 @@ def test_geojson_read_cell(format, source, target):
     field = Field({"name": "name", "type": "geojson", "format": format})
     cell, notes = field.read_cell(source)
     assert cell == target
+    assert field.read_cells([source])[0] == [target]
@@ -47,3 +47,4 @@ def test_geopoint_read_cell(format, source, target):
     field = Field({"name": "name", "type": "geopoint", "format": format})
     cell, notes = field.read_cell(source)
     assert cell == target
+    assert field.read_cells([source])[0] == [target]
@@ -24,3 +24,4 @@ def test_object_read_cell(format, source, target):
     field = Field({"name": "name", "type": "object", "format": format})
     cell, notes = field.read_cell(source)
     assert cell == target
+    assert field.read_cells([source])[0] == [target]
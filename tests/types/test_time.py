@@ -53,5 +53,6 @@ def test_time_read_cell(format, source, target, recwarn):
     field = Field({"name": "name", "type": "time", "format": format})
     cell, notes = field.read_cell(source)
     assert cell == target
+    assert field.read_cells([source])[0] == [target]
     if not format.startswith("fmt:"):
         assert recwarn.list == []
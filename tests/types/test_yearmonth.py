@@ -26,3 +26,4 @@ def test_yearmonth_read_cell(format, source, target):
     field = Field({"name": "name", "type": "yearmonth", "format": format})
     cell, notes = field.read_cell(source)
     assert cell == target
+    assert field.read_cells([source])[0] == [target]